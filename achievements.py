@@ -1,14 +1,18 @@
 import pygame
 from settings import *
 from sound_manager import get_sound_manager
+from sprite_loader import get_asset_cache
+from game_clock import get_ticks
 
 class Achievement:
-    def __init__(self, id, title, description, icon, condition):
+    def __init__(self, id, title, description, icon, condition, stats=()):
         self.id = id
         self.title = title
         self.description = description
         self.icon = icon
         self.condition = condition
+        # Ключи статистики, от которых зависит condition
+        self.stats = tuple(stats)
         self.unlocked = False
         self.unlock_time = None
     
@@ -30,11 +34,20 @@ class Achievement:
             sound_manager.play_achievement()
 
 class AchievementManager:
+    """
+    Достижения проверяются не каждый кадр, а когда меняется статистика:
+    ключ статистики -> еще не открытые достижения, которые от него зависят.
+    Открытое достижение из индекса убирается.
+    """
     def __init__(self):
         self.achievements = {}
         self.unlocked_achievements = []
         self.achievement_notifications = []
         
+        # Ключ статистики -> {id: достижение} (только закрытые)
+        self.dependents = {}
+        self.stats = None
+        
         self.setup_achievements()
     
     def setup_achievements(self):
@@ -45,6 +58,7 @@ class AchievementManager:
                 "title": "Первый квест",
                 "description": "Выполните свой первый квест",
                 "icon": "🎯",
+                "stats": ["completed_quests"],
                 "condition": lambda state: state.get("completed_quests", 0) >= 1
             },
             {
@@ -52,6 +66,7 @@ class AchievementManager:
                 "title": "Swift Мастер",
                 "description": "Выполните все iOS квесты",
                 "icon": "🍎",
+                "stats": ["swift_quests"],
                 "condition": lambda state: state.get("swift_quests", 0) >= 3
             },
             {
@@ -59,6 +74,7 @@ class AchievementManager:
                 "title": "AI Эксперт", 
                 "description": "Обучите 5 нейросетей",
                 "icon": "🤖",
+                "stats": ["ai_quests"],
                 "condition": lambda state: state.get("ai_quests", 0) >= 5
             },
             {
@@ -66,6 +82,7 @@ class AchievementManager:
                 "title": "TypeScript Гуру",
                 "description": "Пройдите все TypeScript тесты",
                 "icon": "📘",
+                "stats": ["typescript_quests"],
                 "condition": lambda state: state.get("typescript_quests", 0) >= 3
             },
             {
@@ -73,6 +90,7 @@ class AchievementManager:
                 "title": "Debug Мастер",
                 "description": "Найдите 10 багов в коде",
                 "icon": "🐛",
+                "stats": ["bugs_found"],
                 "condition": lambda state: state.get("bugs_found", 0) >= 10
             },
             {
@@ -80,6 +98,7 @@ class AchievementManager:
                 "title": "Магнит пользователей",
                 "description": "Привлеките 5000 пользователей",
                 "icon": "👥",
+                "stats": ["users"],
                 "condition": lambda state: state.get("users", 0) >= 5000
             },
             {
@@ -87,6 +106,7 @@ class AchievementManager:
                 "title": "Охотник за квестами",
                 "description": "Выполните 10 квестов",
                 "icon": "🗺️",
+                "stats": ["completed_quests"],
                 "condition": lambda state: state.get("completed_quests", 0) >= 10
             },
             {
@@ -94,6 +114,7 @@ class AchievementManager:
                 "title": "Спидраннер",
                 "description": "Выполните квест менее чем за 5 секунд",
                 "icon": "⚡",
+                "stats": ["fastest_quest_time"],
                 "condition": lambda state: state.get("fastest_quest_time", 999) < 5
             },
             {
@@ -101,6 +122,7 @@ class AchievementManager:
                 "title": "Перфекционист",
                 "description": "Выполните квест без ошибок",
                 "icon": "💎",
+                "stats": ["perfect_quests"],
                 "condition": lambda state: state.get("perfect_quests", 0) >= 1
             },
             {
@@ -108,6 +130,7 @@ class AchievementManager:
                 "title": "Друг менторов",
                 "description": "Поговорите со всеми менторами",
                 "icon": "🤝",
+                "stats": ["mentors_met"],
                 "condition": lambda state: state.get("mentors_met", 0) >= 8
             }
         ]
@@ -118,28 +141,57 @@ class AchievementManager:
                 data["title"], 
                 data["description"],
                 data["icon"],
-                data["condition"]
+                data["condition"],
+                data["stats"]
             )
-            self.achievements[data["id"]] = achievement
+            self.add_achievement(achievement)
+    
+    def add_achievement(self, achievement):
+        """Зарегистрировать достижение в индексе по ключам статистики"""
+        self.achievements[achievement.id] = achievement
+        if not achievement.unlocked:
+            for key in achievement.stats:
+                self.dependents.setdefault(key, {})[achievement.id] = achievement
+    
+    def set_unlocked(self, achievement_id, unlocked):
+        """Отметить достижение открытым/закрытым без уведомления (загрузка сохранения)"""
+        achievement = self.achievements[achievement_id]
+        achievement.unlocked = unlocked
+        for key in achievement.stats:
+            if unlocked:
+                self.dependents.get(key, {}).pop(achievement_id, None)
+            else:
+                self.dependents.setdefault(key, {})[achievement_id] = achievement
     
-    def update(self, game_state):
-        """Update achievements and check for unlocks"""
-        for achievement in self.achievements.values():
-            if achievement.check_condition(game_state):
+    def attach(self, stats):
+        """Следить за статистикой (StatsStore) и проверить ее текущее состояние"""
+        self.stats = stats
+        stats.subscribe(self.on_stats_changed)
+        self.on_stats_changed(list(self.dependents))
+    
+    def on_stats_changed(self, changed_keys):
+        """Проверить только достижения, зависящие от изменившихся ключей"""
+        candidates = {}
+        for key in changed_keys:
+            candidates.update(self.dependents.get(key, ()))
+        
+        for achievement in candidates.values():
+            if achievement.check_condition(self.stats):
+                self.set_unlocked(achievement.id, True)
                 self.add_notification(achievement)
     
     def add_notification(self, achievement):
         """Add achievement notification"""
         notification = {
             "achievement": achievement,
-            "start_time": pygame.time.get_ticks(),
+            "start_time": get_ticks(),
             "duration": 3000  # 3 seconds
         }
         self.achievement_notifications.append(notification)
     
     def draw_notifications(self, screen):
-        """Draw achievement notifications"""
-        current_time = pygame.time.get_ticks()
+        """Draw achievement notifications. Returns the screen areas they cover"""
+        current_time = get_ticks()
         
         # Remove expired notifications
         self.achievement_notifications = [
@@ -148,13 +200,13 @@ class AchievementManager:
         ]
         
         # Draw active notifications
-        for i, notification in enumerate(self.achievement_notifications):
-            self.draw_notification(screen, notification, i)
+        return [self.draw_notification(screen, notification, i)
+                for i, notification in enumerate(self.achievement_notifications)]
     
     def draw_notification(self, screen, notification, index):
         """Draw a single achievement notification"""
         achievement = notification["achievement"]
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         elapsed = current_time - notification["start_time"]
         progress = elapsed / notification["duration"]
         
@@ -177,22 +229,25 @@ class AchievementManager:
         notification_surface.fill((0, 0, 0, 200))
         pygame.draw.rect(notification_surface, (255, 255, 0), (0, 0, 300, 60), 2)
         
-        screen.blit(notification_surface, (x, y))
+        area = screen.blit(notification_surface, (x, y))
+        
+        asset_cache = get_asset_cache()
         
         # Icon
-        font_large = pygame.font.Font(None, 36)
+        font_large = asset_cache.get_font(None, 36)
         icon_surface = font_large.render(achievement.icon, True, (255, 255, 0))
-        screen.blit(icon_surface, (x + 10, y + 10))
+        area.union_ip(screen.blit(icon_surface, (x + 10, y + 10)))
         
         # Title
-        font_medium = pygame.font.Font(None, 24)
+        font_medium = asset_cache.get_font(None, 24)
         title_surface = font_medium.render(achievement.title, True, (255, 255, 255))
-        screen.blit(title_surface, (x + 50, y + 10))
+        area.union_ip(screen.blit(title_surface, (x + 50, y + 10)))
         
         # Description
-        font_small = pygame.font.Font(None, 18)
+        font_small = asset_cache.get_font(None, 18)
         desc_surface = font_small.render(achievement.description, True, (200, 200, 200))
-        screen.blit(desc_surface, (x + 50, y + 35))
+        area.union_ip(screen.blit(desc_surface, (x + 50, y + 35)))
+        return area
     
     def get_achievement_stats(self, game_state):
         """Get achievement statistics"""
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Запеченные производные картинки: то, что игра раньше масштабировала при каждом
+запуске (фоны комнат менторов под 1280x720, спрайт ментора 120x120, спрайт
+босса, карта с пределом 2000px). Результат лежит в data/baked/ под ключом
+из хэша содержимого исходника, операции и размера; в игре читается готовый
+файл, а масштабирование на лету - только если запеченного варианта еще нет.
+Запечь все заранее (например, перед сборкой exe):
+
+    python asset_bake.py
+"""
+
+import os
+import json
+import time
+import hashlib
+import pygame
+from settings import *
+from sprite_loader import get_asset_cache
+
+BAKE_VERSION = 2
+
+def scale_image(source, size, alpha):
+    return pygame.transform.scale(source, size)
+
+def cover_image(source, size, alpha):
+    """Заполнить size целиком с сохранением пропорций, лишнее обрезать по краям"""
+    width, height = size
+    source_w, source_h = source.get_size()
+    scale = max(width / source_w, height / source_h)
+    new_w, new_h = int(source_w * scale), int(source_h * scale)
+    scaled = pygame.transform.scale(source, (new_w, new_h))
+    surface = pygame.Surface(size, pygame.SRCALPHA) if alpha else pygame.Surface(size)
+    surface.blit(scaled, ((width - new_w) // 2, (height - new_h) // 2))
+    return surface
+
+def fit_image(source, size, alpha):
+    """Уменьшить, чтобы влезть в size (с сохранением пропорций); меньшие картинки - как есть"""
+    source_w, source_h = source.get_size()
+    if source_w <= size[0] and source_h <= size[1]:
+        return source
+    scale = min(size[0] / source_w, size[1] / source_h)
+    return pygame.transform.scale(source, (int(source_w * scale), int(source_h * scale)))
+
+BAKE_OPERATIONS = {
+    "scale": scale_image,
+    "cover": cover_image,
+    "fit": fit_image
+}
+
+class AssetBaker:
+    """
+    Кэш производных картинок на диске.
+    Ключ - sha1 содержимого исходника + операция + размер + alpha, поэтому переименование
+    или touch файла ничего не пересчитывает, а новое содержимое дает новый ключ.
+    Хэш исходника запоминается в manifest.json вместе с mtime и размером -
+    при неизменном файле он не читается вовсе.
+    Формат - несжатый BMP (с альфой): фон 1280x720 читается ~15 мс против ~150 мс
+    у PNG, что медленнее, чем декодировать исходный JPEG и масштабировать заново.
+    """
+    def __init__(self, directory=BAKE_PATH):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.sources = {}  # путь -> [mtime_ns, размер, sha1]
+        self.manifest_dirty = False
+        
+        # Статистика
+        self.hits = 0
+        self.misses = 0
+        
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == BAKE_VERSION:
+                self.sources = manifest.get("sources", {})
+        except (OSError, ValueError):
+            pass
+    
+    def source_hash(self, path):
+        """sha1 содержимого файла (пересчитывается, только если поменялись mtime или размер)"""
+        stat = os.stat(path)
+        entry = self.sources.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        self.sources[path] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+        self.manifest_dirty = True
+        return digest.hexdigest()
+    
+    def baked_path(self, path, operation, size, alpha=True):
+        """Путь к запеченному варианту (файла может еще не быть)"""
+        key = f"{BAKE_VERSION}|{self.source_hash(path)}|{operation}|{size[0]}x{size[1]}|{int(alpha)}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.directory, f"{stem}_{operation}_{size[0]}x{size[1]}_{digest}.bmp")
+    
+    def resolve(self, path, operation, size, alpha=True):
+        """Запеченный файл, если он уже есть, иначе None"""
+        if not os.path.exists(path):
+            return None
+        baked = self.baked_path(path, operation, size, alpha)
+        self.save_manifest()
+        return baked if os.path.exists(baked) else None
+    
+    def get_image(self, path, operation, size, alpha=True):
+        """
+        Производная картинка: готовый файл из кэша или, если его нет,
+        операция над исходником (и запись результата на будущее). None - нет исходника
+        """
+        if not os.path.exists(path):
+            return None
+        size = tuple(size)
+        asset_cache = get_asset_cache()
+        
+        def load_or_bake():
+            baked = self.baked_path(path, operation, size, alpha)
+            self.save_manifest()
+            if os.path.exists(baked):
+                image = asset_cache.load_image(baked, alpha)
+                if image is not None:
+                    self.hits += 1
+                    return image
+            
+            self.misses += 1
+            source = asset_cache.load_image(path, alpha)
+            if source is None:
+                return None
+            image = BAKE_OPERATIONS[operation](source, size, alpha)
+            self.save_image(image, baked)
+            return image
+        
+        # Один вариант (общий фон у нескольких менторов) держится в памяти один раз
+        return asset_cache.lookup(("baked", path, size, operation, alpha), load_or_bake)
+    
+    def save_image(self, image, baked):
+        """Записать через временный файл (оборванная запись не оставит битую картинку)"""
+        temp_path = baked[:-len(".bmp")] + ".tmp.bmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            pygame.image.save(image, temp_path)
+            os.replace(temp_path, baked)
+        except (OSError, pygame.error) as e:
+            print(f"⚠️ Не удалось запечь {baked}: {e}")
+    
+    def save_manifest(self):
+        if not self.manifest_dirty:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.manifest_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"version": BAKE_VERSION, "sources": self.sources}, f, ensure_ascii=False)
+            os.replace(self.manifest_path + ".tmp", self.manifest_path)
+            self.manifest_dirty = False
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить manifest запекания: {e}")
+    
+    def get_stats(self):
+        return {"hits": self.hits, "misses": self.misses, "sources": len(self.sources)}
+
+# Производные картинки игры: (исходник, операция, размер, alpha).
+# STARTUP_RECIPES нужны уже при создании Game - их заранее декодирует startup.AssetPreloader.
+# Менторы и фоны их комнат - из settings.MENTORS (общий фон - один рецепт)
+STARTUP_RECIPES = [
+    (os.path.join(MENTORS_PATH, "main_boss.jpg"), "scale", (80, 80), False)
+] + [
+    (os.path.join(MENTORS_PATH, f"{name}.png"), "scale", (120, 120), True) for name in MENTORS
+] + [
+    (os.path.join(LOCATIONS_PATH, name), "cover", (SCREEN_WIDTH, SCREEN_HEIGHT), False)
+    for name in dict.fromkeys(background for specialty, background in MENTORS.values())
+]
+# Запасные фоны (galletcity.png для комнат, Fortuna (Full Map).png для карты) заранее
+# не запекаются: их исходников в поставке нет, а появятся - запекутся при первом обращении
+BAKE_RECIPES = STARTUP_RECIPES
+
+# Глобальный кэш запеченных картинок
+asset_baker = None
+
+def get_asset_baker():
+    """Получить кэш запеченных картинок"""
+    global asset_baker
+    if asset_baker is None:
+        asset_baker = AssetBaker()
+    return asset_baker
+
+def main():
+    # Без окна: convert() нужен дисплей
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    
+    baker = get_asset_baker()
+    started = time.perf_counter()
+    for path, operation, size, alpha in BAKE_RECIPES:
+        if baker.get_image(path, operation, size, alpha) is None:
+            print(f"⚠️ Нет исходника: {path}")
+    stats = baker.get_stats()
+    print(f"💾 {BAKE_PATH}: {len(BAKE_RECIPES)} картинок, запечено заново {stats['misses']}, "
+          f"уже были {stats['hits']} ({(time.perf_counter() - started) * 1000:.0f} мс)")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Текстурные атласы для мелких спрайтов: кадры героя (mc/), персонажи
+Modern Interiors, лица менторов, иконки и кнопки data/sprites, тайлы комнат.
+Все уже масштабированные картинки упакованы в несколько больших страниц
+(data/atlas/atlas_N.png) с индексом регионов (atlas.json); в игре страница
+грузится один раз, а Atlas.get(name) отдает subsurface.
+Атлас пересобирается сам, если исходники поменялись; вручную:
+
+    python atlas.py
+"""
+
+import os
+import json
+import time
+import pygame
+from settings import *
+from asset_bake import get_asset_baker
+
+ATLAS_VERSION = 2
+ATLAS_PAGE_SIZE = 1024
+ATLAS_PADDING = 1  # пиксель прозрачности между регионами (без протекания при масштабировании)
+
+MC_PATH = "mc/"
+CHARACTERS_PATH = "Modern_Interiors_Free_v2.2/Modern tiles_Free/Characters_free/"
+INTERIORS_PATH = "Modern_Interiors_Free_v2.2/Modern tiles_Free/Interiors_free/32x32/"
+SPRITES_PATH = "data/sprites/"
+
+ATLAS_CHARACTERS = ["Adam", "Alex", "Amelia", "Bob"]
+ATLAS_MENTORS = list(MENTORS)
+ATLAS_MENTOR_SIZES = [64, 80]  # на карте (NPC) и в диалогах/журнале
+# Тайлы, из которых SpriteLoader собирает комнаты менторов: лист -> (x, y) в тайлах 32x32
+ATLAS_TILES = {
+    "interiors": ("Interiors_free_32x32.png", [(0, 0), (1, 0), (2, 0), (3, 0)]),
+    "room_builder": ("Room_Builder_free_32x32.png", [(0, 0), (1, 0)])
+}
+
+def list_pngs(directory, recursive=False):
+    """PNG в папке (отсортированы), пути относительно directory"""
+    found = []
+    if not os.path.isdir(directory):
+        return found
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if file.lower().endswith(".png"):
+                found.append(os.path.relpath(os.path.join(root, file), directory))
+        if not recursive:
+            break
+    return found
+
+def atlas_source_files():
+    """Все файлы, из которых собирается атлас (для проверки устаревания)"""
+    files = []
+    for direction in ["up", "down", "left", "right"]:
+        files += [os.path.join(MC_PATH, direction, name) for name in list_pngs(os.path.join(MC_PATH, direction))]
+    for char in ATLAS_CHARACTERS:
+        files += [os.path.join(CHARACTERS_PATH, f"{char}_idle_16x16.png"),
+                  os.path.join(CHARACTERS_PATH, f"{char}_run_16x16.png")]
+    files += [os.path.join(MENTORS_PATH, f"{name}.png") for name in ATLAS_MENTORS]
+    files += [os.path.join(INTERIORS_PATH, sheet) for sheet, tiles in ATLAS_TILES.values()]
+    files += [os.path.join(SPRITES_PATH, name) for name in list_pngs(SPRITES_PATH, recursive=True)]
+    return [path for path in files if os.path.exists(path)]
+
+def load_source(path):
+    image = pygame.image.load(path)
+    return image.convert_alpha() if pygame.display.get_surface() is not None else image
+
+def collect_atlas_images():
+    """
+    Картинки для атласа: имя -> поверхность в том виде, в каком ее использует игра
+    (16x16 персонажи уже увеличены до 32x32, лица менторов - до 64 и 80).
+    """
+    images = {}
+    
+    # Главный герой: кадры ходьбы по направлениям
+    for direction in ["up", "down", "left", "right"]:
+        folder = os.path.join(MC_PATH, direction)
+        for index, name in enumerate(list_pngs(folder)):
+            images[f"mc/{direction}/{index}"] = pygame.transform.scale(load_source(os.path.join(folder, name)), (32, 32))
+    
+    # Персонажи: idle и 4 кадра бега
+    for char in ATLAS_CHARACTERS:
+        idle_path = os.path.join(CHARACTERS_PATH, f"{char}_idle_16x16.png")
+        if os.path.exists(idle_path):
+            images[f"characters/{char.lower()}_idle"] = pygame.transform.scale(load_source(idle_path), (32, 32))
+        run_path = os.path.join(CHARACTERS_PATH, f"{char}_run_16x16.png")
+        if os.path.exists(run_path):
+            sheet = load_source(run_path)
+            for index in range(4):
+                frame = sheet.subsurface((index * 16, 0, 16, 16))
+                images[f"characters/{char.lower()}_walk/{index}"] = pygame.transform.scale(frame, (32, 32))
+    
+    # Лица менторов в нужных размерах
+    for name in ATLAS_MENTORS:
+        path = os.path.join(MENTORS_PATH, f"{name}.png")
+        if os.path.exists(path):
+            face = load_source(path)
+            for size in ATLAS_MENTOR_SIZES:
+                images[f"mentors/{name}/{size}"] = pygame.transform.scale(face, (size, size))
+    
+    # Тайлы комнат менторов
+    for sheet_name, (file, tiles) in ATLAS_TILES.items():
+        path = os.path.join(INTERIORS_PATH, file)
+        if os.path.exists(path):
+            sheet = load_source(path)
+            for x, y in tiles:
+                images[f"tiles/{sheet_name}/{x}_{y}"] = sheet.subsurface((x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)).copy()
+    
+    # Иконки, кнопки и прочие мелкие спрайты как есть
+    for name in list_pngs(SPRITES_PATH, recursive=True):
+        key = "sprites/" + os.path.splitext(name)[0].replace(os.sep, "/")
+        images[key] = load_source(os.path.join(SPRITES_PATH, name))
+    
+    return images
+
+def pack_regions(sizes, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+    """
+    Упаковка полками: сначала самые высокие, слева направо, новая полка - когда не влезает,
+    новая страница - когда кончилась высота. sizes: имя -> (w, h). Возвращает имя -> (страница, x, y, w, h)
+    """
+    regions = {}
+    page = 0
+    x = y = shelf_height = 0
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if width + padding > page_size or height + padding > page_size:
+            raise ValueError(f"{name} ({width}x{height}) не помещается на страницу атласа {page_size}x{page_size}")
+        if x + width + padding > page_size:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        if y + height + padding > page_size:
+            page += 1
+            x = y = shelf_height = 0
+        regions[name] = (page, x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height + padding)
+    return regions
+
+class Atlas:
+    """Страницы атласа и регионы по именам; subsurface создается один раз на имя"""
+    def __init__(self, pages, regions):
+        self.pages = pages
+        self.regions = regions
+        self.surfaces = {}
+    
+    def get(self, name):
+        """Регион по имени (subsurface страницы) или None"""
+        surface = self.surfaces.get(name)
+        if surface is None:
+            region = self.regions.get(name)
+            if region is None:
+                return None
+            page, x, y, width, height = region
+            surface = self.surfaces[name] = self.pages[page].subsurface((x, y, width, height))
+        return surface
+    
+    def frames(self, prefix):
+        """Кадры prefix/0, prefix/1, ... по порядку"""
+        frames = []
+        while f"{prefix}/{len(frames)}" in self.regions:
+            frames.append(self.get(f"{prefix}/{len(frames)}"))
+        return frames
+    
+    def names(self, prefix=""):
+        return [name for name in self.regions if name.startswith(prefix)]
+    
+    def get_memory_bytes(self):
+        return sum(page.get_pitch() * page.get_height() for page in self.pages)
+
+def build_atlas(page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+    """Собрать атлас из исходников (в памяти)"""
+    images = collect_atlas_images()
+    regions = pack_regions({name: image.get_size() for name, image in images.items()}, page_size, padding)
+    
+    # Страница обрезается по высоте занятых полок (обычно последняя заполнена не целиком)
+    heights = {}
+    for page, x, y, width, height in regions.values():
+        heights[page] = max(heights.get(page, 0), y + height + padding)
+    pages = []
+    for index in range(len(heights)):
+        page = pygame.Surface((page_size, heights[index]), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        pages.append(page)
+    for name, (page, x, y, width, height) in regions.items():
+        # Сложение с прозрачным нулем - точная копия пикселей вместе с альфой (без смешивания)
+        pages[page].blit(images[name], (x, y), special_flags=pygame.BLEND_RGBA_ADD)
+    return Atlas(pages, regions)
+
+def source_stamps(files):
+    """Хэши содержимого исходников: touch или свежий clone не заставляют пересобирать атлас"""
+    baker = get_asset_baker()
+    stamps = {path: baker.source_hash(path) for path in files}
+    baker.save_manifest()
+    return stamps
+
+def save_atlas(atlas, directory=ATLAS_PATH):
+    """Записать страницы и индекс (индекс последним: без него атлас не считается готовым)"""
+    os.makedirs(directory, exist_ok=True)
+    page_files = []
+    for index, page in enumerate(atlas.pages):
+        file = f"atlas_{index}.png"
+        pygame.image.save(page, os.path.join(directory, file))
+        page_files.append(file)
+    
+    index_path = os.path.join(directory, "atlas.json")
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({
+            "version": ATLAS_VERSION,
+            "pages": page_files,
+            "regions": atlas.regions,
+            "sources": source_stamps(atlas_source_files())
+        }, f, ensure_ascii=False)
+    os.replace(index_path + ".tmp", index_path)
+
+def read_atlas(directory=ATLAS_PATH):
+    """Загрузить готовый атлас; None - нет, другая версия или исходники поменялись"""
+    try:
+        with open(os.path.join(directory, "atlas.json"), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != ATLAS_VERSION:
+            return None
+        if index.get("sources") != source_stamps(atlas_source_files()):
+            return None
+        pages = [load_source(os.path.join(directory, file)) for file in index["pages"]]
+    except (OSError, ValueError, KeyError, pygame.error):
+        return None
+    return Atlas(pages, {name: tuple(region) for name, region in index["regions"].items()})
+
+def load_atlas(directory=ATLAS_PATH):
+    """Атлас с диска, а если его нет или он устарел - собрать и сохранить"""
+    started = time.perf_counter()
+    atlas = read_atlas(directory)
+    if atlas is not None:
+        print(f"🗺️ Атлас: {len(atlas.regions)} спрайтов на {len(atlas.pages)} стр. ({(time.perf_counter() - started) * 1000:.0f} мс)")
+        return atlas
+    
+    atlas = build_atlas()
+    try:
+        save_atlas(atlas, directory)
+    except (OSError, pygame.error) as e:
+        print(f"⚠️ Не удалось сохранить атлас: {e}")
+    print(f"🗺️ Атлас собран: {len(atlas.regions)} спрайтов на {len(atlas.pages)} стр. ({(time.perf_counter() - started) * 1000:.0f} мс)")
+    return atlas
+
+def main():
+    # Сборка без окна: convert_alpha() нужен дисплей
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    
+    started = time.perf_counter()
+    atlas = build_atlas()
+    save_atlas(atlas)
+    used = sum(width * height for page, x, y, width, height in atlas.regions.values())
+    total = sum(page.get_width() * page.get_height() for page in atlas.pages)
+    sizes = ", ".join(f"{page.get_width()}x{page.get_height()}" for page in atlas.pages)
+    print(f"💾 {ATLAS_PATH}: {len(atlas.regions)} спрайтов, {len(atlas.pages)} стр. ({sizes}), "
+          f"заполнено {used / total * 100 if total else 0:.0f}% ({(time.perf_counter() - started) * 1000:.0f} мс)")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+nQuester: Incubator Rush - frame-time benchmarks
+Каждая крупная сцена запускается без окна и рисует N кадров:
+p50/p95/p99 времени кадра и выделения памяти Python на кадр.
+
+    python benchmarks.py --save data/benchmark_baseline.json
+    python benchmarks.py --compare data/benchmark_baseline.json --threshold 0.2
+    python benchmarks.py --scene map_exploration --scene minigame:ts_quiz
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import platform
+import tempfile
+import argparse
+import tracemalloc
+
+# Без окна и звука (до импорта pygame)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+from simulation import BotKeys
+
+BASELINE_VERSION = 1
+
+def percentile(values, fraction):
+    """Перцентиль по ближайшему рангу (values отсортированы)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))
+    return values[index]
+
+class BenchmarkEnvironment:
+    """Одна игра на все сцены: сцена настраивает ее состояние и возвращает функцию кадра"""
+    def __init__(self):
+        import main
+        from game_clock import get_game_clock
+        
+        self.main = main
+        # Автосейвы бенчмарка не должны затирать настоящие сохранения (папка удаляется в close)
+        self.save_dir = tempfile.TemporaryDirectory(prefix="nquester_bench_")
+        self.game = main.Game(save_dir=self.save_dir.name)
+        self.clock = get_game_clock()
+        self.keys = BotKeys()
+        pygame.key.get_pressed = self.keys.get_pressed
+    
+    def close(self):
+        """Дописать сохранения и удалить временную папку"""
+        self.game.save_system.flush()
+        self.save_dir.cleanup()
+    
+    def reset(self):
+        """Вернуть игру к исследованию карты"""
+        game = self.game
+        while game.scenes.active:
+            game.scenes.top().finish(None)
+            game.scenes.pop_finished()
+        game.ui.end_dialogue()
+        game.ui.journal_open = False
+        game.mentor_location_manager.exit_location()
+        game.in_mentor_location = False
+        game.state = self.main.EXPLORATION
+        game.current_npc = None
+        self.keys.release()
+    
+    def step_and_draw(self):
+        """Один кадр игры: шаг симуляции, интерполяция и Game.draw (на dummy-дисплей)"""
+        game = self.game
+        self.clock.add_frame_time(self.clock.step)
+        game.handle_events()
+        while self.clock.consume_step():
+            game.update(self.clock.step)
+        game.interpolate(self.clock.alpha)
+        game.draw()
+
+def scene_map_exploration(env):
+    """Главная карта: игрок ходит туда-обратно, камера едет (Level.draw)"""
+    game = env.game
+    game.player.position.update(1200, 900)
+    game.player.rect.center = game.player.position
+    frames = [0]
+    
+    def frame():
+        # 2 секунды вправо, 2 секунды влево
+        direction = pygame.K_RIGHT if (frames[0] // (SIMULATION_HZ * 2)) % 2 == 0 else pygame.K_LEFT
+        env.keys.hold([direction])
+        frames[0] += 1
+        env.step_and_draw()
+    return frame
+
+def scene_mentor_room(env):
+    """Комната ментора (MentorLocation.draw), игрок ходит по комнате"""
+    game = env.game
+    mentor_name = next(iter(game.mentor_location_manager.locations))
+    game.mentor_location_manager.enter_location(mentor_name)
+    game.in_mentor_location = True
+    frames = [0]
+    
+    def frame():
+        direction = pygame.K_DOWN if (frames[0] // SIMULATION_HZ) % 2 == 0 else pygame.K_UP
+        env.keys.hold([direction])
+        frames[0] += 1
+        env.step_and_draw()
+    return frame
+
+def scene_journal_open(env):
+    """Открытый журнал квестов поверх карты"""
+    env.game.ui.journal_open = True
+    return env.step_and_draw
+
+def scene_dialogue_typing(env):
+    """Диалог с печатающимся текстом; когда строка допечатана - начинаем заново"""
+    game = env.game
+    lines = ["Привет! Это длинная реплика ментора, чтобы печатная машинка работала "
+             "несколько секунд и переносила текст на несколько строк. " * 2]
+    
+    def start():
+        game.ui.start_dialogue(lines, "Alikhan")
+        game.state = env.main.DIALOGUE
+    
+    start()
+    
+    def frame():
+        if not game.ui.typing_active:
+            start()
+        env.step_and_draw()
+    return frame
+
+# Параметры мини-игр, которые запускаются типом квеста, а не minigame_id
+QUEST_MINIGAME_PARAMS = {
+    "clicker": {"clicks_needed": 50, "time_limit": 30},
+    "rhythm": {"beats_needed": 20, "time_limit": 30},
+    "color_picker": {"colors_needed": 5, "time_limit": 60},
+}
+
+def make_minigame_scene(minigame_id):
+    def scene_minigame(env):
+        """Мини-игра из реестра без ввода: таймеры, анимации, отрисовка. Закончилась - заново"""
+        game = env.game
+        params = QUEST_MINIGAME_PARAMS.get(minigame_id, {})
+        
+        def start():
+            minigame = game.minigame_manager.create(minigame_id, **params)
+            game.scenes.push(env.main.MinigameScene(minigame))
+        
+        start()
+        
+        def frame():
+            if not game.scenes.active:
+                start()
+            env.step_and_draw()
+        return frame
+    return scene_minigame
+
+def scene_boss_battle(env):
+    """Битва с боссом (BossBattle.draw_battle_screen)"""
+    game = env.game
+    
+    def start():
+        game.run_boss_battle(lambda result: None)
+    
+    start()
+    
+    def frame():
+        if not game.scenes.active:
+            start()
+        env.step_and_draw()
+    return frame
+
+def scene_main_menu(env):
+    """Главное меню с GIF-фоном и частицами"""
+    from main_menu import MainMenu
+    screen = env.game.screen
+    menu = MainMenu(screen)
+    menu.enter()
+    
+    def frame():
+        env.clock.add_frame_time(env.clock.step)
+        while env.clock.consume_step():
+            menu.update(env.clock.step)
+        menu.draw(screen)
+        pygame.display.flip()
+    return frame
+
+def get_scenes():
+    """Все сцены бенчмарка: (имя, фабрика)"""
+    from minigames import available_minigames
+    
+    scenes = [
+        ("map_exploration", scene_map_exploration),
+        ("mentor_room", scene_mentor_room),
+        ("journal_open", scene_journal_open),
+        ("dialogue_typing", scene_dialogue_typing),
+    ]
+    scenes += [(f"minigame:{minigame_id}", make_minigame_scene(minigame_id))
+               for minigame_id in available_minigames()]
+    scenes += [
+        ("boss_battle", scene_boss_battle),
+        ("main_menu", scene_main_menu),
+    ]
+    return scenes
+
+def measure_scene(env, factory, frames, repeat=3, warmup=10, alloc_frames=60):
+    """
+    Прогнать сцену repeat раз: warmup кадров без замера, frames кадров по времени.
+    Итог каждой метрики - медиана по прогонам (один шумный прогон не решает).
+    В последнем прогоне еще alloc_frames кадров под tracemalloc
+    (он замедляет кадр, поэтому отдельно от времени).
+    """
+    rounds = []
+    for _ in range(repeat):
+        env.reset()
+        random.seed(1)
+        frame = factory(env)
+        
+        for _ in range(warmup):
+            frame()
+        
+        times = []
+        for _ in range(frames):
+            started = time.perf_counter()
+            frame()
+            times.append((time.perf_counter() - started) * 1000)
+        times.sort()
+        rounds.append({
+            "mean_ms": sum(times) / len(times),
+            "p50_ms": percentile(times, 0.50),
+            "p95_ms": percentile(times, 0.95),
+            "p99_ms": percentile(times, 0.99),
+            "max_ms": times[-1]
+        })
+    
+    # Пик выделенной за кадр памяти Python и сколько блоков кадр оставил после себя
+    alloc_bytes = []
+    alloc_blocks = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(frames, alloc_frames)):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            blocks = sys.getallocatedblocks()
+            frame()
+            _, peak = tracemalloc.get_traced_memory()
+            alloc_bytes.append(peak - current)
+            alloc_blocks.append(sys.getallocatedblocks() - blocks)
+    finally:
+        tracemalloc.stop()
+    env.reset()
+    
+    result = {"frames": frames, "repeat": repeat}
+    for metric in rounds[0]:
+        result[metric] = sorted(values[metric] for values in rounds)[len(rounds) // 2]
+    result["alloc_kb_per_frame"] = sum(alloc_bytes) / len(alloc_bytes) / 1024 if alloc_bytes else 0.0
+    result["alloc_blocks_per_frame"] = sum(alloc_blocks) / len(alloc_blocks) if alloc_blocks else 0.0
+    return result
+
+def run_benchmarks(frames=300, only=None, repeat=3):
+    """Замерить все сцены (или только перечисленные в only). Возвращает отчет для baseline"""
+    env = BenchmarkEnvironment()
+    results = {}
+    
+    try:
+        for name, factory in get_scenes():
+            if only and not any(name == pattern or name.startswith(pattern + ":") for pattern in only):
+                continue
+            print(f"⏱️ {name}...")
+            results[name] = measure_scene(env, factory, frames, repeat)
+    finally:
+        env.close()
+    
+    return {
+        "version": BASELINE_VERSION,
+        "frames": frames,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "scenes": results
+    }
+
+def print_results(report):
+    print(f"📊 Время кадра ({report['frames']} кадров на сцену):")
+    print(f"   {'сцена':<30} {'p50':>8} {'p95':>8} {'p99':>8} {'КБ/кадр':>9} {'блоков':>8}")
+    for name, data in report["scenes"].items():
+        print(f"   {name:<30} {data['p50_ms']:8.2f} {data['p95_ms']:8.2f} {data['p99_ms']:8.2f} "
+              f"{data['alloc_kb_per_frame']:9.1f} {data['alloc_blocks_per_frame']:8.1f}")
+
+def compare(report, baseline, threshold=0.2, min_delta_ms=0.2):
+    """
+    Сравнить с baseline. Регрессия - p50 или p95 выросли больше чем на threshold
+    (и больше чем на min_delta_ms, чтобы шум быстрых сцен не считался),
+    или выделения на кадр выросли больше чем на threshold и на 1 КБ.
+    Возвращает список регрессий (сцена, метрика, было, стало).
+    """
+    regressions = []
+    print(f"🔍 Сравнение с baseline (порог {threshold * 100:.0f}%):")
+    
+    for name, data in report["scenes"].items():
+        old = baseline["scenes"].get(name)
+        if old is None:
+            print(f"   🆕 {name}: нет в baseline")
+            continue
+        
+        flagged = []
+        for metric in ("p50_ms", "p95_ms"):
+            if data[metric] > old[metric] * (1 + threshold) and data[metric] - old[metric] > min_delta_ms:
+                flagged.append(metric)
+        metric = "alloc_kb_per_frame"
+        if data[metric] > old[metric] * (1 + threshold) and data[metric] - old[metric] > 1.0:
+            flagged.append(metric)
+        
+        change = (data["p95_ms"] / old["p95_ms"] - 1) * 100 if old["p95_ms"] else 0.0
+        status = "❌" if flagged else "✅"
+        print(f"   {status} {name:<30} p95 {old['p95_ms']:7.2f} -> {data['p95_ms']:7.2f} мс ({change:+.0f}%)")
+        for metric in flagged:
+            regressions.append((name, metric, old[metric], data[metric]))
+            print(f"      регрессия {metric}: {old[metric]:.2f} -> {data[metric]:.2f}")
+    
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк времени кадра по сценам nQuester")
+    parser.add_argument("--frames", type=int, default=300, help="кадров на сцену")
+    parser.add_argument("--repeat", type=int, default=3, help="прогонов на сцену (берется медиана)")
+    parser.add_argument("--scene", action="append", help="только эта сцена (или группа, например minigame)")
+    parser.add_argument("--save", help="записать результаты как baseline (JSON)")
+    parser.add_argument("--compare", help="сравнить с baseline (JSON), код выхода 1 при регрессии")
+    parser.add_argument("--threshold", type=float, default=0.2, help="допустимый рост времени кадра (0.2 = 20%%)")
+    args = parser.parse_args()
+    
+    report = run_benchmarks(args.frames, args.scene, args.repeat)
+    print_results(report)
+    
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Baseline сохранен: {args.save}")
+    
+    regressions = []
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ Регрессий: {len(regressions)}")
+        else:
+            print("✅ Регрессий нет")
+    
+    pygame.quit()
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
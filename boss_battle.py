@@ -4,9 +4,11 @@ import time
 import os
 from settings import *
 from sound_manager import get_sound_manager
+from scenes import Scene
 
-class BossBattle:
+class BossBattle(Scene):
     def __init__(self, screen, player_users):
+        super().__init__()
         self.screen = screen
         self.player_users = player_users
         
@@ -52,7 +54,8 @@ class BossBattle:
             {"name": "Оптимизация", "damage": 50, "cost": 30}
         ]
         
-        self.clock = pygame.time.Clock()
+        # Бой окончен, показываем итог перед выходом
+        self.ending = False
     
     def load_boss_sprite(self):
         """Load boss sprite from main_boss.jpg"""
@@ -259,8 +262,23 @@ class BossBattle:
         
         return None
     
+    def handle_event(self, event):
+        """Scene input: ESC leaves the battle as a defeat"""
+        if self.ending:
+            return
+        if self.handle_input(event) == "exit":
+            self.finish(False)
+    
     def update(self, dt):
         """Update battle state"""
+        super().update(dt)
+        
+        # Итог боя висит 2 секунды, потом сцена закрывается
+        if self.battle_phase in ("victory", "defeat") and not self.ending:
+            self.ending = True
+            self.after(2.0, lambda: self.finish(self.battle_phase == "victory"))
+            return
+        
         if self.battle_phase == "boss_turn":
             # Add delay for boss turn
             self.animation_frame += dt
@@ -268,31 +286,12 @@ class BossBattle:
                 self.perform_boss_attack()
                 self.animation_frame = 0
     
-    def run_battle(self):
-        """Run the complete boss battle"""
+    def enter(self):
+        """Battle starts"""
         print(f"🎮 Начинается битва с боссом!")
         print(f"👥 Пользователи игрока: {self.player_users}")
         print(f"💪 Сила босса: HP={self.boss_hp}, Атака={self.boss_attack_power}, Защита={self.boss_defense_power}")
-        
-        while True:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-                
-                result = self.handle_input(event)
-                if result == "exit":
-                    return False
-            
-            self.update(dt)
-            self.draw_battle_screen()
-            pygame.display.flip()
-            
-            # Check battle end conditions
-            if self.battle_phase == "victory":
-                pygame.time.wait(2000)  # Show victory for 2 seconds
-                return True
-            elif self.battle_phase == "defeat":
-                pygame.time.wait(2000)  # Show defeat for 2 seconds
-                return False 
\ No newline at end of file
+    
+    def draw(self, screen):
+        self.screen = screen
+        self.draw_battle_screen()
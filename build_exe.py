@@ -48,6 +48,7 @@ def create_build():
         "--add-data", "Modern_Interiors_Free_v2.2:Modern_Interiors_Free_v2.2",  # Include tilesets
         "--add-data", "mc:mc",  # Include mc folder
         "--icon", "data/sprites/icon_quest.png",  # Add icon if available
+        "--collect-submodules", "minigames",  # Minigame modules are imported lazily
         "main.py"
     ]
     
@@ -50,6 +50,7 @@ def create_build():
         f"--add-data", f"{current_dir}/Base and Full Map + HD Images;Base and Full Map + HD Images",  # Include maps
         f"--add-data", f"{current_dir}/Modern_Interiors_Free_v2.2;Modern_Interiors_Free_v2.2",  # Include tilesets
         f"--add-data", f"{current_dir}/mc;mc",  # Include mc folder
+        "--collect-submodules", "minigames",  # Minigame modules are imported lazily
         "main.py"
     ]
     
@@ -0,0 +1,108 @@
+import numpy as np
+from settings import *
+
+# Диапазоны ID тайлов RPG Maker MV
+TILE_ID_B = 0
+TILE_ID_A5 = 1536
+TILE_ID_A1 = 2048
+TILE_ID_A2 = 2816
+TILE_ID_A3 = 4352
+TILE_ID_A4 = 5888
+TILE_ID_MAX = 8192
+
+# Стены и крыши зданий (A3, A4) непроходимы
+WALL_TILE_RANGES = [(TILE_ID_A3, TILE_ID_MAX)]
+# Вода (A1)
+WATER_TILE_RANGES = [(TILE_ID_A1, TILE_ID_A2)]
+
+# Чтобы не залипать на границе тайла из-за погрешности float
+EDGE_EPSILON = 0.001
+
+class CollisionGrid:
+    """
+    Сетка проходимости карты: один bool на тайл.
+    Движение проверяется по осям отдельно и смотрит только те клетки,
+    которые пересекает движущийся прямоугольник - O(пройденных клеток).
+    """
+    def __init__(self, blocked, tile_size=TILE_SIZE):
+        self.blocked = np.asarray(blocked, dtype=bool)
+        self.height, self.width = self.blocked.shape
+        self.tile_size = tile_size
+    
+    @classmethod
+    def from_tiles(cls, tiles, tile_size=TILE_SIZE, blocking_ranges=None):
+        """
+        Построить сетку из слоев тайлов (массив layers x height x width).
+        Клетка непроходима, если хотя бы на одном слое стоит тайл из blocking_ranges.
+        """
+        if blocking_ranges is None:
+            blocking_ranges = list(WALL_TILE_RANGES)
+            if COLLISION_BLOCK_WATER:
+                blocking_ranges += WATER_TILE_RANGES
+        
+        blocked = np.zeros(tiles.shape[1:], dtype=bool)
+        for first, last in blocking_ranges:
+            blocked |= ((tiles >= first) & (tiles < last)).any(axis=0)
+        return cls(blocked, tile_size)
+    
+    def is_blocked(self, tx, ty):
+        """Непроходима ли клетка (за пределами карты - всегда да)"""
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return bool(self.blocked[ty, tx])
+        return True
+    
+    def span_blocked(self, first, last, index, column):
+        """Есть ли непроходимые клетки в столбце (column=True) или строке index на отрезке first..last"""
+        if column:
+            if index < 0 or index >= self.width or first < 0 or last >= self.height:
+                return True
+            return bool(self.blocked[first:last + 1, index].any())
+        if index < 0 or index >= self.height or first < 0 or last >= self.width:
+            return True
+        return bool(self.blocked[index, first:last + 1].any())
+    
+    def box_blocked(self, left, top, width, height):
+        """Пересекает ли прямоугольник непроходимые клетки"""
+        ts = self.tile_size
+        col0, col1 = int(left // ts), int((left + width - EDGE_EPSILON) // ts)
+        row0, row1 = int(top // ts), int((top + height - EDGE_EPSILON) // ts)
+        if col0 < 0 or row0 < 0 or col1 >= self.width or row1 >= self.height:
+            return True
+        return bool(self.blocked[row0:row1 + 1, col0:col1 + 1].any())
+    
+    def sweep(self, start, size, cross_start, cross_size, delta, column):
+        """
+        Сдвиг по одной оси: start/size - положение и размер по оси движения,
+        cross_start/cross_size - по другой оси. Возвращает новое start.
+        """
+        if delta == 0:
+            return start
+        
+        ts = self.tile_size
+        first = int(cross_start // ts)
+        last = int((cross_start + cross_size - EDGE_EPSILON) // ts)
+        
+        if delta > 0:
+            edge = start + size
+            for index in range(int((edge - EDGE_EPSILON) // ts) + 1, int((edge + delta - EDGE_EPSILON) // ts) + 1):
+                if self.span_blocked(first, last, index, column):
+                    return index * ts - size
+        else:
+            for index in range(int(start // ts) - 1, int((start + delta) // ts) - 1, -1):
+                if self.span_blocked(first, last, index, column):
+                    return (index + 1) * ts
+        return start + delta
+    
+    def move_box(self, center, size, dx, dy):
+        """Сдвинуть прямоугольник size с центром center на (dx, dy) с учетом стен"""
+        width, height = size
+        left = center[0] - width / 2
+        top = center[1] - height / 2
+        
+        # Если уже стоим в стене (например, после загрузки сохранения) - выпускаем
+        if self.box_blocked(left, top, width, height):
+            return (center[0] + dx, center[1] + dy)
+        
+        left = self.sweep(left, width, top, height, dx, column=True)
+        top = self.sweep(top, height, left, width, dy, column=False)
+        return (left + width / 2, top + height / 2)
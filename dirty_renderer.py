@@ -0,0 +1,117 @@
+import pygame
+
+def merge_rects(rects):
+    """Объединить пересекающиеся прямоугольники (пустые выбрасываются)"""
+    merged = [pygame.Rect(rect) for rect in rects if rect and rect.width > 0 and rect.height > 0]
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        while merged:
+            rect = merged.pop()
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                changed = True
+                index = rect.collidelist(merged)
+            result.append(rect)
+        merged = result
+    return merged
+
+class DirtyRectRenderer:
+    """
+    Режим отрисовки "грязными прямоугольниками" для исследования карты.
+    Карта под неподвижной камерой запоминается в фоновой поверхности.
+    Каждый кадр фон восстанавливается только там, где в прошлом кадре
+    что-то рисовалось, объекты сообщают свои прямоугольники через add(),
+    и на экран отправляются только объединенные прямоугольники.
+    Полная перерисовка - только когда камера двигается или после invalidate().
+    """
+    def __init__(self, full_update_ratio=0.6):
+        # Если грязных пикселей больше этой доли экрана - дешевле flip()
+        self.full_update_ratio = full_update_ratio
+        
+        self.background = None
+        self.background_valid = False
+        self.view_key = None
+        self.previous_rects = []
+        self.rects = []
+        self.full_frame = True
+        
+        # Статистика
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_update_pixels = 0
+    
+    def invalidate(self):
+        """Следующий кадр рисуется целиком (смена сцены, режима экрана и т.п.)"""
+        self.background_valid = False
+        self.view_key = None
+    
+    def begin_frame(self, screen, view_key, draw_background):
+        """
+        Начать кадр. view_key - все, от чего зависит фон (положение камеры и т.п.),
+        draw_background(surface) рисует фон целиком.
+        """
+        self.rects = []
+        screen_size = screen.get_size()
+        
+        if view_key != self.view_key:
+            # Камера двигается - фон не запоминаем, просто рисуем кадр целиком
+            draw_background(screen)
+            self.background_valid = False
+            self.full_frame = True
+        elif not self.background_valid:
+            # Камера остановилась - запоминаем фон один раз
+            if self.background is None or self.background.get_size() != screen_size:
+                self.background = pygame.Surface(screen_size).convert()
+            draw_background(self.background)
+            screen.blit(self.background, (0, 0))
+            self.background_valid = True
+            self.full_frame = True
+        else:
+            # Стираем то, что рисовали в прошлом кадре
+            for rect in self.previous_rects:
+                screen.blit(self.background, rect, rect)
+            self.full_frame = False
+        
+        self.view_key = view_key
+    
+    def add(self, areas):
+        """Добавить прямоугольник(и), которые объект нарисовал в этом кадре"""
+        if areas is None:
+            return
+        if isinstance(areas, pygame.Rect):
+            self.rects.append(areas)
+        else:
+            self.rects.extend(area for area in areas if area is not None)
+    
+    def end_frame(self, screen):
+        """Отправить изменения на экран"""
+        screen_rect = screen.get_rect()
+        current = [rect.clip(screen_rect) for rect in self.rects]
+        
+        if self.full_frame:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_update_pixels = screen_rect.width * screen_rect.height
+        else:
+            # Старые места (стерли) + новые (нарисовали)
+            dirty = merge_rects(self.previous_rects + current)
+            pixels = sum(rect.width * rect.height for rect in dirty)
+            if pixels > screen_rect.width * screen_rect.height * self.full_update_ratio:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            self.partial_frames += 1
+            self.last_update_pixels = pixels
+        
+        self.previous_rects = current
+    
+    def get_stats(self):
+        """Статистика кадров"""
+        return {
+            "full_frames": self.full_frames,
+            "partial_frames": self.partial_frames,
+            "last_update_pixels": self.last_update_pixels
+        }
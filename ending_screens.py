@@ -1,12 +1,13 @@
 import pygame
 import os
 from settings import *
+from scenes import Scene
 
-class EndingScreen:
+class EndingScreen(Scene):
     def __init__(self, screen, is_victory=True):
+        super().__init__()
         self.screen = screen
         self.is_victory = is_victory
-        self.clock = pygame.time.Clock()
         
         # Load ending images
         self.load_ending_images()
@@ -19,7 +20,7 @@ class EndingScreen:
         # Animation
         self.alpha = 0
         self.fade_speed = 2
-        
+    
     def load_ending_images(self):
         """Load ending images"""
         try:
@@ -136,19 +137,13 @@ class EndingScreen:
             self.screen.blit(text_surface, text_rect)
             y_offset += 40
     
-    def run(self):
-        """Run the ending screen"""
+    def enter(self):
         print(f"🎬 Показываем {'хорошую' if self.is_victory else 'плохую'} концовку")
-        
-        while True:
-            dt = self.clock.tick(60) / 1000.0
-            
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "exit"
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "menu"
-            
-            self.draw_ending_screen()
-            pygame.display.flip() 
\ No newline at end of file
+    
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.finish("menu")
+    
+    def draw(self, screen):
+        self.screen = screen
+        self.draw_ending_screen()
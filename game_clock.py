@@ -0,0 +1,65 @@
+import pygame
+from settings import SIMULATION_HZ, MAX_FRAME_TIME
+
+class GameClock:
+    """
+    Единые часы симуляции с фиксированным шагом.
+    Реальное время кадра копится в accumulator, update() вызывается
+    шагами по step секунд, а остаток (alpha) идет на интерполяцию отрисовки.
+    Игровое время идет только вместе с шагами, поэтому скорость игры
+    не зависит от частоты кадров.
+    """
+    def __init__(self, hz=SIMULATION_HZ, max_frame_time=MAX_FRAME_TIME):
+        self.step = 1.0 / hz
+        # Длинный кадр (загрузка, перетаскивание окна) не превращается в сотни шагов
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        # Игровое время в секундах. Начинаем с времени pygame, чтобы метки,
+        # поставленные до запуска часов (меню), не оказались в будущем
+        self.time = pygame.time.get_ticks() / 1000.0
+        self.steps = 0
+    
+    def add_frame_time(self, frame_time):
+        """Добавить реальное время прошедшего кадра (секунды)"""
+        self.accumulator += min(frame_time, self.max_frame_time)
+    
+    def consume_step(self):
+        """Забрать один шаг симуляции, если накопилось достаточно времени"""
+        if self.accumulator < self.step:
+            return False
+        self.accumulator -= self.step
+        self.time += self.step
+        self.steps += 1
+        return True
+    
+    @property
+    def alpha(self):
+        """Доля шага между последним состоянием и следующим (0..1) для интерполяции"""
+        return self.accumulator / self.step
+    
+    def get_ticks(self):
+        """Игровое время в миллисекундах (замена pygame.time.get_ticks)"""
+        return int(self.time * 1000)
+
+# Глобальные часы игры
+game_clock = None
+
+def init_game_clock():
+    """Создать часы симуляции"""
+    global game_clock
+    game_clock = GameClock()
+    return game_clock
+
+def get_game_clock():
+    """Получить часы симуляции"""
+    return game_clock
+
+def get_ticks():
+    """Игровое время в мс; вне игры (меню, экраны) - обычное время pygame"""
+    if game_clock is None:
+        return pygame.time.get_ticks()
+    return game_clock.get_ticks()
+
+def get_time():
+    """Игровое время в секундах (для таймеров мини-игр вместо time.time)"""
+    return get_ticks() / 1000.0
@@ -0,0 +1,201 @@
+import pygame
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image
+
+class GifStream:
+    """
+    Ленивый декодер GIF, общий для всех, кто показывает один и тот же файл.
+    Кадры декодируются по требованию в исходном размере и живут в кольце
+    из ring_size кадров. Фоновый поток заранее декодирует следующие кадры.
+    """
+    def __init__(self, path, ring_size=12, prefetch_ahead=4):
+        self.path = path
+        self.ring_size = ring_size
+        self.prefetch_ahead = prefetch_ahead
+        
+        self.frames = OrderedDict()  # индекс кадра -> Surface в исходном размере
+        self.frames_lock = threading.Lock()
+        self.decode_lock = threading.Lock()  # PIL Image не потокобезопасен
+        self.decoded_count = 0
+        
+        self.image = Image.open(path)
+        self.frame_count = getattr(self.image, 'n_frames', 1)
+        self.size = self.image.size
+        
+        # Фоновая предзагрузка
+        self.prefetch_from = None
+        self.prefetch_event = threading.Event()
+        self.worker = None
+        self.failed = set()  # битые кадры: больше не декодируются
+        self.last_frame = None  # последний удачный кадр (показывается вместо битого)
+    
+    def decode(self, index):
+        """Декодировать кадр и положить его в кольцо"""
+        with self.decode_lock:
+            with self.frames_lock:
+                frame = self.frames.get(index)
+            if frame is not None:
+                return frame
+            
+            self.image.seek(index)
+            rgba = self.image.convert('RGBA')
+            frame = pygame.image.fromstring(rgba.tobytes(), rgba.size, 'RGBA')
+            self.decoded_count += 1
+        
+        with self.frames_lock:
+            self.frames[index] = frame
+            while len(self.frames) > self.ring_size:
+                self.frames.popitem(last=False)
+        return frame
+    
+    def get_frame(self, index):
+        """
+        Получить кадр (из кольца или декодировать сразу). Вместо битого кадра -
+        последний удачный; None, если удачных еще не было
+        """
+        index %= self.frame_count
+        with self.frames_lock:
+            frame = self.frames.get(index)
+            if frame is not None:
+                self.frames.move_to_end(index)
+        
+        if frame is None and index not in self.failed:
+            try:
+                frame = self.decode(index)
+            except (OSError, ValueError, EOFError) as e:
+                print(f"❌ Ошибка декодирования GIF {self.path}, кадр {index}: {e}")
+                self.failed.add(index)
+        
+        if frame is None:
+            frame = self.last_frame
+        else:
+            self.last_frame = frame
+        
+        self.request_prefetch(index + 1)
+        return frame
+    
+    def request_prefetch(self, index):
+        """Попросить фоновый поток декодировать кадры начиная с index"""
+        if self.frame_count <= 1 or self.prefetch_ahead <= 0:
+            return
+        self.prefetch_from = index % self.frame_count
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.prefetch_loop, daemon=True)
+            self.worker.start()
+        self.prefetch_event.set()
+    
+    def prefetch_loop(self):
+        """Фоновый поток: декодирует кадры впереди текущего"""
+        while True:
+            self.prefetch_event.wait()
+            self.prefetch_event.clear()
+            start = self.prefetch_from
+            for offset in range(self.prefetch_ahead):
+                index = (start + offset) % self.frame_count
+                with self.frames_lock:
+                    ready = index in self.frames
+                if not ready and index not in self.failed:
+                    try:
+                        self.decode(index)
+                    except (OSError, ValueError, EOFError) as e:
+                        # Поток живет дальше; битый кадр больше не декодируется ни здесь,
+                        # ни в get_frame - там вместо него показывается последний удачный
+                        print(f"❌ Ошибка декодирования GIF {self.path}, кадр {index}: {e}")
+                        self.failed.add(index)
+                # Главный поток ушел вперед - начинаем с нового места
+                if self.prefetch_event.is_set():
+                    break
+    
+    def get_memory_bytes(self):
+        """Память, занятая декодированными кадрами"""
+        width, height = self.size
+        with self.frames_lock:
+            return len(self.frames) * width * height * 4
+
+# Общие потоки по пути к файлу
+gif_streams = {}
+
+def get_gif_stream(path):
+    """Получить общий поток кадров для GIF (None, если файла нет)"""
+    if path not in gif_streams:
+        stream = None
+        if os.path.exists(path):
+            try:
+                stream = GifStream(path)
+                print(f"✅ GIF подключен: {path} ({stream.frame_count} кадров)")
+            except (OSError, ValueError) as e:
+                print(f"❌ Ошибка загрузки GIF {path}: {e}")
+        else:
+            print(f"⚠️ GIF файл не найден: {path}")
+        gif_streams[path] = stream
+    return gif_streams[path]
+
+def get_gif_memory_bytes():
+    """Память декодированных кадров всех GIF"""
+    return sum(stream.get_memory_bytes() for stream in gif_streams.values() if stream is not None)
+
+class AnimatedBackground:
+    """
+    Анимированный GIF-фон заданного размера.
+    Масштабирует только текущий кадр, затемнение накладывается при отрисовке
+    одной заранее созданной полупрозрачной поверхностью.
+    """
+    def __init__(self, path, size, overlay_alpha=100, frame_delay=0.1):
+        self.stream = get_gif_stream(path)
+        self.size = size
+        self.frame_delay = frame_delay
+        
+        self.current_frame = 0
+        self.last_frame_time = 0
+        
+        # Масштабированный текущий кадр
+        self.scaled_index = None
+        self.scaled_frame = None
+        
+        # Затемнение для читаемости текста
+        self.overlay = None
+        if overlay_alpha > 0:
+            self.overlay = pygame.Surface(size)
+            self.overlay.set_alpha(overlay_alpha)
+            self.overlay.fill((0, 0, 0))
+    
+    @property
+    def available(self):
+        return self.stream is not None
+    
+    def update(self, dt):
+        """Переключить кадр по таймеру"""
+        if not self.stream:
+            return
+        self.last_frame_time += dt
+        while self.last_frame_time >= self.frame_delay:
+            self.current_frame = (self.current_frame + 1) % self.stream.frame_count
+            self.last_frame_time -= self.frame_delay
+    
+    def get_frame(self):
+        """Текущий кадр в нужном размере (без затемнения). None - GIF нет или он не декодируется"""
+        if not self.stream:
+            return None
+        if self.scaled_index != self.current_frame:
+            frame = self.stream.get_frame(self.current_frame)
+            if frame is None:
+                # Ни одного кадра не удалось декодировать - draw() вернет False, как без файла
+                return None
+            frame = pygame.transform.scale(frame, self.size)
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert()
+            self.scaled_frame = frame
+            self.scaled_index = self.current_frame
+        return self.scaled_frame
+    
+    def draw(self, screen, position=(0, 0)):
+        """Нарисовать кадр с затемнением. Возвращает False, если GIF нет"""
+        frame = self.get_frame()
+        if frame is None:
+            return False
+        screen.blit(frame, position)
+        if self.overlay:
+            screen.blit(self.overlay, position)
+        return True
@@ -4,6 +4,9 @@ import json
 import os
 from settings import *
 from sound_manager import get_sound_manager
+from sprite_loader import get_asset_cache
+from retained import RetainedSurface
+from game_clock import get_ticks
 
 class Item:
     """Предметы, которые дают бонусы игроку"""
@@ -162,7 +165,7 @@ class EventManager:
         self.events = []
         self.active_events = []
         self.event_timer = 0
-        self.event_interval = 60000  # 1 минута
+        self.event_interval = 60  # секунд (1 минута), dt приходит в секундах
         self.setup_events()
     
     def setup_events(self):
@@ -215,7 +218,7 @@ class EventManager:
             self.event_timer = 0
         
         # Обновление активных событий
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         self.active_events = [
             event for event in self.active_events
             if current_time - event.start_time < event.duration
@@ -228,7 +231,7 @@ class EventManager:
         
         event = random.choice(self.events)
         event.active = True
-        event.start_time = pygame.time.get_ticks()
+        event.start_time = get_ticks()
         self.active_events.append(event)
         
         # Воспроизведение звука события
@@ -398,6 +401,9 @@ class ImprovementManager:
         # Анимации наград
         self.reward_animations = []
         self.animation_timer = 0
+        
+        # Прогресс-бары перерисовываются только при смене процентов
+        self.progress_widget = RetainedSurface((200, 55), self.render_progress_bars)
     
     def update(self, dt):
         """Обновление всех систем"""
@@ -411,7 +417,7 @@ class ImprovementManager:
         # Удаление завершенных анимаций
         self.reward_animations = [
             anim for anim in self.reward_animations
-            if pygame.time.get_ticks() - anim["start_time"] < anim["duration"]
+            if get_ticks() - anim["start_time"] < anim["duration"]
         ]
     
     def show_reward_animation(self, reward_type, value):
@@ -419,7 +425,7 @@ class ImprovementManager:
         animation = {
             "type": reward_type,
             "value": value,
-            "start_time": pygame.time.get_ticks(),
+            "start_time": get_ticks(),
             "duration": 3000,  # 3 секунды
             "y_offset": 0
         }
@@ -431,8 +437,9 @@ class ImprovementManager:
             sound_manager.play_sound("reward")
     
     def draw_reward_animations(self, screen):
-        """Отрисовка анимаций наград"""
-        current_time = pygame.time.get_ticks()
+        """Отрисовка анимаций наград. Возвращает занятые прямоугольники"""
+        current_time = get_ticks()
+        areas = []
         
         for animation in self.reward_animations:
             elapsed = current_time - animation["start_time"]
@@ -452,30 +459,38 @@ class ImprovementManager:
             y = SCREEN_HEIGHT // 2 - 100 - y_offset
             
             # Текст награды
-            font = pygame.font.Font(None, 48)
+            font = get_asset_cache().get_font(None, 48)
             text = f"+{animation['value']} {animation['type']}"
             text_surface = font.render(text, True, (255, 255, 0))
             text_surface.set_alpha(alpha)
             
             # Центрирование текста
             text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
+            areas.append(screen.blit(text_surface, text_rect))
+        return areas
     
     def draw_progress_bars(self, screen, player, quest_manager):
-        """Отрисовка прогресс-баров"""
-        # Прогресс-бар квестов
+        """Отрисовка прогресс-баров. Возвращает занятый прямоугольник"""
         quest_progress = self.progress_tracker.get_quest_progress_percentage()
-        self.draw_progress_bar(screen, 10, 70, 200, 15, quest_progress, 
+        user_progress = (player.current_users / TARGET_USERS) * 100
+        student_progress = self.get_student_progress()
+        
+        # Версия - то, что видно на экране (проценты с одним знаком)
+        progress = (round(quest_progress, 1), round(user_progress, 1), round(student_progress, 1))
+        return self.progress_widget.draw(screen, (10, 70), progress, *progress)
+    
+    def render_progress_bars(self, surface, quest_progress, user_progress, student_progress):
+        """Отрисовка прогресс-баров в поверхность виджета"""
+        # Прогресс-бар квестов
+        self.draw_progress_bar(surface, 0, 0, 200, 15, quest_progress, 
                              "Квесты", (0, 255, 0))
         
         # Прогресс-бар пользователей
-        user_progress = (player.current_users / TARGET_USERS) * 100
-        self.draw_progress_bar(screen, 10, 90, 200, 15, user_progress,
+        self.draw_progress_bar(surface, 0, 20, 200, 15, user_progress,
                              "Пользователи", (0, 150, 255))
         
         # Прогресс-бар студентов
-        student_progress = self.get_student_progress()
-        self.draw_progress_bar(screen, 10, 110, 200, 15, student_progress,
+        self.draw_progress_bar(surface, 0, 40, 200, 15, student_progress,
                              "Студенты", (255, 150, 0))
     
     def draw_progress_bar(self, screen, x, y, width, height, percentage, label, color):
@@ -491,7 +506,7 @@ class ImprovementManager:
         pygame.draw.rect(screen, (100, 100, 100), (x, y, width, height), 2)
         
         # Текст
-        font = pygame.font.Font(None, 20)
+        font = get_asset_cache().get_font(None, 20)
         text = f"{label}: {percentage:.1f}%"
         text_surface = font.render(text, True, (255, 255, 255))
         screen.blit(text_surface, (x + 5, y + 2))
@@ -508,13 +523,14 @@ class ImprovementManager:
         return total_progress / len(self.progress_tracker.student_progress)
     
     def draw_active_events(self, screen):
-        """Отрисовка активных событий"""
+        """Отрисовка активных событий. Возвращает занятые прямоугольники"""
+        areas = []
         if not self.event_manager.active_events:
-            return
+            return areas
         
         y_offset = 150
         for event in self.event_manager.active_events:
-            current_time = pygame.time.get_ticks()
+            current_time = get_ticks()
             elapsed = current_time - event.start_time
             remaining = event.duration - elapsed
             
@@ -523,7 +539,7 @@ class ImprovementManager:
             event_surface.fill((255, 0, 0, 150))
             
             # Текст события
-            font = pygame.font.Font(None, 20)
+            font = get_asset_cache().get_font(None, 20)
             name_surface = font.render(event.name, True, (255, 255, 255))
             desc_surface = font.render(event.description, True, (200, 200, 200))
             
@@ -532,12 +548,14 @@ class ImprovementManager:
             timer_surface = font.render(timer_text, True, (255, 255, 0))
             
             # Отрисовка
-            screen.blit(event_surface, (SCREEN_WIDTH - 320, y_offset))
-            screen.blit(name_surface, (SCREEN_WIDTH - 310, y_offset + 5))
-            screen.blit(desc_surface, (SCREEN_WIDTH - 310, y_offset + 25))
-            screen.blit(timer_surface, (SCREEN_WIDTH - 310, y_offset + 40))
+            area = screen.blit(event_surface, (SCREEN_WIDTH - 320, y_offset))
+            area.union_ip(screen.blit(name_surface, (SCREEN_WIDTH - 310, y_offset + 5)))
+            area.union_ip(screen.blit(desc_surface, (SCREEN_WIDTH - 310, y_offset + 25)))
+            area.union_ip(screen.blit(timer_surface, (SCREEN_WIDTH - 310, y_offset + 40)))
+            areas.append(area)
             
             y_offset += 70
+        return areas
 
 # Глобальные экземпляры
 improvement_manager = None
@@ -1,9 +1,12 @@
 import pygame
 import os
 from settings import *
+from sprite_loader import get_asset_cache
+from scenes import Scene
 
-class IntroScene:
+class IntroScene(Scene):
     def __init__(self, screen):
+        super().__init__()
         self.screen = screen
         self.font_large = pygame.font.Font(None, 48)
         self.font_medium = pygame.font.Font(None, 32)
@@ -55,9 +58,8 @@ class IntroScene:
         try:
             mentor_path = "Mentors/main.jpg"
             if os.path.exists(mentor_path):
-                self.main_mentor = pygame.image.load(mentor_path)
-                # Scale to appropriate size
-                self.main_mentor = pygame.transform.scale(self.main_mentor, (200, 200))
+                # Scale to appropriate size (decoded in background at startup)
+                self.main_mentor = get_asset_cache().get_image(mentor_path, (200, 200), alpha=False)
                 print("✅ Загружен главный ментор")
             else:
                 print(f"⚠️ Файл главного ментора не найден: {mentor_path}")
@@ -66,6 +68,7 @@ class IntroScene:
     
     def update(self, dt):
         """Update typing animation"""
+        super().update(dt)
         if self.typing_active and self.current_line < len(self.dialogue_lines):
             self.typing_time += dt
             if self.typing_time >= self.typing_speed:
@@ -85,8 +88,10 @@ class IntroScene:
             return False  # Not finished
         return True  # Finished
     
-    def draw(self):
+    def draw(self, screen):
         """Draw the intro scene"""
+        self.screen = screen
+        
         # Draw background
         self.screen.blit(self.background, (0, 0))
         
@@ -163,36 +168,18 @@ class IntroScene:
             continue_rect.bottomright = (box_x + box_width - 20, box_y + box_height - 20)
             self.screen.blit(continue_surface, continue_rect)
     
-    def run(self):
-        """Run the intro scene"""
-        clock = pygame.time.Clock()
-        running = True
-        
-        while running:
-            dt = clock.tick(60) / 1000.0
-            
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "exit"
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "exit"
-                    elif event.key == pygame.K_e or event.key == pygame.K_RETURN:
-                        if self.typing_active:
-                            # Skip typing animation
-                            self.typing_active = False
-                            self.typing_index = len(self.dialogue_lines[self.current_line])
-                        else:
-                            # Move to next line
-                            if self.next_line():
-                                return "start_game"  # Intro finished
-            
-            # Update
-            self.update(dt)
-            
-            # Draw
-            self.draw()
-            pygame.display.flip()
-        
-        return "exit" 
\ No newline at end of file
+    def handle_event(self, event):
+        """E/Enter: skip typing or go to the next line, ESC: leave"""
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.finish("exit")
+        elif event.key == pygame.K_e or event.key == pygame.K_RETURN:
+            if self.typing_active:
+                # Skip typing animation
+                self.typing_active = False
+                self.typing_index = len(self.dialogue_lines[self.current_line])
+            else:
+                # Move to next line
+                if self.next_line():
+                    self.finish("start_game")  # Intro finished
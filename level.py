@@ -3,23 +3,64 @@ import os
 import json
 from settings import *
 from npc import NPC
+from tilemap import TileMap
+from spatial_index import SpatialHash
+from collision import CollisionGrid
+from asset_bake import get_asset_baker
 
 class Level:
     def __init__(self, level_name="base"):
         self.level_name = level_name
         self.npcs = []  # Changed from pygame.sprite.Group() to list
+        self.npcs_by_name = {}
+        
+        # Spatial index for NPC proximity queries and culling
+        self.npc_index = SpatialHash(cell_size=64)
+        self.max_interaction_range = 0
         self.obstacles = pygame.sprite.Group()
         
         # Camera
         self.camera_offset = pygame.math.Vector2()
+        self.camera_target = pygame.math.Vector2()
+        self.previous_camera = pygame.math.Vector2()
         
         # Load level
         self.load_level()
         self.create_npcs()
         
-        # Background
-        self.load_background()
+        # Background: chunked tilemap from RPG Maker data, image as fallback
+        self.tilemap = None
+        self.load_tilemap()
+        if self.tilemap is None:
+            self.load_background()
+        
+        # Passability grid for player movement
+        self.collision_grid = None
+        if self.tilemap:
+            self.collision_grid = CollisionGrid.from_tiles(self.tilemap.tiles, self.tilemap.tile_size)
+        
+    def load_tilemap(self):
+        """Build chunked tilemap renderer from level data"""
+        if not self.level_data.get("data"):
+            return
         
+        if self.level_name == "base":
+            image_path = os.path.join(MAPS_PATH, "Fortuna (Base Map).png")
+        else:
+            image_path = os.path.join(MAPS_PATH, "Fortuna (Full Map).png")
+        
+        try:
+            self.tilemap = TileMap(self.level_data, image_path)
+        except (KeyError, ValueError, OSError, pygame.error) as e:
+            print(f"⚠️ Не удалось построить тайловую карту: {e}")
+            self.tilemap = None
+    
+    def get_map_size(self):
+        """Get map size in pixels"""
+        if self.tilemap:
+            return self.tilemap.get_size()
+        return self.background.get_size()
+    
     def load_background(self):
         """Load background map image"""
         try:
@@ -29,13 +70,8 @@ class Level:
                 bg_path = os.path.join(MAPS_PATH, "Fortuna (Full Map).png")
                 
             if os.path.exists(bg_path):
-                self.background = pygame.image.load(bg_path)
-                # Scale down if too large
-                bg_size = self.background.get_size()
-                if bg_size[0] > 2000 or bg_size[1] > 2000:
-                    scale_factor = min(2000 / bg_size[0], 2000 / bg_size[1])
-                    new_size = (int(bg_size[0] * scale_factor), int(bg_size[1] * scale_factor))
-                    self.background = pygame.transform.scale(self.background, new_size)
+                # Scaled down to 2000px once and baked to disk
+                self.background = get_asset_baker().get_image(bg_path, "fit", (2000, 2000), alpha=False)
             else:
                 # Create simple background
                 self.background = pygame.Surface((1600, 1200))
@@ -86,11 +122,11 @@ class Level:
                 mentor_data["name"],
                 "mentor"
             )
-            self.npcs.append(mentor)
+            self.add_npc(mentor)
         
         # Add final boss NPC
         final_boss = NPC(800, 400, "FinalBoss", "boss")
-        self.npcs.append(final_boss)
+        self.add_npc(final_boss)
         
         # Create some student NPCs (spread around)
         students_data = [
@@ -113,7 +149,32 @@ class Level:
                 student_data["name"],
                 "student"
             )
-            self.npcs.append(student)
+            self.add_npc(student)
+    
+    def add_npc(self, npc):
+        """Add NPC to the level and the spatial index"""
+        self.npcs.append(npc)
+        self.npcs_by_name[npc.name] = npc
+        self.npc_index.insert(npc, npc.position)
+        self.max_interaction_range = max(self.max_interaction_range, npc.interaction_range)
+    
+    def remove_npc(self, npc):
+        """Remove NPC from the level"""
+        if npc in self.npcs:
+            self.npcs.remove(npc)
+        if self.npcs_by_name.get(npc.name) is npc:
+            del self.npcs_by_name[npc.name]
+        self.npc_index.remove(npc)
+    
+    def move_npc(self, npc, x, y):
+        """Move NPC and keep the spatial index up to date"""
+        npc.position.update(x, y)
+        npc.rect.center = (int(x), int(y))
+        self.npc_index.move(npc, npc.position)
+    
+    def get_npc(self, name):
+        """Get NPC by name"""
+        return self.npcs_by_name.get(name)
     
     def setup_quests(self, quest_manager):
         """Setup quests for NPCs"""
@@ -254,23 +315,34 @@ class Level:
         target_x = player.position.x - SCREEN_WIDTH // 2
         target_y = player.position.y - SCREEN_HEIGHT // 2
         
-        # Clamp camera to background bounds
-        max_x = self.background.get_width() - SCREEN_WIDTH
-        max_y = self.background.get_height() - SCREEN_HEIGHT
+        # Clamp camera to map bounds
+        map_width, map_height = self.get_map_size()
+        max_x = map_width - SCREEN_WIDTH
+        max_y = map_height - SCREEN_HEIGHT
         
         target_x = max(0, min(target_x, max_x))
         target_y = max(0, min(target_y, max_y))
         
-        self.camera_offset.x = target_x
-        self.camera_offset.y = target_y
+        # camera_target follows the simulation, camera_offset is what gets drawn
+        self.camera_target.update(target_x, target_y)
+        self.camera_offset.update(target_x, target_y)
+    
+    def interpolate(self, alpha):
+        """Camera between the last two simulation steps (alpha 0..1)"""
+        self.camera_offset.update(self.previous_camera.lerp(self.camera_target, min(alpha, 1.0)))
     
     def get_nearby_npcs(self, player):
-        """Get NPCs near player for interaction"""
-        nearby_npcs = []
-        for npc in self.npcs:
-            if npc.can_interact(player.position):
-                nearby_npcs.append(npc)
-        return nearby_npcs
+        """Get NPCs near player for interaction (nearest first)"""
+        candidates = self.npc_index.query_radius(player.position, self.max_interaction_range)
+        return [npc for npc in candidates if npc.can_interact(player.position)]
+    
+    def get_visible_npcs(self, margin=100):
+        """Get NPCs inside the camera view (margin covers sprites, name tags and markers)"""
+        view_rect = pygame.Rect(self.camera_offset.x, self.camera_offset.y, SCREEN_WIDTH, SCREEN_HEIGHT)
+        visible = self.npc_index.query_rect(view_rect.inflate(margin * 2, margin * 2))
+        # Draw back to front
+        visible.sort(key=lambda npc: npc.position.y)
+        return visible
     
     def add_item(self, item_name, x, y):
         """Add collectible item to level"""
@@ -284,15 +356,22 @@ class Level:
         # No need to update sprite group since we're using a list
     
     def draw(self, screen):
-        """Draw level"""
-        # Draw background relative to camera
-        screen.blit(self.background, (0, 0), 
-                   pygame.Rect(self.camera_offset.x, self.camera_offset.y, 
-                              SCREEN_WIDTH, SCREEN_HEIGHT))
-        
-        # Draw NPCs
-        for npc in self.npcs:
-            npc.draw(screen, self.camera_offset)
+        """Draw level. Returns the screen areas covered by NPCs"""
+        self.draw_background(screen)
+        return self.draw_npcs(screen)
+    
+    def draw_background(self, screen):
+        """Draw the map relative to camera (static while the camera stands still)"""
+        if self.tilemap:
+            self.tilemap.draw(screen, self.camera_offset)
+        else:
+            screen.blit(self.background, (0, 0), 
+                       pygame.Rect(self.camera_offset.x, self.camera_offset.y, 
+                                  SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    def draw_npcs(self, screen):
+        """Draw only NPCs in view. Returns the screen areas they cover"""
+        return [npc.draw(screen, self.camera_offset) for npc in self.get_visible_npcs()]
     
     def get_spawn_position(self):
         """Get player spawn position for this level"""
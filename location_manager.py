@@ -1,6 +1,6 @@
 import pygame
 from settings import *
-from sprite_loader import get_sprite_loader
+from sprite_loader import get_sprite_loader, get_asset_cache
 
 class LocationManager:
     def __init__(self):
@@ -93,7 +93,7 @@ class LocationManager:
         """Отобразить информацию о текущей локации"""
         if self.current_location != "main_map":
             # Показываем подсказку для выхода
-            font = pygame.font.Font(None, 24)
+            font = get_asset_cache().get_font(None, 24)
             exit_text = "Нажмите E у двери для выхода"
             text_surface = font.render(exit_text, True, WHITE)
             screen.blit(text_surface, (10, SCREEN_HEIGHT - 40))
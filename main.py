@@ -5,8 +5,8 @@ from player import Player
 from level import Level
 from quest_manager import QuestManager
 from ui import UI
-from minigames import MinigameManager
-from sprite_loader import init_sprite_loader
+from minigames import MinigameManager, MinigameScene
+from sprite_loader import init_sprite_loader, get_asset_cache
 from location_manager import LocationManager
 from sound_manager import init_sound_manager, get_sound_manager
 from achievements import init_achievement_manager, get_achievement_manager
@@ -16,30 +16,59 @@ from mentor_locations import MentorLocationManager
 from boss_battle import BossBattle
 from ending_screens import EndingScreen
 from improvements import init_improvement_manager, get_improvement_manager
+from startup import get_startup_profiler, start_asset_preload, finish_asset_preload
+from dirty_renderer import DirtyRectRenderer
+from scenes import SceneStack, run_scene
+from game_clock import get_game_clock, init_game_clock, get_ticks
+from perf_overlay import get_perf_monitor
+from stats_store import StatsStore
+from sprite_loader import get_sprite_loader
+from gif_background import get_gif_memory_bytes
+
+def set_display_mode(size, flags=0):
+    """set_mode with optional VSync (SDL needs SCALED for it), plain window as fallback"""
+    if VSYNC:
+        try:
+            return pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+        except pygame.error as e:
+            print(f"⚠️ VSync недоступен: {e}")
+    return pygame.display.set_mode(size, flags)
 
 class Game:
-    def __init__(self):
+    def __init__(self, save_dir=SAVES_PATH):
         pygame.init()
         
         # Initialize display with fullscreen support
         self.fullscreen = False
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = set_display_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("nQuester: Incubator Rush")
         self.clock = pygame.time.Clock()
+        # One simulation clock for the whole process (notification timers outlive a game)
+        self.game_clock = get_game_clock() or init_game_clock()
+        
+        # Frame-time overlay (F3) and Chrome trace (F4); free while both are off
+        self.perf = get_perf_monitor()
+        
+        profiler = get_startup_profiler()
+        
+        # Decode big images in background while the rest initializes
+        start_asset_preload()
         
         # Initialize sprite loader after pygame is initialized
-        init_sprite_loader()
+        with profiler.phase("sprite_loader"):
+            init_sprite_loader()
         
         # Initialize sound manager
-        init_sound_manager()
+        with profiler.phase("sound_manager"):
+            init_sound_manager()
         self.sound_manager = get_sound_manager()
         
         # Initialize achievement manager
         init_achievement_manager()
         self.achievement_manager = get_achievement_manager()
         
-        # Initialize save system
-        init_save_system()
+        # Initialize save system (simulation and benchmarks pass a temporary directory)
+        init_save_system(save_dir)
         self.save_system = get_save_system()
         
         # Initialize improvement manager
@@ -52,30 +81,46 @@ class Game:
         self.in_mentor_location = False
         
         # Game objects
-        self.player = Player(400, 400)
-        self.level = Level("base")
-        self.quest_manager = QuestManager()
-        self.ui = UI()
-        self.minigame_manager = MinigameManager(self.screen)
-        self.location_manager = LocationManager()
-        self.mentor_location_manager = MentorLocationManager()
+        with profiler.phase("game"):
+            self.player = Player(400, 400)
+            with profiler.phase("level"):
+                self.level = Level("base")
+            self.player.collision_grid = self.level.collision_grid
+            self.quest_manager = QuestManager()
+            with profiler.phase("ui"):
+                self.ui = UI()
+            with profiler.phase("minigames"):
+                self.minigame_manager = MinigameManager(self.screen)
+            self.location_manager = LocationManager()
+            with profiler.phase("mentor_locations"):
+                self.mentor_location_manager = MentorLocationManager()
         
         # Setup quests
         self.level.setup_quests(self.quest_manager)
         
+        # Surface memory shown in the performance overlay
+        self.perf.add_memory_source("sprites", get_sprite_loader().get_memory_bytes)
+        self.perf.add_memory_source("asset cache", get_asset_cache().get_memory_bytes)
+        self.perf.add_memory_source("GIF frames", get_gif_memory_bytes)
+        self.perf.add_memory_source("mentor rooms", self.mentor_location_manager.get_memory_bytes)
+        if self.sound_manager and self.sound_manager.music:
+            self.perf.add_memory_source("music", self.sound_manager.music.get_memory_bytes)
+        
         # Interaction
         self.current_npc = None
         self.last_interaction_time = 0
         
+        # Minigames, boss battle and endings run as scenes inside this game loop
+        self.scenes = SceneStack()
+        
         # Victory condition
         self.game_won = False
         
-        # Sound effects
-        self.last_footstep_time = 0
-        self.footstep_interval = 300  # milliseconds
+        # Opt-in dirty-rect rendering (kiosk laptops): redraw only what changed
+        self.dirty_renderer = DirtyRectRenderer() if DIRTY_RECT_RENDERING else None
         
-        # Game statistics for achievements
-        self.game_stats = {
+        # Game statistics for achievements (achievements re-check only the keys that change)
+        self.game_stats = StatsStore({
             "completed_quests": 0,
             "swift_quests": 0,
             "ai_quests": 0,
@@ -85,10 +130,12 @@ class Game:
             "fastest_quest_time": 999,
             "perfect_quests": 0,
             "mentors_met": 0
-        }
+        })
+        if self.achievement_manager:
+            self.achievement_manager.attach(self.game_stats)
         
         # Auto-save timer
-        self.last_autosave = pygame.time.get_ticks()
+        self.last_autosave = get_ticks()
         self.autosave_interval = 30000  # 30 seconds
         
         # Initialize total quests count
@@ -99,6 +146,12 @@ class Game:
         if self.sound_manager:
             self.sound_manager.play_background_music()
             print("🎵 Background music started")
+        
+        # Whatever was preloaded and not taken by now is never needed
+        finish_asset_preload()
+        
+        profiler.mark("game_ready")
+        profiler.report()
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
@@ -106,19 +159,34 @@ class Game:
         if self.fullscreen:
             # Get the display info for fullscreen
             info = pygame.display.Info()
-            self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
+            self.screen = set_display_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
         else:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.screen = set_display_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if self.dirty_renderer:
+            self.dirty_renderer.invalidate()
         print(f"🖥️ Fullscreen: {'ON' if self.fullscreen else 'OFF'}")
     
     def handle_events(self):
         """Handle game events"""
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                self.toggle_fullscreen()
+            
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.perf.toggle_overlay()
+            
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.perf.toggle_trace()
+            
+            elif self.scenes.active:
+                # Active scene owns the input
+                self.scenes.handle_event(event)
+            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.state == DIALOGUE:
@@ -163,9 +231,8 @@ class Game:
                 elif event.key == pygame.K_F5:
                     # Quick save
                     if self.save_system:
+                        # Success/error sound plays once the write has finished
                         self.save_system.auto_save(self)
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("success")
                 
                 elif event.key == pygame.K_F9:
                     # Quick load
@@ -176,9 +243,6 @@ class Game:
                         else:
                             if self.sound_manager:
                                 self.sound_manager.play_sound("error")
-                
-                elif event.key == pygame.K_F11:
-                    self.toggle_fullscreen()
     
     def try_npc_interaction(self):
         """Try to interact with nearby NPCs and doors"""
@@ -189,7 +253,7 @@ class Game:
             if self.sound_manager:
                 self.sound_manager.play_door_close()
             return
-            
+        
         # Check for NPC interaction on main map
         if self.location_manager.current_location == "main_map":
             nearby_npcs = self.level.get_nearby_npcs(self.player)
@@ -230,14 +294,13 @@ class Game:
             if not current_location.check_mentor_interaction(current_location.get_player_position()):
                 print("⚠️ Подойдите ближе к ментору для взаимодействия!")
                 return
-                
+            
             mentor_name = current_location.mentor_name
             
             # Find the mentor NPC
-            for npc in self.level.npcs:
-                if npc.name == mentor_name:
-                    self.current_npc = npc
-                    break
+            mentor_npc = self.level.get_npc(mentor_name)
+            if mentor_npc:
+                self.current_npc = mentor_npc
             
             if self.current_npc:
                 interaction = self.current_npc.interact()
@@ -261,92 +324,15 @@ class Game:
             
             if quest_data:
                 if quest_data["type"] == "minigame":
-                    # Start quest and run minigame
+                    # Start quest and run minigame (result comes when its scene ends)
                     self.quest_manager.start_quest(quest_id, self.player)
-                    success = self.run_minigame(quest_data["minigame_id"])
-                    
-                    if success:
-                        self.quest_manager.mark_minigame_completed(quest_id)
-                        self.quest_manager.complete_quest(quest_id, self.player)
-                        self.current_npc.complete_quest(self.player)
-                        self.current_npc.quest_failed = False  # Reset failure state
-                        
-                        # Play success sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_complete")
-                        
-                        # Show user feedback immediately after success
-                        user_feedback = quest_data.get("user_feedback", ["Отличная работа!"])
-                        self.ui.start_dialogue(user_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
-                        
-                        # Check win condition
-                        if self.player.current_users >= TARGET_USERS:
-                            self.game_won = True
-                    else:
-                        # Quest failed
-                        self.current_npc.fail_quest()
-                        self.quest_manager.active_quests.pop(quest_id, None)
-                        
-                        # Play failure sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_fail")
-                        
-                        # Show failure feedback
-                        failure_feedback = ["Не получилось! Попробуй еще раз!"]
-                        self.ui.start_dialogue(failure_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
+                    self.run_minigame(quest_data["minigame_id"],
+                                      lambda success: self.finish_minigame_quest(quest_id, quest_data, success, check_win=True))
                 
                 elif quest_data["type"] == "boss_battle":
                     # Start boss battle
                     self.quest_manager.start_quest(quest_id, self.player)
-                    success = self.run_boss_battle()
-                    
-                    if success:
-                        self.quest_manager.mark_minigame_completed(quest_id)
-                        self.quest_manager.complete_quest(quest_id, self.player)
-                        self.current_npc.complete_quest()
-                        self.current_npc.quest_failed = False
-                        
-                        # Play success sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_complete")
-                        
-                        # Show victory ending
-                        ending_screen = EndingScreen(self.screen, is_victory=True)
-                        ending_result = ending_screen.run()
-                        
-                        if ending_result == "exit":
-                            return False
-                        
-                        # Show user feedback
-                        user_feedback = quest_data.get("user_feedback", ["НЕВЕРОЯТНО! Ты победил босса!"])
-                        self.ui.start_dialogue(user_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
-                        
-                        # Check win condition
-                        if self.player.current_users >= TARGET_USERS:
-                            self.game_won = True
-                    else:
-                        # Boss battle failed
-                        self.current_npc.fail_quest()
-                        self.quest_manager.active_quests.pop(quest_id, None)
-                        
-                        # Play failure sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_fail")
-                        
-                        # Show defeat ending
-                        ending_screen = EndingScreen(self.screen, is_victory=False)
-                        ending_result = ending_screen.run()
-                        
-                        if ending_result == "exit":
-                            return False
-                        
-                        # Show failure feedback
-                        failure_feedback = ["Босс оказался сильнее! Попробуй еще раз!"]
-                        self.ui.start_dialogue(failure_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
+                    self.run_boss_battle(lambda success: self.finish_boss_quest(quest_id, quest_data, success))
                 
                 elif quest_data["type"] == "item_collection":
                     # Check if player has required items
@@ -362,6 +348,7 @@ class Game:
                         for item in required_items:
                             if item in self.player.inventory:
                                 self.player.inventory.pop(item, None)
+                        self.player.touch()
                         
                         # Play success sound
                         if self.sound_manager:
@@ -394,35 +381,9 @@ class Game:
                     clicks_needed = quest_data.get("clicks_needed", 50)
                     time_limit = quest_data.get("time_limit", 30)
                     
-                    success = self.minigame_manager.run_clicker_game(clicks_needed, time_limit)
-                    
-                    if success:
-                        self.quest_manager.mark_minigame_completed(quest_id)
-                        self.quest_manager.complete_quest(quest_id, self.player)
-                        self.current_npc.complete_quest(self.player)
-                        self.current_npc.quest_failed = False
-                        
-                        # Play success sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_complete")
-                        
-                        # Show user feedback
-                        user_feedback = quest_data.get("user_feedback", ["Отличная работа!"])
-                        self.ui.start_dialogue(user_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
-                    else:
-                        # Quest failed
-                        self.current_npc.fail_quest()
-                        self.quest_manager.active_quests.pop(quest_id, None)
-                        
-                        # Play failure sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_fail")
-                        
-                        # Show failure feedback
-                        failure_feedback = ["Не получилось! Попробуй еще раз!"]
-                        self.ui.start_dialogue(failure_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
+                    minigame = self.minigame_manager.create("clicker", clicks_needed=clicks_needed, time_limit=time_limit)
+                    self.scenes.push(MinigameScene(minigame),
+                                     lambda success: self.finish_minigame_quest(quest_id, quest_data, success))
                 
                 elif quest_data["type"] == "rhythm":
                     # Start rhythm quest
@@ -430,35 +391,9 @@ class Game:
                     beats_needed = quest_data.get("beats_needed", 20)
                     time_limit = quest_data.get("time_limit", 30)
                     
-                    success = self.minigame_manager.run_rhythm_game(beats_needed, time_limit)
-                    
-                    if success:
-                        self.quest_manager.mark_minigame_completed(quest_id)
-                        self.quest_manager.complete_quest(quest_id, self.player)
-                        self.current_npc.complete_quest(self.player)
-                        self.current_npc.quest_failed = False
-                        
-                        # Play success sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_complete")
-                        
-                        # Show user feedback
-                        user_feedback = quest_data.get("user_feedback", ["Отличная работа!"])
-                        self.ui.start_dialogue(user_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
-                    else:
-                        # Quest failed
-                        self.current_npc.fail_quest()
-                        self.quest_manager.active_quests.pop(quest_id, None)
-                        
-                        # Play failure sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_fail")
-                        
-                        # Show failure feedback
-                        failure_feedback = ["Не получилось! Попробуй еще раз!"]
-                        self.ui.start_dialogue(failure_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
+                    minigame = self.minigame_manager.create("rhythm", beats_needed=beats_needed, time_limit=time_limit)
+                    self.scenes.push(MinigameScene(minigame),
+                                     lambda success: self.finish_minigame_quest(quest_id, quest_data, success))
                 
                 elif quest_data["type"] == "color_picker":
                     # Start color picker quest
@@ -466,35 +401,9 @@ class Game:
                     colors_needed = quest_data.get("colors_needed", 5)
                     time_limit = quest_data.get("time_limit", 60)
                     
-                    success = self.minigame_manager.run_color_picker_game(colors_needed, time_limit)
-                    
-                    if success:
-                        self.quest_manager.mark_minigame_completed(quest_id)
-                        self.quest_manager.complete_quest(quest_id, self.player)
-                        self.current_npc.complete_quest(self.player)
-                        self.current_npc.quest_failed = False
-                        
-                        # Play success sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_complete")
-                        
-                        # Show user feedback
-                        user_feedback = quest_data.get("user_feedback", ["Отличная работа!"])
-                        self.ui.start_dialogue(user_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
-                    else:
-                        # Quest failed
-                        self.current_npc.fail_quest()
-                        self.quest_manager.active_quests.pop(quest_id, None)
-                        
-                        # Play failure sound
-                        if self.sound_manager:
-                            self.sound_manager.play_sound("quest_fail")
-                        
-                        # Show failure feedback
-                        failure_feedback = ["Не получилось! Попробуй еще раз!"]
-                        self.ui.start_dialogue(failure_feedback, self.current_npc.name)
-                        self.state = DIALOGUE
+                    minigame = self.minigame_manager.create("color_picker", colors_needed=colors_needed, time_limit=time_limit)
+                    self.scenes.push(MinigameScene(minigame),
+                                     lambda success: self.finish_minigame_quest(quest_id, quest_data, success))
                 
                 elif quest_data["type"] == "fetch":
                     # Start fetch quest - player needs to collect items
@@ -530,73 +439,141 @@ class Game:
                 self.ui.start_dialogue(["Квест уже выполнен! Спасибо за помощь!"], self.current_npc.name)
                 self.state = DIALOGUE
     
-    def run_minigame(self, minigame_id):
-        """Run specified minigame"""
-        # Play minigame music
-        if self.sound_manager:
-            self.sound_manager.play_music("minigame")
+    def finish_minigame_quest(self, quest_id, quest_data, success, check_win=False):
+        """Apply a minigame result to its quest (called when the minigame scene ends)"""
+        if success:
+            self.quest_manager.mark_minigame_completed(quest_id)
+            self.quest_manager.complete_quest(quest_id, self.player)
+            self.current_npc.complete_quest(self.player)
+            self.current_npc.quest_failed = False  # Reset failure state
+            
+            # Play success sound
+            if self.sound_manager:
+                self.sound_manager.play_sound("quest_complete")
+            
+            # Show user feedback immediately after success
+            user_feedback = quest_data.get("user_feedback", ["Отличная работа!"])
+            self.ui.start_dialogue(user_feedback, self.current_npc.name)
+            self.state = DIALOGUE
+            
+            # Check win condition
+            if check_win and self.player.current_users >= TARGET_USERS:
+                self.game_won = True
+        else:
+            # Quest failed
+            self.current_npc.fail_quest()
+            self.quest_manager.active_quests.pop(quest_id, None)
+            
+            # Play failure sound
+            if self.sound_manager:
+                self.sound_manager.play_sound("quest_fail")
+            
+            # Show failure feedback
+            failure_feedback = ["Не получилось! Попробуй еще раз!"]
+            self.ui.start_dialogue(failure_feedback, self.current_npc.name)
+            self.state = DIALOGUE
         
-        result = False
-        if minigame_id == "swift_debug":
-            result = self.minigame_manager.run_swift_debug()
-        elif minigame_id == "ai_training":
-            result = self.minigame_manager.run_ai_training()
-        elif minigame_id == "ts_quiz":
-            result = self.minigame_manager.run_ts_quiz()
-        elif minigame_id == "memory_leak_hunter":
-            result = self.minigame_manager.run_memory_leak_hunter()
-        elif minigame_id == "react_debug":
-            result = self.minigame_manager.run_react_debug()
-        elif minigame_id == "mobile_debug":
-            result = self.minigame_manager.run_mobile_debug()
-        elif minigame_id == "devops_pipeline":
-            result = self.minigame_manager.run_devops_pipeline()
-        elif minigame_id == "qa_testing":
-            result = self.minigame_manager.run_qa_testing()
-        elif minigame_id == "boss_challenge":
-            result = self.minigame_manager.run_boss_challenge()
-        elif minigame_id == "treasure_collector":
-            result = self.minigame_manager.run_treasure_collector()
-        elif minigame_id == "api_architect":
-            result = self.minigame_manager.run_api_architect()
-        elif minigame_id == "ui_designer":
-            result = self.minigame_manager.run_ui_designer()
+        # Feedback is not a quest offer: closing it must not start the quest again
+        self.current_npc = None
+    
+    def finish_boss_quest(self, quest_id, quest_data, success):
+        """Apply the boss battle result, then show the matching ending"""
+        if success:
+            self.quest_manager.mark_minigame_completed(quest_id)
+            self.quest_manager.complete_quest(quest_id, self.player)
+            self.current_npc.complete_quest()
+            self.current_npc.quest_failed = False
+            
+            # Play success sound
+            if self.sound_manager:
+                self.sound_manager.play_sound("quest_complete")
+            
+            feedback = quest_data.get("user_feedback", ["НЕВЕРОЯТНО! Ты победил босса!"])
         else:
-            result = True  # Default success for unknown minigames
+            # Boss battle failed
+            self.current_npc.fail_quest()
+            self.quest_manager.active_quests.pop(quest_id, None)
+            
+            # Play failure sound
+            if self.sound_manager:
+                self.sound_manager.play_sound("quest_fail")
+            
+            feedback = ["Босс оказался сильнее! Попробуй еще раз!"]
         
-        # Return to previous music
+        def after_ending(result):
+            # Show feedback once the ending screen is closed
+            self.ui.start_dialogue(feedback, self.current_npc.name)
+            self.state = DIALOGUE
+            
+            # Check win condition
+            if success and self.player.current_users >= TARGET_USERS:
+                self.game_won = True
+            
+            self.current_npc = None
+        
+        self.scenes.push(EndingScreen(self.screen, is_victory=success), after_ending)
+    
+    def restore_music(self):
+        """Return to the music of the place the player is in"""
         if self.in_mentor_location and self.sound_manager:
             self.sound_manager.play_music("mentor_location")
         elif self.sound_manager:
             self.sound_manager.play_music("main_theme")
+    
+    def run_minigame(self, minigame_id, on_finish):
+        """Start specified minigame as a scene; on_finish(success) is called when it ends"""
+        # Module of the minigame is imported on first use (see minigames.get_minigame_class)
+        minigame = self.minigame_manager.create(minigame_id)
+        
+        if minigame is None:
+            on_finish(True)  # Default success for unknown minigames
+            return
+        
+        # Play minigame music
+        if self.sound_manager:
+            self.sound_manager.play_music("minigame")
         
-        return result
+        def finished(result):
+            if self.sound_manager:
+                self.sound_manager.play_stinger("minigame_win" if result else "minigame_lose")
+            self.restore_music()
+            on_finish(result)
+        
+        self.scenes.push(MinigameScene(minigame), finished)
     
-    def run_boss_battle(self):
-        """Run boss battle"""
+    def run_boss_battle(self, on_finish):
+        """Start boss battle as a scene; on_finish(success) is called when it ends"""
         try:
-            # Play boss battle music
-            if self.sound_manager:
-                self.sound_manager.play_music("minigame")  # Use minigame music for boss battle
-            
             # Create boss battle
             boss_battle = BossBattle(self.screen, self.player.current_users)
-            result = boss_battle.run_battle()
-            
-            # Return to previous music
-            if self.in_mentor_location and self.sound_manager:
-                self.sound_manager.play_music("mentor_location")
-            elif self.sound_manager:
-                self.sound_manager.play_music("main_theme")
-            
-            return result
         except Exception as e:
             print(f"❌ Ошибка в битве с боссом: {e}")
-            return False
+            on_finish(False)
+            return
+        
+        # Play boss battle music
+        if self.sound_manager:
+            self.sound_manager.play_music("minigame")  # Use minigame music for boss battle
+        
+        def finished(result):
+            self.restore_music()
+            on_finish(result)
+        
+        self.scenes.push(boss_battle, finished)
     
     def update(self, dt):
-        """Update game state"""
-        if self.state == EXPLORATION:
+        """Update game state by one fixed simulation step (dt seconds)"""
+        # State before this step: rendering interpolates from it
+        self.player.previous_position.update(self.player.position)
+        self.level.previous_camera.update(self.level.camera_target)
+        
+        perf = self.perf
+        
+        if self.scenes.active:
+            # Minigame on screen: the world stands still, everything below keeps running
+            with perf.section("update.scenes"):
+                self.scenes.update(dt)
+        elif self.state == EXPLORATION:
             if self.in_mentor_location:
                 # Update player in mentor location
                 self.player.get_input()
@@ -618,18 +595,13 @@ class Game:
                 if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
                     dx = mentor_speed * dt
                 
-                # Play footstep sound if moving
-                if (dx != 0 or dy != 0) and self.sound_manager:
-                    current_time = pygame.time.get_ticks()
-                    if current_time - self.last_footstep_time > self.footstep_interval:
-                        self.sound_manager.play_footstep()
-                        self.last_footstep_time = current_time
-                
-                # Update player animation even in mentor location
-                self.player.update(dt)
+                # Update player animation (and footsteps) even in mentor location
+                with perf.section("update.player"):
+                    self.player.update(dt)
                 
                 # Update position through mentor location manager
-                self.mentor_location_manager.update_player_movement(dx, dy)
+                with perf.section("update.mentor_location"):
+                    self.mentor_location_manager.update_player_movement(dx, dy)
                 
                 # Update player position to match mentor location
                 new_pos = self.mentor_location_manager.get_player_position()
@@ -637,43 +609,39 @@ class Game:
                 self.player.position.y = new_pos[1]
                 self.player.rect.center = (new_pos[0], new_pos[1])
             else:
-                # Normal exploration
-                old_pos = self.player.position.copy()
-                self.player.update(dt)
-                self.level.update(dt, self.player)
-                
-                # Play footstep sound if moving
-                if self.player.position != old_pos and self.sound_manager:
-                    current_time = pygame.time.get_ticks()
-                    if current_time - self.last_footstep_time > self.footstep_interval:
-                        self.sound_manager.play_footstep()
-                        self.last_footstep_time = current_time
+                # Normal exploration (Player.update plays the footsteps)
+                with perf.section("update.player"):
+                    self.player.update(dt)
+                with perf.section("update.level"):
+                    self.level.update(dt, self.player)
         
         # Update game stats
         self.game_stats["users"] = self.player.current_users
         
         # Update improvement manager
         if self.improvement_manager:
-            self.improvement_manager.update(dt)
+            with perf.section("update.improvement_manager"):
+                self.improvement_manager.update(dt)
         
-        # Update achievements
-        if self.achievement_manager:
-            self.achievement_manager.update(self.game_stats)
+        # Music crossfades
+        if self.sound_manager:
+            self.sound_manager.update(dt)
         
         # Update UI animations
-        self.ui.update_journal_gif_background(dt)
-        self.ui.update_quest_gif_background(dt)
-        self.ui.update_typing_animation(dt)
-        
-        # Update minigame GIF animations
-        self.minigame_manager.update_minigame_gif_background(dt)
+        with perf.section("update.ui_animations"):
+            self.ui.update_journal_gif_background(dt)
+            self.ui.update_quest_gif_background(dt)
+            self.ui.update_typing_animation(dt)
         
         # Auto-save
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         if current_time - self.last_autosave > self.autosave_interval:
             if self.save_system:
-                self.save_system.auto_save(self)
+                with perf.section("update.autosave"):
+                    self.save_system.auto_save(self)
             self.last_autosave = current_time
+        if self.save_system:
+            self.save_system.poll_results()
         
         # Check for win condition
         if self.player.current_users >= TARGET_USERS and not self.game_won:
@@ -719,43 +687,123 @@ class Game:
     
     def draw(self):
         """Draw game"""
+        if self.scenes.active:
+            if self.dirty_renderer:
+                self.dirty_renderer.invalidate()
+            self.draw_scene()
+            return
+        
+        if self.dirty_renderer:
+            if self.can_draw_dirty():
+                self.draw_dirty()
+                return
+            # Everything below draws the whole screen
+            self.dirty_renderer.invalidate()
+        
+        perf = self.perf
         self.screen.fill(BLACK)
         
         if self.state == EXPLORATION or self.state == DIALOGUE:
             if self.in_mentor_location:
                 # Draw mentor location with player
-                self.mentor_location_manager.draw_current_location(self.screen, self.player)
+                with perf.section("draw.mentor_location"):
+                    self.mentor_location_manager.draw_current_location(self.screen, self.player)
             else:
-                # Draw main level
-                self.level.draw(self.screen)
+                # Draw main level (map, then NPCs on top)
+                with perf.section("draw.level"):
+                    self.level.draw_background(self.screen)
+                with perf.section("draw.npcs"):
+                    self.level.draw_npcs(self.screen)
                 
                 # Draw player
-                self.player.draw(self.screen, self.level.camera_offset)
+                with perf.section("draw.player"):
+                    self.player.draw(self.screen, self.level.camera_offset)
             
             # Draw UI
-            self.ui.display_hud(self.screen, self.player)
-            
-            if self.state == DIALOGUE:
-                self.ui.display_dialogue(self.screen)
+            with perf.section("draw.hud"):
+                self.ui.display_hud(self.screen, self.player)
+                
+                if self.state == DIALOGUE:
+                    self.ui.display_dialogue(self.screen)
             
             # Draw journal
-            self.ui.display_journal(self.screen, self.player, self.quest_manager)
+            with perf.section("draw.journal"):
+                self.ui.display_journal(self.screen, self.player, self.quest_manager)
             
             # Draw improvement system elements
             if self.improvement_manager:
-                self.improvement_manager.draw_progress_bars(self.screen, self.player, self.quest_manager)
-                self.improvement_manager.draw_reward_animations(self.screen)
-                self.improvement_manager.draw_active_events(self.screen)
+                with perf.section("draw.progress_bars"):
+                    self.improvement_manager.draw_progress_bars(self.screen, self.player, self.quest_manager)
+                    self.improvement_manager.draw_reward_animations(self.screen)
+                    self.improvement_manager.draw_active_events(self.screen)
             
             # Draw achievement notifications
             if self.achievement_manager:
-                self.achievement_manager.draw_notifications(self.screen)
+                with perf.section("draw.notifications"):
+                    self.achievement_manager.draw_notifications(self.screen)
             
             # Show win message
             if self.game_won and not self.ui.dialogue_active:
                 self.draw_victory_overlay()
         
-        pygame.display.flip()
+        self.perf.draw(self.screen)
+        with self.perf.section("draw.present"):
+            pygame.display.flip()
+    
+    def draw_scene(self):
+        """Draw the active scene (minigame, battle, ending) with achievement popups on top"""
+        self.screen.fill(BLACK)
+        with self.perf.section("draw.scene"):
+            self.scenes.draw(self.screen)
+        if self.achievement_manager:
+            with self.perf.section("draw.notifications"):
+                self.achievement_manager.draw_notifications(self.screen)
+        self.perf.draw(self.screen)
+        with self.perf.section("draw.present"):
+            pygame.display.flip()
+    
+    def can_draw_dirty(self):
+        """Dirty rects work on the main map; mentor rooms and victory redraw everything"""
+        return (self.state in (EXPLORATION, DIALOGUE) and not self.in_mentor_location
+                and not (self.game_won and not self.ui.dialogue_active))
+    
+    def draw_map_background(self, surface):
+        """Static part of the frame: map under the current camera"""
+        surface.fill(BLACK)
+        self.level.draw_background(surface)
+    
+    def draw_dirty(self):
+        """Draw the main map frame with dirty rects: same layers as draw(), each reports its area"""
+        renderer = self.dirty_renderer
+        perf = self.perf
+        camera = (int(self.level.camera_offset.x), int(self.level.camera_offset.y))
+        with perf.section("draw.level"):
+            renderer.begin_frame(self.screen, (camera, self.screen.get_size()), self.draw_map_background)
+        
+        with perf.section("draw.npcs"):
+            renderer.add(self.level.draw_npcs(self.screen))
+        with perf.section("draw.player"):
+            renderer.add(self.player.draw(self.screen, self.level.camera_offset))
+        with perf.section("draw.hud"):
+            renderer.add(self.ui.display_hud(self.screen, self.player))
+            if self.state == DIALOGUE:
+                renderer.add(self.ui.display_dialogue(self.screen))
+        with perf.section("draw.journal"):
+            renderer.add(self.ui.display_journal(self.screen, self.player, self.quest_manager))
+        
+        if self.improvement_manager:
+            with perf.section("draw.progress_bars"):
+                renderer.add(self.improvement_manager.draw_progress_bars(self.screen, self.player, self.quest_manager))
+                renderer.add(self.improvement_manager.draw_reward_animations(self.screen))
+                renderer.add(self.improvement_manager.draw_active_events(self.screen))
+        
+        if self.achievement_manager:
+            with perf.section("draw.notifications"):
+                renderer.add(self.achievement_manager.draw_notifications(self.screen))
+        
+        renderer.add(perf.draw(self.screen))
+        with perf.section("draw.present"):
+            renderer.end_frame(self.screen)
     
     def draw_victory_overlay(self):
         """Draw victory overlay"""
@@ -764,19 +812,43 @@ class Game:
         overlay.fill(GREEN)
         self.screen.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 72)
+        font = get_asset_cache().get_font(None, 72)
         text = font.render("VICTORY!", True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
         self.screen.blit(text, text_rect)
     
+    def interpolate(self, alpha):
+        """Place the camera and the player between the last two simulation steps"""
+        if not self.in_mentor_location:
+            self.player.interpolate(alpha)
+            self.level.interpolate(alpha)
+    
     def run(self):
-        """Main game loop"""
+        """Main game loop: fixed-step simulation, rendering at RENDER_FPS (0 - uncapped)"""
+        self.clock.tick()  # loading time is not game time
+        perf = self.perf
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            self.game_clock.add_frame_time(self.clock.tick(RENDER_FPS) / 1000.0)
+            perf.begin_frame()
             
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+            with perf.section("events"):
+                self.handle_events()
+            while self.game_clock.consume_step():
+                with perf.section("update"):
+                    self.update(self.game_clock.step)
+            
+            self.interpolate(self.game_clock.alpha)
+            with perf.section("draw"):
+                self.draw()
+            perf.end_frame()
+        
+        # A trace that is still recording is written on exit
+        if perf.tracing:
+            perf.stop_trace()
+        
+        # Don't lose a save that is still being written in background
+        if self.save_system:
+            self.save_system.flush()
         
         pygame.quit()
         sys.exit()
@@ -784,14 +856,20 @@ class Game:
 def run_game_with_menu():
     """Run the game with main menu"""
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = set_display_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("nQuester: Incubator Rush")
     
-    # Initialize systems
-    init_sprite_loader()
-    init_sound_manager()
-    init_achievement_manager()
-    init_save_system()
+    profiler = get_startup_profiler()
+    
+    # Initialize systems (images decode on a thread pool meanwhile)
+    start_asset_preload()
+    with profiler.phase("sprite_loader"):
+        init_sprite_loader()
+    with profiler.phase("sound_manager"):
+        init_sound_manager()
+    with profiler.phase("achievements_and_saves"):
+        init_achievement_manager()
+        init_save_system()
     
     # Create a global player for settings
     from player import Player
@@ -800,14 +878,14 @@ def run_game_with_menu():
     # Main menu loop
     while True:
         # Show main menu
-        menu = MainMenu(screen)
-        result = menu.run()
+        with profiler.phase("main_menu"):
+            menu = MainMenu(screen)
+        result = run_scene(menu)
         
         if result == "start_game":
             # Show intro scene first
             from intro_scene import IntroScene
-            intro = IntroScene(screen)
-            intro_result = intro.run()
+            intro_result = run_scene(IntroScene(screen))
             
             if intro_result == "start_game":
                 # Start the actual game
@@ -829,4 +907,6 @@ def run_game_with_menu():
     sys.exit()
 
 if __name__ == "__main__":
+    if "--profile-startup" in sys.argv:
+        get_startup_profiler().enable()
     run_game_with_menu() 
\ No newline at end of file
@@ -2,15 +2,21 @@ import pygame
 import random
 import math
 import os
-from PIL import Image
 from settings import *
 from intro_scene import IntroScene
 from sound_manager import get_sound_manager
 from settings_screen import SettingsScreen
 from achievements_screen import AchievementsScreen
+from gif_background import AnimatedBackground
+from startup import get_startup_profiler
+from scenes import Scene
 
-class MainMenu:
+class MainMenu(Scene):
+    # Пункты меню по порядку -> результат сцены
+    MENU_RESULTS = ["start_game", "how_to_play", "achievements", "settings", "exit"]
+    
     def __init__(self, screen):
+        super().__init__()
         self.screen = screen
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 36)
@@ -26,64 +32,23 @@ class MainMenu:
             "❌ Выход"
         ]
         
-        # Load GIF background
-        self.gif_frames = []
-        self.current_frame = 0
-        self.frame_delay = 0.1  # 100ms per frame
-        self.last_frame_time = 0
-        self.load_gif_background()
+        # GIF background (frames are decoded lazily and shared by path)
+        self.gif_background = AnimatedBackground("the world is ours.gif", (SCREEN_WIDTH, SCREEN_HEIGHT), overlay_alpha=100)
         
         # Fallback to pixel background if GIF fails
-        if not self.gif_frames:
+        self.background = None
+        if not self.gif_background.available:
             self.background = self.generate_pixel_background()
-        else:
-            self.background = self.gif_frames[0]
         
         # Animation
         self.animation_time = 0
         self.particles = []
         self.generate_particles()
-    
-    def load_gif_background(self):
-        """Load GIF background frames"""
-        try:
-            gif_path = "the world is ours.gif"
-            if os.path.exists(gif_path):
-                # Open GIF with PIL
-                gif = Image.open(gif_path)
-                
-                # Extract frames
-                frame_count = getattr(gif, 'n_frames', 1)
-                for frame in range(frame_count):
-                    gif.seek(frame)
-                    # Convert PIL image to pygame surface
-                    frame_surface = pygame.image.fromstring(gif.convert('RGBA').tobytes(), gif.size, 'RGBA')
-                    
-                    # Scale to fit screen
-                    frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                    
-                    # Add dark overlay for better text visibility
-                    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                    overlay.set_alpha(100)
-                    overlay.fill((0, 0, 0))
-                    frame_surface.blit(overlay, (0, 0))
-                    
-                    self.gif_frames.append(frame_surface)
-                
-                print(f"✅ Загружено {len(self.gif_frames)} кадров GIF-фона")
-            else:
-                print(f"⚠️ GIF файл не найден: {gif_path}")
-        except Exception as e:
-            print(f"❌ Ошибка загрузки GIF: {e}")
+        self.first_frame = True
     
     def update_gif_background(self, dt):
         """Update GIF animation"""
-        if self.gif_frames:
-            self.last_frame_time += dt
-            if self.last_frame_time >= self.frame_delay:
-                self.current_frame = (self.current_frame + 1) % len(self.gif_frames)
-                self.background = self.gif_frames[self.current_frame]
-                self.last_frame_time = 0
+        self.gif_background.update(dt)
     
     def generate_pixel_background(self):
         """Generate a startup/tech themed pixel art background"""
@@ -208,7 +173,8 @@ class MainMenu:
     def draw_menu(self):
         """Draw the main menu"""
         # Draw background
-        self.screen.blit(self.background, (0, 0))
+        if not self.gif_background.draw(self.screen):
+            self.screen.blit(self.background, (0, 0))
         
         # Draw particles
         self.draw_particles()
@@ -303,46 +269,26 @@ class MainMenu:
             self.screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
             print("��️ Fullscreen: ON")
     
-    def run(self):
-        """Run the main menu loop"""
-        clock = pygame.time.Clock()
-        running = True
-        
-        while running:
-            dt = clock.tick(60) / 1000.0
-            self.animation_time += dt
-            
-            # Update particles
-            self.update_particles(dt)
-            
-            # Update GIF background
-            self.update_gif_background(dt)
-            
-            # Handle events
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    return "exit"
-            
-            # Handle input
-            result = self.handle_input(events)
-            if result is not None:
-                if result == 0:  # Start game
-                    return "start_game"
-                elif result == 1:  # How to play
-                    return "how_to_play"
-                elif result == 2:  # Achievements
-                    return "achievements"
-                elif result == 3:  # Settings
-                    return "settings"
-                elif result == 4:  # Exit
-                    return "exit"
-            
-            # Draw
-            self.draw_menu()
-            pygame.display.flip()
+    def handle_event(self, event):
+        result = self.handle_input([event])
+        if result is not None:
+            self.finish(self.MENU_RESULTS[result])
+    
+    def update(self, dt):
+        super().update(dt)
+        self.animation_time += dt
+        self.update_particles(dt)
+        self.update_gif_background(dt)
+    
+    def draw(self, screen):
+        self.screen = screen
+        self.draw_menu()
         
-        return "exit"
+        if self.first_frame:
+            self.first_frame = False
+            profiler = get_startup_profiler()
+            profiler.mark("first_menu_frame")
+            profiler.report()
 
 def show_how_to_play(screen):
     """Show how to play screen"""
@@ -2,6 +2,9 @@ import pygame
 import random
 import os
 from settings import *
+from sprite_loader import get_asset_cache, surface_bytes
+from asset_bake import get_asset_baker
+from text_cache import get_text_cache
 
 class MentorLocation:
     def __init__(self, mentor_name, specialty):
@@ -27,38 +30,17 @@ class MentorLocation:
     
     def load_mentor_background(self):
         """Load individual background for each mentor"""
-        locations_path = "Base and Full Map + HD Images/locations/"
-        
-        # Map mentors to specific background images
-        mentor_backgrounds = {
-            "Alikhan": "download.jpg",  # iOS developer
-            "Alibeck": "download (1).jpg",  # AI/ML
-            "Bahredin": "download (2).jpg",  # TypeScript
-            "Bahaudin": "download (3).jpg",  # Backend
-            "Gaziz": "Fantastic Buildings_ Modern.jpg",  # Frontend
-            "Shoqan": "smockup_0.jpg",  # Mobile
-            "Zhasulan": "d7c191ec41394bd18a55762e78961873.jpg",  # iOS
-            "Aimurat": "download.jpg",  # AI/ML (reuse)
-            "Bernar": "Fantastic Buildings_ Modern.jpg"  # BOSS (reuse)
-        }
-        
-        background_file = mentor_backgrounds.get(self.mentor_name, "download.jpg")
-        background_path = os.path.join(locations_path, background_file)
+        # Background images are assigned in settings.MENTORS
+        background_file = MENTORS[self.mentor_name][1] if self.mentor_name in MENTORS else "download.jpg"
+        background_path = os.path.join(LOCATIONS_PATH, background_file)
         
         try:
             if os.path.exists(background_path):
-                background = pygame.image.load(background_path)
-                # Scale to fit screen
-                bg_w, bg_h = background.get_size()
-                scale = max(SCREEN_WIDTH / bg_w, SCREEN_HEIGHT / bg_h)
-                new_w, new_h = int(bg_w * scale), int(bg_h * scale)
-                scaled_bg = pygame.transform.scale(background, (new_w, new_h))
-                
-                # Create surface and center the background
-                surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                surf.blit(scaled_bg, ((SCREEN_WIDTH - new_w) // 2, (SCREEN_HEIGHT - new_h) // 2))
-                print(f"✅ Загружен фон для {self.mentor_name}: {background_file}")
-                return surf
+                # Baked screen-sized cover, shared between mentors with the same background
+                background = get_asset_baker().get_image(background_path, "cover", (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+                if background:
+                    print(f"✅ Загружен фон для {self.mentor_name}: {background_file}")
+                    return background
             else:
                 print(f"⚠️ Файл фона не найден: {background_path}")
         except Exception as e:
@@ -69,18 +51,11 @@ class MentorLocation:
     
     def load_galletcity_background(self):
         try:
-            from sprite_loader import get_sprite_loader
-            sprite_loader = get_sprite_loader()
-            background = sprite_loader.get_background("galletcity")
+            # Cover mode: fill the screen, crop excess (baked once)
+            galletcity_path = os.path.join(MAPS_PATH, "galletcity.png")
+            background = get_asset_baker().get_image(galletcity_path, "cover", (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
             if background:
-                # Cover mode: fill the screen, crop excess
-                bg_w, bg_h = background.get_size()
-                scale = max(SCREEN_WIDTH / bg_w, SCREEN_HEIGHT / bg_h)
-                new_w, new_h = int(bg_w * scale), int(bg_h * scale)
-                scaled_bg = pygame.transform.scale(background, (new_w, new_h))
-                surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                surf.blit(scaled_bg, ((SCREEN_WIDTH - new_w) // 2, (SCREEN_HEIGHT - new_h) // 2))
-                return surf
+                return background
         except Exception as e:
             print(f"Error loading galletcity background: {e}")
         bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -90,14 +65,11 @@ class MentorLocation:
     def load_mentor_sprite(self):
         """Load mentor-specific sprite"""
         try:
-            from sprite_loader import get_sprite_loader
-            sprite_loader = get_sprite_loader()
-            
-            # Try to load mentor face first
-            self.mentor_sprite = sprite_loader.get_mentor_face(self.mentor_name)
-            if self.mentor_sprite:
-                # Scale to appropriate size for location display
-                self.mentor_sprite = pygame.transform.scale(self.mentor_sprite, (120, 120))
+            # Mentor photo pre-scaled for location display
+            face_path = os.path.join(MENTORS_PATH, f"{self.mentor_name}.png")
+            mentor_sprite = get_asset_baker().get_image(face_path, "scale", (120, 120))
+            if mentor_sprite:
+                self.mentor_sprite = mentor_sprite
                 print(f"Loaded mentor sprite for {self.mentor_name}")
             else:
                 print(f"Failed to load mentor sprite for {self.mentor_name}")
@@ -155,44 +127,32 @@ class MentorLocation:
         screen.blit(self.background, (0, 0))
         
         # Draw mentor sprite (larger, like on main map) - fixed position on right
+        # Sprite is already scaled to 120x120 in load_mentor_sprite
         if self.mentor_sprite:
-            # Use fixed mentor position
-            large_mentor = pygame.transform.scale(self.mentor_sprite, (120, 120))
-            screen.blit(large_mentor, (self.mentor_x, self.mentor_y))
+            screen.blit(self.mentor_sprite, (self.mentor_x, self.mentor_y))
         
         # Draw player if provided - use actual position from mentor location
         if player:
             # Use the stored position in mentor location, not player's global position
             player.draw_at_position(screen, (self.player_x, self.player_y))
         
-        # Draw mentor name with shadow for better visibility
-        font_large = pygame.font.Font(None, 48)
-        name_text = font_large.render(self.mentor_name, True, (255, 255, 255))
-        name_shadow = font_large.render(self.mentor_name, True, (0, 0, 0))
-        name_rect = name_text.get_rect(center=(self.mentor_x + 60, self.mentor_y - 40))
+        asset_cache = get_asset_cache()
+        text_cache = get_text_cache()
         
-        # Draw shadow first
-        shadow_rect = name_rect.copy()
-        shadow_rect.x += 2
-        shadow_rect.y += 2
-        screen.blit(name_shadow, shadow_rect)
-        screen.blit(name_text, name_rect)
+        # Draw mentor name with shadow for better visibility
+        font_large = asset_cache.get_font(None, 48)
+        name_label = text_cache.render(self.mentor_name, font_large, (255, 255, 255), shadow=(0, 0, 0))
+        name_rect = text_cache.get_label_rect(name_label, (2, 2), center=(self.mentor_x + 60, self.mentor_y - 40))
+        screen.blit(name_label, name_rect)
         
         # Draw specialty with shadow
-        font_medium = pygame.font.Font(None, 32)
-        specialty_text = font_medium.render(f"Специализация: {self.specialty}", True, (255, 255, 255))
-        specialty_shadow = font_medium.render(f"Специализация: {self.specialty}", True, (0, 0, 0))
-        specialty_rect = specialty_text.get_rect(center=(self.mentor_x + 60, self.mentor_y - 10))
-        
-        # Draw shadow first
-        shadow_rect = specialty_rect.copy()
-        shadow_rect.x += 2
-        shadow_rect.y += 2
-        screen.blit(specialty_shadow, shadow_rect)
-        screen.blit(specialty_text, specialty_rect)
+        font_medium = asset_cache.get_font(None, 32)
+        specialty_label = text_cache.render(f"Специализация: {self.specialty}", font_medium, (255, 255, 255), shadow=(0, 0, 0))
+        specialty_rect = text_cache.get_label_rect(specialty_label, (2, 2), center=(self.mentor_x + 60, self.mentor_y - 10))
+        screen.blit(specialty_label, specialty_rect)
         
         # Draw instructions
-        font_medium = pygame.font.Font(None, 28)  # Increased font size
+        font_medium = asset_cache.get_font(None, 28)  # Increased font size
         instructions = [
             "WASD - движение",
             "Нажми E для взаимодействия",
@@ -200,7 +160,7 @@ class MentorLocation:
         ]
         
         for i, instruction in enumerate(instructions):
-            inst_text = font_medium.render(instruction, True, (255, 255, 255))
+            inst_text = text_cache.render(instruction, font_medium, (255, 255, 255))
             inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100 + i * 30))  # Increased spacing
             screen.blit(inst_text, inst_rect)
 
@@ -211,27 +171,22 @@ class MentorLocationManager:
         self.create_locations()
     
     def create_locations(self):
-        """Create locations for all mentors"""
-        mentors = [
-            ("Alikhan", "iOS"),
-            ("Alibeck", "AI/ML"),
-            ("Bahredin", "TypeScript"),
-            ("Bahaudin", "Backend"),
-            ("Gaziz", "Frontend"),
-            ("Shoqan", "Frontend"),  # Fixed: changed from Mobile to Frontend
-            ("Zhasulan", "iOS"),
-            ("Aimurat", "AI/ML"),
-            ("Bernar", "BOSS"),
-            ("Diana", "Frontend"),  # Added Diana mentor
-            ("Tamyrlan", "Backend")  # Added Tamyrlan mentor
-        ]
-        
+        """Create locations for all mentors (roster in settings.MENTORS)"""
         print("Creating mentor locations...")
-        for mentor_name, specialty in mentors:
+        for mentor_name, (specialty, _) in MENTORS.items():
             print(f"Creating location for {mentor_name} ({specialty})")
             self.locations[mentor_name] = MentorLocation(mentor_name, specialty)
         print("Mentor locations created!")
     
+    def get_memory_bytes(self):
+        """Память фонов и спрайтов комнат менторов (общий фон считается один раз)"""
+        surfaces = {}
+        for location in self.locations.values():
+            for surface in [location.background, location.mentor_sprite]:
+                if surface is not None:
+                    surfaces[id(surface)] = surface
+        return surface_bytes(list(surfaces.values()))
+    
     def enter_location(self, mentor_name):
         """Enter mentor's personal location"""
         if mentor_name in self.locations:
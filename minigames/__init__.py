@@ -0,0 +1,117 @@
+import importlib
+import pkgutil
+import pygame
+from settings import *
+from gif_background import AnimatedBackground
+from text_cache import get_text_cache
+from minigames.base import Minigame, MinigameScene, register_minigame, minigame_registry
+
+def get_minigame_class(minigame_id):
+    """
+    Класс мини-игры по minigame_id. Модуль игры (minigames/<minigame_id>.py)
+    импортируется только когда игра понадобилась впервые. None - такой игры нет.
+    """
+    if minigame_id not in minigame_registry:
+        if not minigame_id or not minigame_id.isidentifier():
+            return None
+        module_name = f"{__name__}.{minigame_id}"
+        try:
+            importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            # Ошибки импорта внутри самой игры не прячем
+            if e.name != module_name:
+                raise
+            print(f"⚠️ Мини-игра не найдена: {minigame_id}")
+            return None
+    return minigame_registry.get(minigame_id)
+
+def available_minigames():
+    """id всех мини-игр пакета (модули не импортируются)"""
+    return sorted(info.name for info in pkgutil.iter_modules(__path__) if info.name != "base")
+
+class MinigameManager:
+    """
+    Общее для всех мини-игр: холст, шрифты, GIF-фон, события из главного цикла.
+    Сами игры - модули пакета minigames, они регистрируются под своим minigame_id
+    и загружаются по первому требованию (см. create).
+    """
+    def __init__(self, screen):
+        self.display = screen
+        # Холст мини-игр (сцена выводит его на экран в своем draw()) и GIF-фон
+        # существуют только пока идет мини-игра - см. load()/unload()
+        self.screen = None
+        self.minigame_gif_background = None
+        self.users = 0  # сколько сцен мини-игр сейчас на стеке
+        self.events = []
+        self.font_large = pygame.font.Font(None, 36)
+        self.font_medium = pygame.font.Font(None, 24)
+        self.font_small = pygame.font.Font(None, 18)
+    
+    def create(self, minigame_id, **params):
+        """Мини-игра для сцены (MinigameScene); None, если игры с таким id нет"""
+        minigame_class = get_minigame_class(minigame_id)
+        if minigame_class is None:
+            return None
+        return minigame_class(self, **params)
+    
+    def load(self):
+        """Общие ассеты мини-игр - перед первым кадром игры"""
+        self.users += 1
+        if self.screen is None:
+            # После F11 у дисплея новая поверхность
+            display = pygame.display.get_surface() or self.display
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(display)
+        if self.minigame_gif_background is None:
+            # GIF background for minigames (frames are shared with the UI)
+            self.minigame_gif_background = AnimatedBackground(MINIGAME_GIF_PATH, (SCREEN_WIDTH, SCREEN_HEIGHT), overlay_alpha=80)
+    
+    def unload(self):
+        """Отпустить холст и полноэкранный кадр GIF, когда мини-игра закончилась"""
+        self.users = max(0, self.users - 1)
+        if self.users:
+            return
+        self.screen = None
+        self.minigame_gif_background = None
+        self.events = []
+    
+    def poll_events(self):
+        """События, пришедшие из главного цикла с прошлого кадра"""
+        events = self.events
+        self.events = []
+        return events
+    
+    def pause(self, seconds, view=None):
+        """Показывать кадр view (по умолчанию - последний) seconds секунд (вместо pygame.time.wait, цикл игры не стоит)"""
+        while seconds > 0:
+            dt = yield view
+            seconds -= dt or 0
+            # Нажатия во время паузы не должны попасть в следующий экран
+            self.poll_events()
+    
+    def update_minigame_gif_background(self, dt):
+        """Update minigame GIF animation"""
+        self.minigame_gif_background.update(dt)
+    
+    def draw_minigame_background(self):
+        """Draw GIF background for minigames"""
+        if not self.minigame_gif_background.draw(self.screen):
+            # Fallback to black background
+            self.screen.fill(BLACK)
+    
+    def draw_text_with_background(self, text, font, color, position, bg_color=(0, 0, 0, 180)):
+        """Draw text with semi-transparent background for better visibility"""
+        # Text and background are composited once and reused from the text cache
+        label = get_text_cache().render(text, font, color, background=bg_color, padding=(10, 5))
+        
+        # Position background
+        bg_rect = label.get_rect()
+        if isinstance(position, tuple):
+            bg_rect.center = position
+        else:
+            bg_rect.center = position.center
+        
+        self.screen.blit(label, bg_rect)
+        text_rect = pygame.Rect(0, 0, bg_rect.width - 20, bg_rect.height - 10)
+        text_rect.center = bg_rect.center
+        
+        return text_rect
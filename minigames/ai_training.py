@@ -0,0 +1,97 @@
+import pygame
+import random
+from settings import *
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("ai_training")
+class AITraining(Minigame):
+    """Перетащи котиков в модель для обучения"""
+    
+    def run(self):
+        """AI Training minigame - drag cats to model"""
+        # Game objects
+        model_rect = pygame.Rect(SCREEN_WIDTH//2 - 50, SCREEN_HEIGHT//2 - 50, 100, 100)
+        
+        cats = []
+        dogs = []
+        
+        # Create cat and dog objects
+        for i in range(5):
+            cat_x = random.randint(50, SCREEN_WIDTH - 100)
+            cat_y = random.randint(100, SCREEN_HEIGHT - 200)
+            cats.append(pygame.Rect(cat_x, cat_y, 60, 40))
+        
+        for i in range(3):
+            dog_x = random.randint(50, SCREEN_WIDTH - 100)
+            dog_y = random.randint(100, SCREEN_HEIGHT - 200)
+            dogs.append(pygame.Rect(dog_x, dog_y, 60, 40))
+        
+        cats_trained = 0
+        dragging = None
+        drag_offset = (0, 0)
+        
+        def draw_frame():
+            # Draw minigame
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background("Train Your Brain", self.font_large, WHITE, (SCREEN_WIDTH//2, 50))
+            
+            # Instructions
+            instruction = f"Перетащите котиков к модели! ({cats_trained}/5)"
+            self.draw_text_with_background(instruction, self.font_medium, WHITE, (SCREEN_WIDTH//2, 80))
+            
+            # Draw model (brain)
+            pygame.draw.rect(self.screen, GREEN, model_rect)
+            brain_text = self.font_medium.render("🧠", True, WHITE)
+            brain_rect = brain_text.get_rect(center=model_rect.center)
+            self.screen.blit(brain_text, brain_rect)
+            
+            # Draw cats
+            for cat in cats:
+                pygame.draw.rect(self.screen, YELLOW, cat)
+                cat_text = self.font_small.render("🐱", True, BLACK)
+                cat_rect = cat_text.get_rect(center=cat.center)
+                self.screen.blit(cat_text, cat_rect)
+            
+            # Draw dogs (distractors)
+            for dog in dogs:
+                pygame.draw.rect(self.screen, GRAY, dog)
+                dog_text = self.font_small.render("🐶", True, BLACK)
+                dog_rect = dog_text.get_rect(center=dog.center)
+                self.screen.blit(dog_text, dog_rect)
+        
+        while cats_trained < 5:
+            dt = yield draw_frame
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check if clicking on a cat
+                    for i, cat in enumerate(cats):
+                        if cat.collidepoint(mouse_pos):
+                            dragging = ('cat', i)
+                            drag_offset = (mouse_pos[0] - cat.x, mouse_pos[1] - cat.y)
+                            break
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    if dragging and dragging[0] == 'cat':
+                        cat_index = dragging[1]
+                        if cats[cat_index].colliderect(model_rect):
+                            cats_trained += 1
+                        cats.pop(cat_index)  # Remove trained cat
+                    dragging = None
+                elif event.type == pygame.MOUSEMOTION:
+                    if dragging and dragging[0] == 'cat':
+                        mouse_pos = pygame.mouse.get_pos()
+                        cat_index = dragging[1]
+                        cats[cat_index].x = mouse_pos[0] - drag_offset[0]
+                        cats[cat_index].y = mouse_pos[1] - drag_offset[1]
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
+        
+        return True
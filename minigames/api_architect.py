@@ -0,0 +1,154 @@
+import pygame
+import random
+from settings import *
+from game_clock import get_ticks
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("api_architect")
+class ApiArchitect(Minigame):
+    """Собери API из эндпоинтов"""
+    
+    def run(self):
+        """Run API architect minigame"""
+        print("🎮 Запуск мини-игры: Архитектор API")
+        
+        # Game state
+        score = 0
+        max_score = 100
+        time_left = 120  # 2 minutes
+        game_start_time = get_ticks()
+        
+        # API endpoints to design
+        endpoints = [
+            {"name": "GET /users", "correct": "Получить список пользователей", "points": 20},
+            {"name": "POST /users", "correct": "Создать нового пользователя", "points": 20},
+            {"name": "PUT /users/{id}", "correct": "Обновить пользователя", "points": 20},
+            {"name": "DELETE /users/{id}", "correct": "Удалить пользователя", "points": 20},
+            {"name": "GET /users/{id}", "correct": "Получить пользователя по ID", "points": 20}
+        ]
+        
+        current_endpoint = 0
+        selected_option = 0
+        
+        # Options for each endpoint
+        options = [
+            ["Получить список пользователей", "Удалить всех пользователей", "Создать пользователя", "Обновить пользователя"],
+            ["Создать нового пользователя", "Удалить пользователя", "Получить пользователя", "Обновить пользователя"],
+            ["Обновить пользователя", "Создать пользователя", "Удалить пользователя", "Получить пользователя"],
+            ["Удалить пользователя", "Создать пользователя", "Обновить пользователя", "Получить пользователя"],
+            ["Получить пользователя по ID", "Удалить пользователя", "Создать пользователя", "Обновить пользователя"]
+        ]
+        
+        # Shuffle options for each endpoint to randomize positions
+        import random
+        for i in range(len(options)):
+            # Create a copy of options for this endpoint
+            endpoint_options = options[i].copy()
+            correct_answer = endpoints[i]["correct"]
+            
+            # Remove correct answer temporarily
+            endpoint_options.remove(correct_answer)
+            
+            # Shuffle wrong answers
+            random.shuffle(endpoint_options)
+            
+            # Insert correct answer at random position
+            correct_position = random.randint(0, len(endpoint_options))
+            endpoint_options.insert(correct_position, correct_answer)
+            
+            # Update options
+            options[i] = endpoint_options
+        
+        # Fonts
+        font_large = pygame.font.Font(None, 48)
+        font_medium = pygame.font.Font(None, 32)
+        font_small = pygame.font.Font(None, 24)
+        
+        running = True
+        
+        def draw_frame():
+            # Draw
+            self.screen.fill((20, 30, 50))
+            
+            # Title
+            title_text = "🏗️ АРХИТЕКТОР API"
+            title_surface = font_large.render(title_text, True, WHITE)
+            self.screen.blit(title_surface, (SCREEN_WIDTH // 2 - title_surface.get_width() // 2, 50))
+            
+            # Progress
+            progress_text = f"Прогресс: {current_endpoint + 1}/{len(endpoints)}"
+            progress_surface = font_medium.render(progress_text, True, WHITE)
+            self.screen.blit(progress_surface, (20, 120))
+            
+            # Score
+            score_text = f"Очки: {score}/{max_score}"
+            score_surface = font_medium.render(score_text, True, WHITE)
+            self.screen.blit(score_surface, (20, 150))
+            
+            # Time
+            time_text = f"Время: {int(time_left)}с"
+            time_color = (255, 255, 255) if time_left > 30 else (255, 0, 0)
+            time_surface = font_medium.render(time_text, True, time_color)
+            self.screen.blit(time_surface, (20, 180))
+            
+            if current_endpoint < len(endpoints):
+                # Current endpoint
+                endpoint_text = f"Спроектируй: {endpoints[current_endpoint]['name']}"
+                endpoint_surface = font_medium.render(endpoint_text, True, YELLOW)
+                self.screen.blit(endpoint_surface, (SCREEN_WIDTH // 2 - endpoint_surface.get_width() // 2, 220))
+                
+                # Options
+                option_y = 280
+                for i, option in enumerate(options[current_endpoint]):
+                    color = YELLOW if i == selected_option else WHITE
+                    option_surface = font_medium.render(f"{i+1}. {option}", True, color)
+                    self.screen.blit(option_surface, (SCREEN_WIDTH // 2 - option_surface.get_width() // 2, option_y))
+                    option_y += 40
+            
+            # Instructions
+            instructions = [
+                "WASD - выбор ответа",
+                "ENTER - подтвердить",
+                "Спроектируй REST API за 2 минуты!",
+                "ESC - выйти"
+            ]
+            
+            for i, instruction in enumerate(instructions):
+                inst_surface = font_small.render(instruction, True, GRAY)
+                self.screen.blit(inst_surface, (20, SCREEN_HEIGHT - 120 + i * 25))
+        
+        while running:
+            dt = yield draw_frame
+            
+            # Update time
+            current_time = get_ticks()
+            time_left = max(0, 120 - (current_time - game_start_time) / 1000)
+            
+            # Handle events
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+                    elif event.key == pygame.K_w or event.key == pygame.K_UP:
+                        selected_option = (selected_option - 1) % 4
+                    elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
+                        selected_option = (selected_option + 1) % 4
+                    elif event.key == pygame.K_RETURN:
+                        # Check answer
+                        if options[current_endpoint][selected_option] == endpoints[current_endpoint]["correct"]:
+                            score += endpoints[current_endpoint]["points"]
+                        
+                        # Move to next endpoint
+                        current_endpoint += 1
+                        selected_option = 0
+                        
+                        if current_endpoint >= len(endpoints):
+                            return score >= max_score * 0.8  # 80% to pass
+            
+            # Check time
+            if time_left <= 0:
+                return score >= max_score * 0.8
+        
+        return False
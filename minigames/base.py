@@ -0,0 +1,99 @@
+from abc import ABC, abstractmethod
+from settings import SCREEN_WIDTH
+from scenes import CoroutineScene
+
+# Зарегистрированные мини-игры: minigame_id -> класс
+minigame_registry = {}
+
+def register_minigame(minigame_id):
+    """Декоратор: зарегистрировать мини-игру под minigame_id из QuestManager.quests_data"""
+    def register(minigame_class):
+        minigame_class.minigame_id = minigame_id
+        minigame_registry[minigame_id] = minigame_class
+        return minigame_class
+    return register
+
+class Minigame(ABC):
+    """
+    Одна мини-игра. run(**params) - генератор шагов для CoroutineScene
+    (каждый yield отдает функцию, которая рисует текущее состояние),
+    load()/unload() - собственные ассеты игры (только пока она на экране).
+    Холст, шрифты и общие помощники отрисовки берутся у MinigameManager.
+    """
+    minigame_id = None
+    
+    def __init__(self, manager, **params):
+        self.manager = manager
+        self.params = params
+    
+    def load(self):
+        """Загрузить ассеты игры (перед первым кадром)"""
+        pass
+    
+    def unload(self):
+        """Отпустить ассеты игры (после последнего кадра)"""
+        pass
+    
+    @abstractmethod
+    def run(self, **params):
+        """Генератор игры: yield draw_frame на каждый шаг, return - результат"""
+    
+    @property
+    def screen(self):
+        return self.manager.screen
+    
+    @property
+    def font_large(self):
+        return self.manager.font_large
+    
+    @property
+    def font_medium(self):
+        return self.manager.font_medium
+    
+    @property
+    def font_small(self):
+        return self.manager.font_small
+    
+    def poll_events(self):
+        return self.manager.poll_events()
+    
+    def pause(self, seconds, view=None):
+        return self.manager.pause(seconds, view)
+    
+    def update_minigame_gif_background(self, dt):
+        self.manager.update_minigame_gif_background(dt)
+    
+    def draw_minigame_background(self):
+        self.manager.draw_minigame_background()
+    
+    def draw_text_with_background(self, text, font, color, position, bg_color=(0, 0, 0, 180)):
+        return self.manager.draw_text_with_background(text, font, color, position, bg_color)
+    
+    def message_frame(self, lines):
+        """Кадр-сообщение для pause: lines - [(текст, шрифт, цвет, y)], строки по центру экрана"""
+        labels = []
+        for text, font, color, y in lines:
+            label = font.render(text, True, color)
+            labels.append((label, label.get_rect(center=(SCREEN_WIDTH//2, y))))
+        
+        def draw_frame():
+            self.draw_minigame_background()
+            for label, rect in labels:
+                self.screen.blit(label, rect)
+        return draw_frame
+
+class MinigameScene(CoroutineScene):
+    """Сцена мини-игры: ассеты загружаются при входе и отпускаются при выходе"""
+    def __init__(self, minigame):
+        super().__init__(minigame.run(**minigame.params), minigame.manager)
+        self.minigame = minigame
+    
+    def enter(self):
+        self.minigame.manager.load()
+        self.minigame.load()
+        super().enter()
+    
+    def exit(self):
+        super().exit()
+        self.minigame.unload()
+        self.minigame.manager.unload()
@@ -0,0 +1,352 @@
+import pygame
+import random
+from settings import *
+from game_clock import get_time
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("boss_challenge")
+class BossChallenge(Minigame):
+    """Финальное испытание босса: архитектура, код и тесты"""
+    
+    def run(self):
+        """BOSS: Final Challenge - Multi-stage minigame"""
+        stages = [
+            {
+                "name": "Архитектура",
+                "description": "Спроектируй систему микросервисов",
+                "time_limit": 20,
+                "type": "architecture"
+            },
+            {
+                "name": "Кодинг", 
+                "description": "Напиши чистый и эффективный код",
+                "time_limit": 25,
+                "type": "coding"
+            },
+            {
+                "name": "Тестирование",
+                "description": "Проведи полное тестирование системы",
+                "time_limit": 15,
+                "type": "testing"
+            }
+        ]
+        
+        current_stage = 0
+        stage_results = []
+        
+        for stage_idx, stage in enumerate(stages):
+            # Show stage intro
+            yield from self.pause(3, self.message_frame([
+                (f"Этап {stage_idx + 1}: {stage['name']}", self.font_large, WHITE, 200),
+                (stage['description'], self.font_medium, YELLOW, 250),
+                (f"Время: {stage['time_limit']} секунд", self.font_medium, GREEN, 300)
+            ]))  # Show stage intro for 3 seconds
+            
+            # Run stage
+            stage_success = yield from self.run_boss_stage(stage)
+            stage_results.append(stage_success)
+            
+            if not stage_success:
+                # Failed stage - show failure
+                yield from self.pause(2, self.message_frame([
+                    (f"Этап {stage_idx + 1} провален!", self.font_large, RED, 200),
+                    ("Босс не доволен! Попробуй снова!", self.font_medium, YELLOW, 250)
+                ]))
+                return False
+        
+        # All stages completed successfully
+        yield from self.pause(3, self.message_frame([
+            ("🏆 ВСЕ ЭТАПЫ ПРОЙДЕНЫ!", self.font_large, GREEN, 200),
+            ("Ты доказал, что достоин быть лучшим!", self.font_medium, WHITE, 250)
+        ]))
+        return True
+    
+    def run_boss_stage(self, stage):
+        """Run individual boss stage"""
+        if stage['type'] == 'architecture':
+            return (yield from self.run_architecture_stage(stage))
+        elif stage['type'] == 'coding':
+            return (yield from self.run_coding_stage(stage))
+        elif stage['type'] == 'testing':
+            return (yield from self.run_testing_stage(stage))
+        return False
+    
+    def run_architecture_stage(self, stage):
+        """Architecture stage - design microservices (drag & check)"""
+        services = [
+            {"name": "User Service", "color": GREEN, "correct_pos": 0},
+            {"name": "Auth Service", "color": BLUE, "correct_pos": 1},
+            {"name": "Payment Service", "color": RED, "correct_pos": 2},
+            {"name": "Notification Service", "color": YELLOW, "correct_pos": 3}
+        ]
+        # Initialize positions randomly
+        import random
+        random.shuffle(services)
+        for i, service in enumerate(services):
+            service['x'] = 100 + i * 200
+            service['y'] = 300
+        selected_service = None
+        drag_offset = (0, 0)
+        check_button_rect = pygame.Rect(SCREEN_WIDTH//2 - 100, 500, 200, 50)
+        feedback = None
+        feedback_time = 0
+        start_time = get_time()
+        time_limit = stage['time_limit']
+        remaining_time = time_limit  # первый кадр этапа рисуется до первого шага
+        def draw_frame():
+            # Draw stage
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background(f"Этап: {stage['name']}", self.font_large, WHITE, (SCREEN_WIDTH//2, 100))
+            
+            # Timer
+            timer_text = f"Время: {remaining_time:.1f}s"
+            self.draw_text_with_background(timer_text, self.font_medium, RED, (100, 30))
+            
+            # Instructions
+            instruction = "Расставь микросервисы в правильном порядке (User → Auth → Payment → Notification):"
+            self.draw_text_with_background(instruction, self.font_medium, WHITE, (SCREEN_WIDTH//2, 150))
+            # Draw services
+            for i, service in enumerate(services):
+                x = service.get('x', 100 + i * 200)
+                y = service.get('y', 300)
+                service_rect = pygame.Rect(x, y, 150, 80)
+                if selected_service == i:
+                    pygame.draw.rect(self.screen, WHITE, service_rect, 3)
+                pygame.draw.rect(self.screen, service['color'], service_rect)
+                pygame.draw.rect(self.screen, WHITE, service_rect, 2)
+                name_surface = self.font_small.render(service['name'], True, BLACK)
+                name_rect = name_surface.get_rect(center=service_rect.center)
+                self.screen.blit(name_surface, name_rect)
+            # Draw check button
+            pygame.draw.rect(self.screen, BLUE, check_button_rect)
+            pygame.draw.rect(self.screen, WHITE, check_button_rect, 2)
+            btn_text = self.font_medium.render("Проверить порядок", True, WHITE)
+            btn_rect = btn_text.get_rect(center=check_button_rect.center)
+            self.screen.blit(btn_text, btn_rect)
+            # Feedback
+            if feedback and get_time() - feedback_time < 2.0:
+                fb_surface = self.font_medium.render(feedback, True, RED)
+                fb_rect = fb_surface.get_rect(center=(SCREEN_WIDTH//2, 570))
+                self.screen.blit(fb_surface, fb_rect)
+        
+        while True:
+            dt = yield draw_frame
+            current_time = get_time()
+            remaining_time = time_limit - (current_time - start_time)
+            if remaining_time <= 0:
+                return False
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check drag
+                    for i, service in enumerate(services):
+                        x = service.get('x', 100 + i * 200)
+                        y = service.get('y', 300)
+                        service_rect = pygame.Rect(x, y, 150, 80)
+                        if service_rect.collidepoint(mouse_pos):
+                            selected_service = i
+                            drag_offset = (mouse_pos[0] - x, mouse_pos[1] - y)
+                            break
+                    # Check button
+                    if check_button_rect.collidepoint(mouse_pos):
+                        # Проверка порядка
+                        expected_order = ["User Service", "Auth Service", "Payment Service", "Notification Service"]
+                        sorted_services = sorted(services, key=lambda s: s['x'])
+                        current_order = [s['name'] for s in sorted_services]
+                        if current_order == expected_order:
+                            return True
+                        else:
+                            feedback = "Неправильный порядок! Попробуй ещё раз."
+                            feedback_time = get_time()
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    selected_service = None
+                elif event.type == pygame.MOUSEMOTION:
+                    if selected_service is not None:
+                        mouse_pos = pygame.mouse.get_pos()
+                        services[selected_service]['x'] = mouse_pos[0] - drag_offset[0]
+                        services[selected_service]['y'] = mouse_pos[1] - drag_offset[1]
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
+    
+    def run_coding_stage(self, stage):
+        """Coding stage - write clean code"""
+        # Code with multiple bugs to find
+        code_lines = [
+            "function calculateTotal(items) {",
+            "  let total = 0;",
+            "  for (let i = 0; i < items.length; i++) {",
+            "    total += items[i].price;",  # Missing null check
+            "  }",
+            "  return total;",
+            "}",
+            "",
+            "function validateUser(user) {",
+            "  if (user.name && user.email) {",
+            "    return true;",  # Missing email validation
+            "  }",
+            "  return false;",
+            "}"
+        ]
+        
+        bugs = [3, 9]  # Lines with bugs
+        found_bugs = []
+        start_time = get_time()
+        time_limit = stage['time_limit']
+        remaining_time = time_limit  # первый кадр этапа рисуется до первого шага
+        
+        def draw_frame():
+            # Draw stage
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background(f"Этап: {stage['name']}", self.font_large, WHITE, (SCREEN_WIDTH//2, 100))
+            
+            # Timer
+            timer_text = f"Время: {remaining_time:.1f}s"
+            self.draw_text_with_background(timer_text, self.font_medium, RED, (100, 30))
+            
+            # Instructions
+            instruction = f"Найди все баги в коде! Найдено: {len(found_bugs)}/{len(bugs)}"
+            self.draw_text_with_background(instruction, self.font_medium, WHITE, (SCREEN_WIDTH//2, 150))
+            
+            # Code lines
+            for i, line in enumerate(code_lines):
+                y_pos = 200 + i * 25
+                color = GREEN if i in found_bugs else WHITE
+                line_surface = self.font_small.render(f"{i+1:2d}. {line}", True, color)
+                self.screen.blit(line_surface, (100, y_pos))
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                if 100 <= mouse_pos[0] <= 800 and y_pos <= mouse_pos[1] <= y_pos + 20:
+                    pygame.draw.rect(self.screen, GRAY, (90, y_pos-2, 720, 25), 2)
+        
+        while len(found_bugs) < len(bugs):
+            dt = yield draw_frame
+            current_time = get_time()
+            remaining_time = time_limit - (current_time - start_time)
+            
+            if remaining_time <= 0:
+                return False
+            
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    for i, line in enumerate(code_lines):
+                        line_y = 200 + i * 25
+                        if 100 <= mouse_pos[0] <= 800 and line_y <= mouse_pos[1] <= line_y + 20:
+                            if i in bugs and i not in found_bugs:
+                                found_bugs.append(i)
+                            elif i not in bugs:
+                                # Wrong line clicked
+                                yield from self.pause(2, self.message_frame([
+                                    ("Это не баг!", self.font_large, RED, 200),
+                                    ("Найди настоящие проблемы в коде!", self.font_medium, YELLOW, 250)
+                                ]))
+                                return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
+        
+        return True
+    
+    def run_testing_stage(self, stage):
+        """Testing stage - comprehensive testing"""
+        # Test cases to complete
+        test_cases = [
+            {"name": "Unit Tests", "progress": 0, "target": 5},
+            {"name": "Integration Tests", "progress": 0, "target": 3},
+            {"name": "Performance Tests", "progress": 0, "target": 2}
+        ]
+        
+        total_progress = 0
+        total_target = sum(test['target'] for test in test_cases)
+        start_time = get_time()
+        time_limit = stage['time_limit']
+        remaining_time = time_limit  # первый кадр этапа рисуется до первого шага
+        
+        def draw_frame():
+            # Draw stage
+            self.screen.fill(BLACK)
+            
+            # Title
+            title = self.font_large.render(f"Этап: {stage['name']}", True, WHITE)
+            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 100))
+            self.screen.blit(title, title_rect)
+            
+            # Timer
+            timer_text = f"Время: {remaining_time:.1f}s"
+            timer_surface = self.font_medium.render(timer_text, True, RED)
+            self.screen.blit(timer_surface, (10, 10))
+            
+            # Progress
+            progress_text = f"Прогресс: {total_progress}/{total_target}"
+            progress_surface = self.font_medium.render(progress_text, True, WHITE)
+            progress_rect = progress_surface.get_rect(center=(SCREEN_WIDTH//2, 150))
+            self.screen.blit(progress_surface, progress_rect)
+            
+            # Instructions
+            instruction = "Кликни на тесты для их выполнения:"
+            instruction_surface = self.font_medium.render(instruction, True, YELLOW)
+            instruction_rect = instruction_surface.get_rect(center=(SCREEN_WIDTH//2, 200))
+            self.screen.blit(instruction_surface, instruction_rect)
+            
+            # Draw test cases
+            for i, test in enumerate(test_cases):
+                test_rect = pygame.Rect(200, 300 + i * 100, 400, 60)
+                
+                # Background
+                color = GREEN if test['progress'] >= test['target'] else GRAY
+                pygame.draw.rect(self.screen, color, test_rect)
+                pygame.draw.rect(self.screen, WHITE, test_rect, 2)
+                
+                # Test name and progress
+                name_text = f"{test['name']}: {test['progress']}/{test['target']}"
+                name_surface = self.font_medium.render(name_text, True, BLACK)
+                name_rect = name_surface.get_rect(center=test_rect.center)
+                self.screen.blit(name_surface, name_rect)
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                if test_rect.collidepoint(mouse_pos) and test['progress'] < test['target']:
+                    pygame.draw.rect(self.screen, YELLOW, test_rect, 3)
+        
+        while total_progress < total_target:
+            current_time = get_time()
+            remaining_time = time_limit - (current_time - start_time)
+            
+            if remaining_time <= 0:
+                return False
+            
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Click on test cases to progress
+                    for i, test in enumerate(test_cases):
+                        test_rect = pygame.Rect(200, 300 + i * 100, 400, 60)
+                        if test_rect.collidepoint(mouse_pos) and test['progress'] < test['target']:
+                            test['progress'] += 1
+                            total_progress += 1
+                            break
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            yield draw_frame
+        
+        return True
@@ -0,0 +1,92 @@
+import pygame
+from settings import *
+from game_clock import get_ticks
+from sound_manager import get_sound_manager
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("clicker")
+class Clicker(Minigame):
+    """Кликер: нужное число кликов за время"""
+    
+    def run(self, clicks_needed, time_limit):
+        """Run clicker minigame"""
+        print(f"🎮 Запуск кликер-игры: {clicks_needed} кликов за {time_limit} секунд")
+        
+        # Game state
+        clicks = 0
+        game_start_time = get_ticks()
+        
+        # Fonts
+        font_large = pygame.font.Font(None, 72)
+        font_medium = pygame.font.Font(None, 48)
+        font_small = pygame.font.Font(None, 24)
+        
+        running = True
+        
+        def draw_frame():
+            # Draw
+            self.draw_minigame_background()
+            
+            # Draw click button
+            button_rect = pygame.Rect(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 - 100, 200, 200)
+            button_color = (255, 100, 100) if clicks < clicks_needed else (100, 255, 100)
+            pygame.draw.rect(self.screen, button_color, button_rect)
+            pygame.draw.rect(self.screen, (255, 255, 255), button_rect, 3)
+            
+            # Draw click text
+            click_text = f"КЛИКНИ!"
+            click_surface = font_large.render(click_text, True, (255, 255, 255))
+            click_rect = click_surface.get_rect(center=button_rect.center)
+            self.screen.blit(click_surface, click_rect)
+            
+            # Draw progress
+            progress_text = f"Клики: {clicks}/{clicks_needed}"
+            progress_surface = font_medium.render(progress_text, True, WHITE)
+            self.screen.blit(progress_surface, (20, 20))
+            
+            # Draw time
+            time_text = f"Время: {int(time_left)}с"
+            time_color = WHITE if time_left > 10 else RED
+            time_surface = font_medium.render(time_text, True, time_color)
+            self.screen.blit(time_surface, (20, 60))
+            
+            # Draw instructions
+            instructions = [
+                f"Кликни {clicks_needed} раз за {time_limit} секунд!",
+                "Быстро! Быстро!",
+                "ESC - выйти"
+            ]
+            
+            for i, instruction in enumerate(instructions):
+                inst_surface = font_small.render(instruction, True, GRAY)
+                self.screen.blit(inst_surface, (20, SCREEN_HEIGHT - 100 + i * 25))
+        
+        while running:
+            dt = yield draw_frame
+            
+            # Update time
+            current_time = get_ticks()
+            time_left = max(0, time_limit - (current_time - game_start_time) / 1000)
+            
+            # Handle events
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    clicks += 1
+                    
+                    # Play click sound
+                    sound_manager = get_sound_manager()
+                    if sound_manager:
+                        sound_manager.play_sound("click")
+            
+            # Check win/lose conditions
+            if clicks >= clicks_needed:
+                return True  # Win
+            elif time_left <= 0:
+                return False  # Lose
+        
+        return False
@@ -0,0 +1,129 @@
+import pygame
+import random
+from settings import *
+from game_clock import get_ticks
+from sound_manager import get_sound_manager
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("color_picker")
+class ColorPicker(Minigame):
+    """Подбери цвета за отведенное время"""
+    
+    def run(self, colors_needed, time_limit):
+        """Run color picker minigame"""
+        print(f"🎮 Запуск игры с выбором цветов: {colors_needed} цветов за {time_limit} секунд")
+        
+        # Game state
+        colors_found = 0
+        game_start_time = get_ticks()
+        
+        # Available colors
+        available_colors = [
+            (255, 0, 0),    # Red
+            (0, 255, 0),    # Green
+            (0, 0, 255),    # Blue
+            (255, 255, 0),  # Yellow
+            (255, 0, 255),  # Magenta
+            (0, 255, 255),  # Cyan
+            (255, 165, 0),  # Orange
+            (128, 0, 128),  # Purple
+            (255, 192, 203), # Pink
+            (165, 42, 42)   # Brown
+        ]
+        
+        # Shuffle colors
+        import random
+        random.shuffle(available_colors)
+        target_colors = available_colors[:colors_needed]
+        
+        # Fonts
+        font_large = pygame.font.Font(None, 48)
+        font_medium = pygame.font.Font(None, 32)
+        font_small = pygame.font.Font(None, 24)
+        
+        running = True
+        
+        def draw_frame():
+            # Draw
+            self.screen.fill((50, 50, 50))  # Dark background
+            
+            # Draw title
+            title_text = "Найди красивые цвета!"
+            title_surface = font_large.render(title_text, True, WHITE)
+            self.screen.blit(title_surface, (SCREEN_WIDTH//2 - title_surface.get_width()//2, 50))
+            
+            # Draw color palette
+            for i, color in enumerate(available_colors):
+                color_x = 50 + (i % 5) * 120
+                color_y = 200 + (i // 5) * 80
+                
+                # Draw color rectangle
+                pygame.draw.rect(self.screen, color, (color_x, color_y, 100, 60))
+                pygame.draw.rect(self.screen, WHITE, (color_x, color_y, 100, 60), 2)
+                
+                # Highlight target colors
+                if color in target_colors:
+                    pygame.draw.rect(self.screen, (255, 255, 0), (color_x, color_y, 100, 60), 4)
+            
+            # Draw progress
+            progress_text = f"Цвета: {colors_found}/{colors_needed}"
+            progress_surface = font_medium.render(progress_text, True, WHITE)
+            self.screen.blit(progress_surface, (20, 20))
+            
+            # Draw time
+            time_text = f"Время: {int(time_left)}с"
+            time_color = WHITE if time_left > 10 else RED
+            time_surface = font_medium.render(time_text, True, time_color)
+            self.screen.blit(time_surface, (20, 60))
+            
+            # Draw instructions
+            instructions = [
+                f"Найди {colors_needed} красивых цветов за {time_limit} секунд!",
+                "Кликни на нужные цвета!",
+                "ESC - выйти"
+            ]
+            
+            for i, instruction in enumerate(instructions):
+                inst_surface = font_small.render(instruction, True, GRAY)
+                self.screen.blit(inst_surface, (20, SCREEN_HEIGHT - 100 + i * 25))
+        
+        while running:
+            dt = yield draw_frame
+            
+            # Update time
+            current_time = get_ticks()
+            time_left = max(0, time_limit - (current_time - game_start_time) / 1000)
+            
+            # Handle events
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    
+                    # Check if clicked on a color
+                    for i, color in enumerate(available_colors):
+                        color_x = 50 + (i % 5) * 120
+                        color_y = 200 + (i // 5) * 80
+                        color_rect = pygame.Rect(color_x, color_y, 100, 60)
+                        
+                        if color_rect.collidepoint(mouse_pos):
+                            if color in target_colors and color not in [c for c in available_colors if c not in target_colors]:
+                                colors_found += 1
+                                target_colors.remove(color)
+                                
+                                # Play success sound
+                                sound_manager = get_sound_manager()
+                                if sound_manager:
+                                    sound_manager.play_sound("success")
+            
+            # Check win/lose conditions
+            if colors_found >= colors_needed:
+                return True  # Win
+            elif time_left <= 0:
+                return False  # Lose
+        
+        return False
@@ -0,0 +1,86 @@
+import pygame
+from settings import *
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("devops_pipeline")
+class DevopsPipeline(Minigame):
+    """Почини CI/CD пайплайн"""
+    
+    def run(self):
+        """DevOps Pipeline Fix minigame"""
+        # Pipeline configuration with errors
+        pipeline_steps = [
+            "git clone repository",
+            "npm install dependencies", 
+            "run tests",
+            "build application",
+            "deploy to staging",
+            "run integration tests",
+            "deploy to production"
+        ]
+        
+        broken_steps = [2, 4]  # Steps that need fixing
+        fixed_steps = []
+        
+        def draw_frame():
+            # Draw minigame
+            self.draw_minigame_background()
+            
+            # Title
+            title = self.font_large.render("DevOps Pipeline Fix", True, WHITE)
+            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 100))
+            self.screen.blit(title, title_rect)
+            
+            # Instructions
+            instruction = f"Исправьте сломанные шаги пайплайна! Исправлено: {len(fixed_steps)}/{len(broken_steps)}"
+            instruction_surface = self.font_medium.render(instruction, True, WHITE)
+            instruction_rect = instruction_surface.get_rect(center=(SCREEN_WIDTH//2, 150))
+            self.screen.blit(instruction_surface, instruction_rect)
+            
+            # Pipeline steps
+            for i, step in enumerate(pipeline_steps):
+                step_y = 200 + i * 50
+                step_rect = pygame.Rect(100, step_y, 600, 40)
+                
+                # Color based on status
+                if i in fixed_steps:
+                    color = GREEN
+                elif i in broken_steps:
+                    color = RED
+                else:
+                    color = WHITE
+                
+                pygame.draw.rect(self.screen, color, step_rect)
+                pygame.draw.rect(self.screen, WHITE, step_rect, 2)
+                
+                step_text = f"{i+1}. {step}"
+                step_surface = self.font_medium.render(step_text, True, BLACK if color != WHITE else WHITE)
+                step_text_rect = step_surface.get_rect(center=step_rect.center)
+                self.screen.blit(step_surface, step_text_rect)
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                if step_rect.collidepoint(mouse_pos):
+                    pygame.draw.rect(self.screen, YELLOW, step_rect, 3)
+        
+        while len(fixed_steps) < len(broken_steps):
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check if clicked on broken step
+                    for i, step in enumerate(pipeline_steps):
+                        step_y = 200 + i * 50
+                        step_rect = pygame.Rect(100, step_y, 600, 40)
+                        if step_rect.collidepoint(mouse_pos):
+                            if i in broken_steps and i not in fixed_steps:
+                                fixed_steps.append(i)
+                            break
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            yield draw_frame
+        
+        return True
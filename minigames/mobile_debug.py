@@ -0,0 +1,112 @@
+import pygame
+import random
+from settings import *
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("mobile_debug")
+class MobileDebug(Minigame):
+    """Отладка мобильного приложения"""
+    
+    def run(self):
+        """Mobile Debug minigame"""
+        # Mobile app crash scenarios
+        scenarios = [
+            "Приложение крашится при повороте экрана",
+            "Push-уведомления не приходят",
+            "Приложение медленно загружается",
+            "Кнопка не реагирует на нажатие"
+        ]
+        
+        correct_solutions = [
+            "Проверить onConfigurationChanged",
+            "Проверить Firebase токены",
+            "Оптимизировать изображения",
+            "Проверить onClick listener"
+        ]
+        
+        wrong_solutions = [
+            "Перезапустить телефон",
+            "Удалить приложение",
+            "Игнорировать проблему",
+            "Позвонить в поддержку"
+        ]
+        
+        current_scenario = 0
+        score = 0
+        
+        def draw_frame():
+            # Draw minigame
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background("Mobile Debug Master", self.font_large, WHITE, (SCREEN_WIDTH//2, 100))
+            
+            # Progress
+            progress_text = f"Сценарий {current_scenario + 1}/{len(scenarios)}"
+            self.draw_text_with_background(progress_text, self.font_medium, WHITE, (100, 30))
+            
+            # Scenario
+            self.draw_text_with_background(scenario, self.font_medium, WHITE, (SCREEN_WIDTH//2, 200))
+            
+            # Question
+            question = "Выберите правильное решение:"
+            self.draw_text_with_background(question, self.font_medium, YELLOW, (SCREEN_WIDTH//2, 250))
+            
+            # Options
+            for i, option in enumerate(options):
+                option_y = 400 + i * 60
+                option_rect = pygame.Rect(SCREEN_WIDTH//2 - 250, option_y, 500, 50)
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                color = GRAY if option_rect.collidepoint(mouse_pos) else UI_BG_COLOR[:3]
+                pygame.draw.rect(self.screen, color, option_rect)
+                pygame.draw.rect(self.screen, WHITE, option_rect, 2)
+                
+                option_text = f"{chr(65 + i)}) {option}"
+                # Add background for option text
+                option_surface = self.font_medium.render(option_text, True, WHITE)
+                option_text_rect = option_surface.get_rect(center=option_rect.center)
+                
+                # Create background for option text
+                bg_surface = pygame.Surface((option_text_rect.width + 20, option_text_rect.height + 8))
+                bg_surface.set_alpha(200)
+                bg_surface.fill((0, 0, 0))
+                bg_rect = bg_surface.get_rect(center=option_text_rect.center)
+                
+                self.screen.blit(bg_surface, bg_rect)
+                self.screen.blit(option_surface, option_text_rect)
+        
+        while current_scenario < len(scenarios):
+            dt = yield draw_frame
+            scenario = scenarios[current_scenario]
+            correct = correct_solutions[current_scenario]
+            wrong = wrong_solutions[current_scenario]
+            
+            # Randomize option positions
+            options = [correct, wrong]
+            random.shuffle(options)
+            correct_index = options.index(correct)
+            
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check option clicks
+                    for i in range(2):
+                        option_y = 400 + i * 60
+                        option_rect = pygame.Rect(SCREEN_WIDTH//2 - 250, option_y, 500, 50)
+                        if option_rect.collidepoint(mouse_pos):
+                            if i == correct_index:
+                                score += 1
+                            current_scenario += 1
+                            break
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
+        
+        return score >= 3  # Need at least 3/4 correct
@@ -0,0 +1,79 @@
+import pygame
+from settings import *
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("qa_testing")
+class QaTesting(Minigame):
+    """Найди баги в приложении"""
+    
+    def run(self):
+        """QA Testing minigame"""
+        # Code with bugs to find
+        code_lines = [
+            "function calculateTotal(items) {",
+            "  let total = 0;",
+            "  for (let i = 0; i < items.length; i++) {",
+            "    total += items[i].price;",  # Missing null check
+            "  }",
+            "  return total;",
+            "}",
+            "",
+            "function validateEmail(email) {",
+            "  return email.includes('@');",  # Too simple validation
+            "}",
+            "",
+            "function getUser(id) {",
+            "  return users.find(u => u.id === id);",  # No error handling
+            "}"
+        ]
+        
+        bug_lines = [3, 9, 12]  # Lines with bugs
+        found_bugs = []
+        
+        def draw_frame():
+            # Draw minigame
+            self.screen.fill(BLACK)
+            
+            # Title
+            title = self.font_large.render("QA Bug Hunter", True, WHITE)
+            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 100))
+            self.screen.blit(title, title_rect)
+            
+            # Instructions
+            instruction = f"Найдите все баги в коде! Найдено: {len(found_bugs)}/{len(bug_lines)}"
+            instruction_surface = self.font_medium.render(instruction, True, WHITE)
+            instruction_rect = instruction_surface.get_rect(center=(SCREEN_WIDTH//2, 150))
+            self.screen.blit(instruction_surface, instruction_rect)
+            
+            # Code lines
+            for i, line in enumerate(code_lines):
+                y_pos = 200 + i * 30
+                color = GREEN if i in found_bugs else WHITE
+                line_surface = self.font_medium.render(f"{i+1:2d}. {line}", True, color)
+                self.screen.blit(line_surface, (100, y_pos))
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                if 100 <= mouse_pos[0] <= 800 and y_pos <= mouse_pos[1] <= y_pos + 25:
+                    pygame.draw.rect(self.screen, GRAY, (90, y_pos-2, 720, 30), 2)
+        
+        while len(found_bugs) < len(bug_lines):
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check if clicked on bug line
+                    for i, line in enumerate(code_lines):
+                        line_y = 200 + i * 30
+                        if 100 <= mouse_pos[0] <= 800 and line_y <= mouse_pos[1] <= line_y + 25:
+                            if i in bug_lines and i not in found_bugs:
+                                found_bugs.append(i)
+                            break
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            yield draw_frame
+        
+        return True 
@@ -0,0 +1,105 @@
+import pygame
+from settings import *
+from game_clock import get_time
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("react_debug")
+class ReactDebug(Minigame):
+    """Почини React-компонент"""
+    
+    def run(self):
+        """React Debug Challenge minigame"""
+        # React component with bugs
+        code_lines = [
+            "function UserProfile({ user }) {",
+            "  const [loading, setLoading] = useState(true);",
+            "  const [data, setData] = useState(null);",
+            "",
+            "  useEffect(() => {",
+            "    fetchUserData(user.id);",  # Missing dependency!
+            "  }, []);",  # Should include user.id
+            "",
+            "  return (",
+            "    <div>",
+            "      {loading && <Spinner />}",
+            "      {data && <UserInfo data={data} />}",
+            "    </div>",
+            "  );",
+            "}"
+        ]
+        
+        bug_line = 5  # Line with bug
+        start_time = get_time()
+        time_limit = 15
+        
+        def draw_frame():
+            # Draw minigame
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background("React Debug Challenge", self.font_large, WHITE, (SCREEN_WIDTH//2, 100))
+            
+            # Timer
+            timer_text = f"Время: {remaining_time:.1f}s"
+            self.draw_text_with_background(timer_text, self.font_medium, RED, (100, 30))
+            
+            # Instructions
+            instruction = "Найдите ошибку в React компоненте:"
+            self.draw_text_with_background(instruction, self.font_medium, WHITE, (SCREEN_WIDTH//2, 150))
+            
+            # Code lines
+            for i, line in enumerate(code_lines):
+                y_pos = 200 + i * 30
+                color = WHITE
+                
+                # Create background for code line
+                line_text = f"{i+1:2d}. {line}"
+                line_surface = self.font_medium.render(line_text, True, color)
+                line_rect = line_surface.get_rect()
+                
+                # Background for code line
+                bg_surface = pygame.Surface((line_rect.width + 20, line_rect.height + 8))
+                bg_surface.set_alpha(200)
+                bg_surface.fill((0, 0, 0))
+                bg_rect = bg_surface.get_rect()
+                bg_rect.topleft = (90, y_pos - 4)
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                if 100 <= mouse_pos[0] <= 800 and y_pos <= mouse_pos[1] <= y_pos + 25:
+                    bg_surface.fill((50, 50, 50))
+                    pygame.draw.rect(self.screen, GRAY, (90, y_pos-2, 720, 30), 2)
+                
+                self.screen.blit(bg_surface, bg_rect)
+                self.screen.blit(line_surface, (100, y_pos))
+        
+        while True:
+            dt = yield draw_frame
+            current_time = get_time()
+            remaining_time = time_limit - (current_time - start_time)
+            
+            if remaining_time <= 0:
+                return False
+            
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    for i in range(len(code_lines)):
+                        line_y = 200 + i * 30
+                        if 100 <= mouse_pos[0] <= 800 and line_y <= mouse_pos[1] <= line_y + 25:
+                            if i == bug_line:
+                                return True
+                            else:
+                                yield from self.pause(2, self.message_frame([
+                                    ("Это не ошибка!", self.font_large, RED, 100),
+                                    ("Попробуй снова через NPC!", self.font_medium, YELLOW, 150)
+                                ]))
+                                return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
@@ -0,0 +1,109 @@
+import pygame
+from settings import *
+from game_clock import get_ticks
+from sound_manager import get_sound_manager
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("rhythm")
+class Rhythm(Minigame):
+    """Ритм-игра: попади в такт"""
+    
+    def run(self, beats_needed, time_limit):
+        """Run rhythm minigame"""
+        print(f"🎮 Запуск ритм-игры: {beats_needed} ударов за {time_limit} секунд")
+        
+        # Game state
+        beats = 0
+        game_start_time = get_ticks()
+        beat_interval = time_limit / beats_needed  # Time between beats
+        last_beat_time = game_start_time
+        
+        # Fonts
+        font_large = pygame.font.Font(None, 72)
+        font_medium = pygame.font.Font(None, 48)
+        font_small = pygame.font.Font(None, 24)
+        
+        running = True
+        beat_indicator = False
+        
+        def draw_frame():
+            # Draw
+            self.draw_minigame_background()
+            
+            # Draw rhythm circle
+            circle_center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//2)
+            circle_radius = 150
+            
+            # Beat indicator
+            if beat_indicator:
+                pygame.draw.circle(self.screen, (255, 255, 0), circle_center, circle_radius + 20)
+            
+            pygame.draw.circle(self.screen, (255, 100, 100), circle_center, circle_radius)
+            pygame.draw.circle(self.screen, (255, 255, 255), circle_center, circle_radius, 5)
+            
+            # Draw rhythm text
+            rhythm_text = "ПРОСТРАНСТВО"
+            rhythm_surface = font_large.render(rhythm_text, True, (255, 255, 255))
+            rhythm_rect = rhythm_surface.get_rect(center=circle_center)
+            self.screen.blit(rhythm_surface, rhythm_rect)
+            
+            # Draw progress
+            progress_text = f"Удары: {beats}/{beats_needed}"
+            progress_surface = font_medium.render(progress_text, True, WHITE)
+            self.screen.blit(progress_surface, (20, 20))
+            
+            # Draw time
+            time_text = f"Время: {int(time_left)}с"
+            time_color = WHITE if time_left > 10 else RED
+            time_surface = font_medium.render(time_text, True, time_color)
+            self.screen.blit(time_surface, (20, 60))
+            
+            # Draw instructions
+            instructions = [
+                f"Попади в ритм! {beats_needed} ударов за {time_limit} секунд!",
+                "Нажимай ПРОСТРАНСТВО в такт!",
+                "ESC - выйти"
+            ]
+            
+            for i, instruction in enumerate(instructions):
+                inst_surface = font_small.render(instruction, True, GRAY)
+                self.screen.blit(inst_surface, (20, SCREEN_HEIGHT - 100 + i * 25))
+        
+        while running:
+            dt = yield draw_frame
+            
+            # Update time
+            current_time = get_ticks()
+            time_left = max(0, time_limit - (current_time - game_start_time) / 1000)
+            
+            # Check for beat timing
+            if current_time - last_beat_time >= beat_interval * 1000:
+                last_beat_time = current_time
+            # Visual beat indicator: short flash on each beat
+            beat_indicator = current_time - last_beat_time < 100
+            
+            # Handle events
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+                    elif event.key == pygame.K_SPACE:
+                        # Check if click is on beat
+                        time_since_last_beat = (current_time - last_beat_time) / 1000
+                        if time_since_last_beat < beat_interval * 0.5:  # Within half beat
+                            beats += 1
+                            
+                            # Play beat sound
+                            sound_manager = get_sound_manager()
+                            if sound_manager:
+                                sound_manager.play_sound("beat")
+            
+            # Check win/lose conditions
+            if beats >= beats_needed:
+                return True  # Win
+            elif time_left <= 0:
+                return False  # Lose
+        
+        return False
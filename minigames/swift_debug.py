@@ -0,0 +1,116 @@
+import pygame
+from settings import *
+from game_clock import get_time
+from sound_manager import get_sound_manager
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("swift_debug")
+class SwiftDebug(Minigame):
+    """Найди строку с багом в Swift-коде"""
+    
+    def run(self):
+        """Swift Debug Showdown minigame"""
+        # Code lines with one bug
+        code_lines = [
+            "let name = \"Alex\"",  # Correct
+            "var age: Int = 25",   # Correct  
+            "let users = 1000",    # Correct
+            "const isActive = true",  # BUG: should be 'let'
+            "print(\"Hello World\")"  # Correct
+        ]
+        
+        bug_line = 3  # Line with bug (0-indexed)
+        start_time = get_time()
+        time_limit = 15
+        
+        def draw_frame():
+            # Draw minigame
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background("Swift Debug Showdown", self.font_large, WHITE, (SCREEN_WIDTH//2, 100))
+            
+            # Timer
+            timer_text = f"Время: {remaining_time:.1f}s"
+            self.draw_text_with_background(timer_text, self.font_medium, RED, (100, 30))
+            
+            # Instructions
+            instruction = "Найдите ошибку в коде (кликните на строку с багом):"
+            self.draw_text_with_background(instruction, self.font_medium, WHITE, (SCREEN_WIDTH//2, 150))
+            
+            # Code lines
+            for i, line in enumerate(code_lines):
+                y_pos = 200 + i * 40
+                color = WHITE  # All lines look normal
+                
+                # Create background for code line
+                line_text = f"{i+1}. {line}"
+                line_surface = self.font_medium.render(line_text, True, color)
+                line_rect = line_surface.get_rect()
+                
+                # Background for code line
+                bg_surface = pygame.Surface((line_rect.width + 20, line_rect.height + 8))
+                bg_surface.set_alpha(200)
+                bg_surface.fill((0, 0, 0))
+                bg_rect = bg_surface.get_rect()
+                bg_rect.topleft = (90, y_pos - 4)
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                if 100 <= mouse_pos[0] <= 800 and y_pos <= mouse_pos[1] <= y_pos + 30:
+                    bg_surface.fill((50, 50, 50))
+                    pygame.draw.rect(self.screen, GRAY, (90, y_pos-5, 720, 35), 2)
+                
+                self.screen.blit(bg_surface, bg_rect)
+                self.screen.blit(line_surface, (100, y_pos))
+        
+        while True:
+            dt = yield draw_frame
+            current_time = get_time()
+            remaining_time = time_limit - (current_time - start_time)
+            
+            if remaining_time <= 0:
+                # Play failure sound
+                sound_manager = get_sound_manager()
+                if sound_manager:
+                    sound_manager.play_quest_fail()
+                
+                yield from self.pause(2, self.message_frame([
+                    ("Время истекло!", self.font_large, RED, 200),
+                    ("Нужно найти ошибку за 15 секунд", self.font_medium, YELLOW, 250)
+                ]))  # Show feedback for 2 seconds
+                return False  # Time's up, failed
+            
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check if clicked on bug line
+                    for i, line in enumerate(code_lines):
+                        line_y = 200 + i * 40
+                        if 100 <= mouse_pos[0] <= 800 and line_y <= mouse_pos[1] <= line_y + 30:
+                            if i == bug_line:
+                                # Play success sound
+                                sound_manager = get_sound_manager()
+                                if sound_manager:
+                                    sound_manager.play_quest_complete()
+                                return True  # Found the bug!
+                            else:
+                                # Ошибка: не та строка
+                                # Play error sound
+                                sound_manager = get_sound_manager()
+                                if sound_manager:
+                                    sound_manager.play_error()
+                                
+                                yield from self.pause(2, self.message_frame([
+                                    ("Это не ошибка!", self.font_large, RED, 200),
+                                    ("Попробуй снова через NPC!", self.font_medium, YELLOW, 250)
+                                ]))
+                                return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
@@ -0,0 +1,160 @@
+import pygame
+import random
+from settings import *
+from game_clock import get_ticks
+from sound_manager import get_sound_manager
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("treasure_collector")
+class TreasureCollector(Minigame):
+    """Поймай котика: собери всех котиков за отведенное время"""
+    
+    def __init__(self, manager, **params):
+        super().__init__(manager, **params)
+        self.cat_sprite = None
+    
+    def load(self):
+        """Load cat sprite"""
+        try:
+            self.cat_sprite = pygame.image.load("cat.png")
+            self.cat_sprite = pygame.transform.scale(self.cat_sprite, (60, 60))  # Scale cat to 60x60
+            print("✅ Загружен спрайт котика")
+        except:
+            # Fallback cat sprite if file not found
+            self.cat_sprite = pygame.Surface((60, 60))
+            self.cat_sprite.fill((255, 200, 150))  # Orange cat
+            pygame.draw.circle(self.cat_sprite, (255, 150, 100), (30, 20), 15)  # Head
+            pygame.draw.circle(self.cat_sprite, (255, 150, 100), (30, 45), 20)  # Body
+            pygame.draw.circle(self.cat_sprite, (0, 0, 0), (25, 15), 3)  # Left eye
+            pygame.draw.circle(self.cat_sprite, (0, 0, 0), (35, 15), 3)  # Right eye
+            print("⚠️ Файл cat.png не найден, создан fallback спрайт")
+    
+    def unload(self):
+        self.cat_sprite = None
+    
+    def run(self):
+        """Run cat collector minigame"""
+        print("🎮 Запуск мини-игры: Поймай котика!")
+        
+        cat_sprite = self.cat_sprite
+        
+        # Game state
+        collected_cats = 0
+        total_cats = 5
+        time_left = 45  # 45 seconds
+        game_start_time = get_ticks()
+        
+        # Cat positions (random)
+        cats = []
+        for i in range(total_cats):
+            x = random.randint(100, SCREEN_WIDTH - 100)
+            y = random.randint(100, SCREEN_HEIGHT - 200)
+            cats.append({"x": x, "y": y, "collected": False})
+        
+        # Player position
+        player_x = SCREEN_WIDTH // 2
+        player_y = SCREEN_HEIGHT // 2
+        player_speed = 6
+        
+        # Fonts
+        font_large = pygame.font.Font(None, 48)
+        font_medium = pygame.font.Font(None, 32)
+        font_small = pygame.font.Font(None, 24)
+        
+        running = True
+        
+        def draw_frame():
+            # Draw
+            self.screen.fill((50, 100, 50))  # Green background
+            
+            # Draw cats
+            for cat in cats:
+                if not cat["collected"]:
+                    # Cat glow effect
+                    for i in range(3):
+                        glow_radius = 35 + i * 5
+                        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                        pygame.draw.circle(glow_surface, (255, 200, 150, 50 - i * 15), (glow_radius, glow_radius), glow_radius)
+                        self.screen.blit(glow_surface, (cat["x"] - glow_radius, cat["y"] - glow_radius))
+                    
+                    # Draw cat sprite
+                    cat_rect = cat_sprite.get_rect(center=(cat["x"], cat["y"]))
+                    self.screen.blit(cat_sprite, cat_rect)
+            
+            # Draw player (catcher)
+            pygame.draw.circle(self.screen, (0, 150, 255), (int(player_x), int(player_y)), 25)
+            pygame.draw.circle(self.screen, (0, 100, 200), (int(player_x), int(player_y)), 20)
+            
+            # Draw UI
+            # Progress
+            progress_text = f"Котики: {collected_cats}/{total_cats}"
+            progress_surface = font_medium.render(progress_text, True, WHITE)
+            self.screen.blit(progress_surface, (20, 20))
+            
+            # Time
+            time_text = f"Время: {int(time_left)}с"
+            time_color = (255, 255, 255) if time_left > 10 else (255, 0, 0)
+            time_surface = font_medium.render(time_text, True, time_color)
+            self.screen.blit(time_surface, (20, 60))
+            
+            # Instructions
+            instructions = [
+                "WASD - движение",
+                "Поймай всех котиков за 45 секунд!",
+                "ESC - выйти"
+            ]
+            
+            for i, instruction in enumerate(instructions):
+                inst_surface = font_small.render(instruction, True, GRAY)
+                self.screen.blit(inst_surface, (20, SCREEN_HEIGHT - 100 + i * 25))
+        
+        while running:
+            dt = yield draw_frame
+            
+            # Update time
+            current_time = get_ticks()
+            time_left = max(0, 45 - (current_time - game_start_time) / 1000)
+            
+            # Handle events
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Handle input
+            keys = pygame.key.get_pressed()
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
+                player_y -= player_speed
+            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+                player_y += player_speed
+            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+                player_x -= player_speed
+            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+                player_x += player_speed
+            
+            # Keep player on screen
+            player_x = max(20, min(SCREEN_WIDTH - 20, player_x))
+            player_y = max(20, min(SCREEN_HEIGHT - 20, player_y))
+            
+            # Check cat collection
+            for cat in cats:
+                if not cat["collected"]:
+                    distance = ((player_x - cat["x"])**2 + (player_y - cat["y"])**2)**0.5
+                    if distance < 40:  # Collection radius
+                        cat["collected"] = True
+                        collected_cats += 1
+                        
+                        # Play cat collection sound
+                        sound_manager = get_sound_manager()
+                        if sound_manager:
+                            sound_manager.play_sound("success")
+            
+            # Check win/lose conditions
+            if collected_cats >= total_cats:
+                return True  # Win
+            elif time_left <= 0:
+                return False  # Lose
+        
+        return False 
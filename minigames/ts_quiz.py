@@ -0,0 +1,120 @@
+import pygame
+import random
+from settings import *
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("ts_quiz")
+class TsQuiz(Minigame):
+    """Вопросы по TypeScript"""
+    
+    def run(self):
+        """TypeScript Quiz minigame"""
+        questions = [
+            {
+                "question": "Какой тип у user.name?",
+                "code": "const user = { id: 1, name: 'Alex' }",
+                "options": ["string", "number", "any"],
+                "correct": 0
+            },
+            {
+                "question": "Какой тип у user.age?", 
+                "code": "const user = { age: 25, active: true }",
+                "options": ["string", "number", "boolean"],
+                "correct": 1
+            },
+            {
+                "question": "Что не так с этим кодом?",
+                "code": "let value: any = 'hello'",
+                "options": ["Ничего", "Используется any", "Неверный синтаксис"],
+                "correct": 1
+            }
+        ]
+        
+        # Shuffle questions to make them appear in different positions
+        import random
+        random.shuffle(questions)
+        
+        current_question = 0
+        score = 0
+        selected_option = None
+        
+        def draw_frame():
+            # Draw quiz
+            self.draw_minigame_background()
+            
+            # Title
+            self.draw_text_with_background("Strict Mode Madness", self.font_large, WHITE, (SCREEN_WIDTH//2, 50))
+            
+            # Progress
+            progress_text = f"Вопрос {current_question + 1}/{len(questions)}"
+            self.draw_text_with_background(progress_text, self.font_medium, WHITE, (100, 30))
+            
+            # Question
+            self.draw_text_with_background(question_data["question"], self.font_medium, WHITE, (SCREEN_WIDTH//2, 150))
+            
+            # Code
+            self.draw_text_with_background(question_data["code"], self.font_medium, YELLOW, (SCREEN_WIDTH//2, 200))
+            
+            # Options
+            for i, option in enumerate(question_data["options"]):
+                option_y = 350 + i * 50
+                option_rect = pygame.Rect(SCREEN_WIDTH//2 - 200, option_y, 400, 40)
+                
+                # Highlight on hover
+                mouse_pos = pygame.mouse.get_pos()
+                color = GRAY if option_rect.collidepoint(mouse_pos) else UI_BG_COLOR[:3]
+                pygame.draw.rect(self.screen, color, option_rect)
+                pygame.draw.rect(self.screen, WHITE, option_rect, 2)
+                
+                option_text = f"{chr(65 + i)}) {option}"
+                # Add background for option text
+                option_surface = self.font_medium.render(option_text, True, WHITE)
+                option_text_rect = option_surface.get_rect(center=option_rect.center)
+                
+                # Create background for option text
+                bg_surface = pygame.Surface((option_text_rect.width + 20, option_text_rect.height + 8))
+                bg_surface.set_alpha(200)
+                bg_surface.fill((0, 0, 0))
+                bg_rect = bg_surface.get_rect(center=option_text_rect.center)
+                
+                self.screen.blit(bg_surface, bg_rect)
+                self.screen.blit(option_surface, option_text_rect)
+        
+        while current_question < len(questions):
+            dt = yield draw_frame
+            question_data = questions[current_question]
+            
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    # Check option clicks
+                    for i in range(len(question_data["options"])):
+                        option_y = 350 + i * 50
+                        option_rect = pygame.Rect(SCREEN_WIDTH//2 - 200, option_y, 400, 40)
+                        if option_rect.collidepoint(mouse_pos):
+                            selected_option = i
+                            if i == question_data["correct"]:
+                                score += 1
+                            current_question += 1
+                            selected_option = None
+                            break
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+            
+            # Update GIF animation
+            self.update_minigame_gif_background(dt)
+        
+        # Show results with feedback
+        if score >= 2:
+            return True
+        else:
+            # Show failure feedback
+            yield from self.pause(2, self.message_frame([
+                ("Результат", self.font_large, RED, 200),
+                (f"Правильных ответов: {score}/{len(questions)}", self.font_medium, WHITE, 250),
+                ("Нужно правильно ответить на минимум 2 вопроса из 3", self.font_medium, YELLOW, 300)
+            ]))  # Show feedback for 2 seconds
+            return False
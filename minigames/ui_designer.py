@@ -0,0 +1,139 @@
+import pygame
+from settings import *
+from game_clock import get_ticks
+from minigames.base import Minigame, register_minigame
+
+@register_minigame("ui_designer")
+class UiDesigner(Minigame):
+    """Собери интерфейс из компонентов"""
+    
+    def run(self):
+        """Run UI/UX Designer minigame"""
+        print("🎮 Запуск мини-игры: UI/UX Дизайнер")
+        
+        # Game state
+        score = 0
+        max_score = 100
+        time_left = 90  # 1.5 minutes
+        game_start_time = get_ticks()
+        
+        # UI components to arrange
+        components = [
+            {"name": "Header", "correct_x": 100, "correct_y": 50, "points": 20},
+            {"name": "Navigation", "correct_x": 100, "correct_y": 100, "points": 20},
+            {"name": "Content", "correct_x": 100, "correct_y": 150, "points": 20},
+            {"name": "Sidebar", "correct_x": 300, "correct_y": 150, "points": 20},
+            {"name": "Footer", "correct_x": 100, "correct_y": 400, "points": 20}
+        ]
+        
+        # Draggable components
+        draggable_components = []
+        for i, comp in enumerate(components):
+            draggable_components.append({
+                "name": comp["name"],
+                "x": 50 + i * 80,
+                "y": 500,
+                "width": 60,
+                "height": 30,
+                "dragging": False,
+                "correct_x": comp["correct_x"],
+                "correct_y": comp["correct_y"],
+                "points": comp["points"]
+            })
+        
+        # Fonts
+        font_large = pygame.font.Font(None, 48)
+        font_medium = pygame.font.Font(None, 32)
+        font_small = pygame.font.Font(None, 24)
+        
+        running = True
+        
+        def draw_frame():
+            # Draw
+            self.screen.fill((240, 240, 240))  # Light gray background
+            
+            # Draw design area
+            pygame.draw.rect(self.screen, (255, 255, 255), (50, 50, 400, 400), 2)
+            
+            # Draw target positions
+            for comp in components:
+                pygame.draw.rect(self.screen, (200, 200, 200), 
+                               (comp["correct_x"], comp["correct_y"], 60, 30), 1)
+                text_surface = font_small.render(comp["name"], True, (100, 100, 100))
+                self.screen.blit(text_surface, (comp["correct_x"] + 5, comp["correct_y"] + 5))
+            
+            # Draw draggable components
+            for comp in draggable_components:
+                color = (100, 150, 255) if comp["dragging"] else (150, 200, 255)
+                pygame.draw.rect(self.screen, color, 
+                               (comp["x"], comp["y"], comp["width"], comp["height"]))
+                text_surface = font_small.render(comp["name"], True, (0, 0, 0))
+                self.screen.blit(text_surface, (comp["x"] + 5, comp["y"] + 5))
+            
+            # Draw UI
+            # Score
+            score_text = f"Счет: {score}/{max_score}"
+            score_surface = font_medium.render(score_text, True, (0, 0, 0))
+            self.screen.blit(score_surface, (20, 20))
+            
+            # Time
+            time_text = f"Время: {int(time_left)}с"
+            time_color = (0, 0, 0) if time_left > 10 else (255, 0, 0)
+            time_surface = font_medium.render(time_text, True, time_color)
+            self.screen.blit(time_surface, (20, 60))
+            
+            # Instructions
+            instructions = [
+                "Перетащи компоненты в правильные позиции",
+                "Создай красивый UI дизайн!",
+                "ESC - выйти"
+            ]
+            
+            for i, instruction in enumerate(instructions):
+                inst_surface = font_small.render(instruction, True, (100, 100, 100))
+                self.screen.blit(inst_surface, (20, SCREEN_HEIGHT - 100 + i * 25))
+        
+        while running:
+            dt = yield draw_frame
+            
+            # Update time
+            current_time = get_ticks()
+            time_left = max(0, 90 - (current_time - game_start_time) / 1000)
+            
+            # Handle events
+            for event in self.poll_events():
+                if event.type == pygame.QUIT:
+                    return False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        return False
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = pygame.mouse.get_pos()
+                    for comp in draggable_components:
+                        if (comp["x"] <= mouse_pos[0] <= comp["x"] + comp["width"] and
+                            comp["y"] <= mouse_pos[1] <= comp["y"] + comp["height"]):
+                            comp["dragging"] = True
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    for comp in draggable_components:
+                        comp["dragging"] = False
+                elif event.type == pygame.MOUSEMOTION:
+                    mouse_pos = pygame.mouse.get_pos()
+                    for comp in draggable_components:
+                        if comp["dragging"]:
+                            comp["x"] = mouse_pos[0] - comp["width"] // 2
+                            comp["y"] = mouse_pos[1] - comp["height"] // 2
+            
+            # Check component placement
+            score = 0
+            for comp in draggable_components:
+                distance = ((comp["x"] - comp["correct_x"])**2 + (comp["y"] - comp["correct_y"])**2)**0.5
+                if distance < 30:  # Close enough to correct position
+                    score += comp["points"]
+            
+            # Check win/lose conditions
+            if score >= max_score:
+                return True  # Win
+            elif time_left <= 0:
+                return False  # Lose
+        
+        return False
@@ -0,0 +1,196 @@
+import io
+import os
+import pygame
+from settings import *
+
+# Музыка по сценам: имя -> источник и громкость относительно MUSIC_VOLUME.
+# Треки с одним файлом делят один поток: переключение между ними - только громкость.
+# length - длина файла в секундах (чтобы запомненная позиция не уходила за конец при повторах)
+MUSIC_TRACKS = {
+    "main_theme": {"path": "alexander-nakarada-superepic(chosic.com).mp3", "volume": 1.0, "length": 44.07},
+    "mentor_location": {"path": "alexander-nakarada-superepic(chosic.com).mp3", "volume": 0.6, "length": 44.07},
+    "minigame": {"path": "alexander-nakarada-superepic(chosic.com).mp3", "volume": 1.0, "length": 44.07}
+}
+
+class MusicTrack:
+    def __init__(self, name, path, volume=1.0, loop=True, length=None, stinger=False):
+        self.name = name
+        self.path = path
+        self.volume = volume
+        self.loop = loop
+        self.length = length
+        self.stinger = stinger  # короткий фрагмент: играется как Sound поверх музыки
+
+class MusicController:
+    """
+    Фоновая музыка по именованным трекам.
+    - Тот же трек (или трек с тем же файлом) - без перезапуска, максимум смена громкости.
+    - Другой файл - кроссфейд: fadeout текущего, новый стартует с fade-in после update().
+    - Позиция каждого файла запоминается: вернулись к треку - играет с того же места.
+    - Файлы читаются в память один раз при add_track, смена сцены не трогает диск.
+    - Стингеры декодируются в PCM (pygame.mixer.Sound) один раз, при первом проигрывании.
+    """
+    def __init__(self, volume=MUSIC_VOLUME, crossfade_ms=600):
+        self.volume = volume
+        self.crossfade_ms = crossfade_ms
+        
+        self.tracks = {}
+        self.encoded = {}  # путь -> байты файла
+        self.pcm = {}  # имя стингера -> Sound
+        self.positions = {}  # путь -> секунды, где остановились
+        
+        self.current = None  # имя играющего трека
+        self.stream = None  # BytesIO текущего файла (mixer читает из него, пока играет)
+        self.start_offset = 0.0  # с какой секунды запущен текущий файл
+        self.paused = False
+        
+        self.pending = None  # трек, который стартует после fadeout текущего
+        self.fade_left = 0.0
+        
+        for name, track in MUSIC_TRACKS.items():
+            self.add_track(name, **track)
+    
+    def add_track(self, name, path, volume=1.0, loop=True, length=None, stinger=False):
+        """Зарегистрировать трек; файл читается в память сразу (один раз на путь)"""
+        if path not in self.encoded:
+            try:
+                with open(path, "rb") as f:
+                    self.encoded[path] = f.read()
+            except OSError as e:
+                print(f"⚠️ Музыка не найдена: {path} ({e})")
+                return False
+        self.tracks[name] = MusicTrack(name, path, volume, loop, length, stinger)
+        return True
+    
+    def add_stinger_sound(self, name, sound, volume=1.0):
+        """Зарегистрировать стингер из готового Sound (например, синтезированного)"""
+        self.tracks[name] = MusicTrack(name, None, volume, loop=False, length=sound.get_length(), stinger=True)
+        self.pcm[name] = sound
+    
+    def current_track(self):
+        return self.tracks.get(self.current)
+    
+    def play(self, name, fade_ms=None):
+        """Переключиться на трек. Возвращает False, если трека нет"""
+        track = self.tracks.get(name)
+        if track is None or track.stinger:
+            return False
+        current = self.current_track()
+        
+        if self.pending is not None:
+            # Уже идет кроссфейд - просто меняем, что заиграет после него
+            self.pending = name
+            return True
+        
+        if current is not None and current.path == track.path and (pygame.mixer.music.get_busy() or self.paused):
+            # Тот же файл уже играет (или на паузе): без загрузки и перезапуска
+            self.current = name
+            self.resume()
+            self.apply_volume()
+            return True
+        
+        fade_ms = self.crossfade_ms if fade_ms is None else fade_ms
+        if current is not None and pygame.mixer.music.get_busy() and fade_ms > 0:
+            self.positions[current.path] = self.get_position()
+            pygame.mixer.music.fadeout(fade_ms)
+            self.pending = name
+            self.fade_left = fade_ms / 1000
+            return True
+        
+        self.start(name, fade_ms)
+        return True
+    
+    def start(self, name, fade_ms=0):
+        """Загрузить файл трека из памяти и запустить с запомненной позиции"""
+        track = self.tracks[name]
+        start = self.positions.get(track.path, 0.0)
+        if track.length:
+            start %= track.length
+        
+        self.stream = io.BytesIO(self.encoded[track.path])
+        try:
+            pygame.mixer.music.load(self.stream, os.path.splitext(track.path)[1].lstrip(".").lower())
+            pygame.mixer.music.play(-1 if track.loop else 0, start=start, fade_ms=fade_ms)
+        except pygame.error as e:
+            print(f"⚠️ Не удалось запустить музыку {name}: {e}")
+            self.current = None
+            return
+        
+        self.current = name
+        self.start_offset = start
+        self.paused = False
+        self.apply_volume()
+    
+    def update(self, dt):
+        """Дождаться конца fadeout и запустить следующий трек"""
+        if self.pending is None:
+            return
+        self.fade_left -= dt
+        if self.fade_left <= 0 or not pygame.mixer.music.get_busy():
+            name = self.pending
+            self.pending = None
+            self.start(name, self.crossfade_ms)
+    
+    def get_position(self):
+        """Текущая позиция в файле (секунды)"""
+        track = self.current_track()
+        if track is None:
+            return 0.0
+        position = self.start_offset + max(0, pygame.mixer.music.get_pos()) / 1000
+        if track.length:
+            position %= track.length
+        return position
+    
+    def pause(self):
+        if self.current is None or self.paused:
+            return
+        self.positions[self.current_track().path] = self.get_position()
+        pygame.mixer.music.pause()
+        self.paused = True
+    
+    def resume(self):
+        if not self.paused:
+            return
+        pygame.mixer.music.unpause()
+        self.paused = False
+    
+    def stop(self):
+        """Остановить музыку (позиция запоминается)"""
+        if self.current is not None:
+            self.positions[self.current_track().path] = self.get_position()
+        pygame.mixer.music.stop()
+        self.current = None
+        self.pending = None
+        self.paused = False
+    
+    def set_volume(self, volume):
+        self.volume = volume
+        self.apply_volume()
+    
+    def apply_volume(self):
+        track = self.current_track()
+        if track is not None:
+            pygame.mixer.music.set_volume(self.volume * track.volume)
+    
+    def get_stinger(self, name):
+        """Sound стингера с громкостью музыки; PCM декодируется при первом вызове. None - нет такого"""
+        track = self.tracks.get(name)
+        if track is None or not track.stinger:
+            return None
+        sound = self.pcm.get(name)
+        if sound is None:
+            try:
+                sound = pygame.mixer.Sound(file=io.BytesIO(self.encoded[track.path]))
+            except pygame.error as e:
+                print(f"⚠️ Не удалось декодировать {name}: {e}")
+                return None
+            self.pcm[name] = sound
+        sound.set_volume(self.volume * track.volume)
+        return sound
+    
+    def get_memory_bytes(self):
+        """Байты файлов в памяти + декодированный PCM стингеров"""
+        frequency, size, channels = pygame.mixer.get_init() or (22050, -16, 2)
+        bytes_per_second = frequency * abs(size) // 8 * channels
+        return (sum(len(data) for data in self.encoded.values())
+                + int(sum(sound.get_length() for sound in self.pcm.values()) * bytes_per_second))
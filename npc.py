@@ -1,7 +1,9 @@
 import pygame
 import os
 from settings import *
-from sprite_loader import get_sprite_loader
+from sprite_loader import get_sprite_loader, get_asset_cache
+from asset_bake import get_asset_baker
+from text_cache import get_text_cache
 
 class NPC:
     def __init__(self, x, y, name, npc_type="student"):
@@ -31,18 +33,19 @@ class NPC:
         # Interaction
         self.interaction_range = 50
         self.show_quest_marker = False
-        
+    
     def load_sprite(self):
         """Load NPC sprite from mentors folder or create placeholder"""
         try:
             if self.npc_type == "mentor":
                 # Use PNG photos from Mentors folder for mentors on map
                 mentor_photo_path = os.path.join("Mentors", f"{self.name}.png")
-                if os.path.exists(mentor_photo_path):
-                    # Load mentor photo and scale to appropriate size for map
-                    mentor_photo = pygame.image.load(mentor_photo_path)
-                    # Scale to 64x64 pixels for map display
-                    self.image = pygame.transform.scale(mentor_photo, (64, 64))
+                # 64x64 for map display (pre-scaled in the texture atlas)
+                mentor_photo = self.sprite_loader.get_atlas_image(f"mentors/{self.name}/64")
+                if mentor_photo is None:
+                    mentor_photo = get_asset_cache().get_image(mentor_photo_path, (64, 64))
+                if mentor_photo:
+                    self.image = mentor_photo
                     print(f"✅ Загружена фотография ментора {self.name}")
                 else:
                     # Fallback to colored rectangle if photo not found
@@ -52,11 +55,10 @@ class NPC:
             elif self.npc_type == "boss":
                 # Load boss sprite
                 boss_photo_path = os.path.join("Mentors", "main_boss.jpg")
-                if os.path.exists(boss_photo_path):
-                    # Load boss photo and scale to appropriate size for map
-                    boss_photo = pygame.image.load(boss_photo_path)
-                    # Scale to 80x80 pixels for boss display (larger than mentors)
-                    self.image = pygame.transform.scale(boss_photo, (80, 80))
+                # Scale to 80x80 pixels for boss display (larger than mentors)
+                boss_photo = get_asset_baker().get_image(boss_photo_path, "scale", (80, 80), alpha=False)
+                if boss_photo:
+                    self.image = boss_photo
                     print(f"✅ Загружен спрайт босса {self.name}")
                 else:
                     # Fallback to colored rectangle if photo not found
@@ -86,7 +88,7 @@ class NPC:
         self.has_quest = True
         self.show_quest_marker = True
         self.user_reward = user_reward
-
+    
     def can_interact(self, player_pos):
         """Check if player is in interaction range"""
         distance = self.position.distance_to(player_pos)
@@ -173,40 +175,33 @@ class NPC:
         self.show_quest_marker = True  # Show marker again for retry
     
     def draw(self, screen, camera_offset):
-        """Draw NPC and quest marker"""
+        """Draw NPC and quest marker. Returns the screen area it covers"""
         draw_pos = self.rect.topleft - camera_offset
-        screen.blit(self.image, draw_pos)
-        
-        # Draw name above NPC
-        font = pygame.font.Font(None, 20)
-        name_text = font.render(self.name, True, WHITE)
-        name_rect = name_text.get_rect()
-        name_rect.centerx = draw_pos[0] + self.rect.width // 2
-        name_rect.bottom = draw_pos[1] - 5
+        area = screen.blit(self.image, draw_pos)
         
-        # Draw background for name
-        name_bg = pygame.Surface((name_rect.width + 10, name_rect.height + 4))
-        name_bg.set_alpha(180)
-        name_bg.fill(BLACK)
-        name_bg_rect = name_bg.get_rect(center=name_rect.center)
-        screen.blit(name_bg, name_bg_rect)
+        asset_cache = get_asset_cache()
         
-        # Draw name
-        screen.blit(name_text, name_rect)
+        # Draw name above NPC (pre-rendered name tag with background)
+        font = asset_cache.get_font(None, 20)
+        name_tag = get_text_cache().render(self.name, font, WHITE, background=(0, 0, 0, 180), padding=(5, 2))
+        name_tag_rect = name_tag.get_rect()
+        name_tag_rect.centerx = draw_pos[0] + self.rect.width // 2
+        name_tag_rect.bottom = draw_pos[1] - 3
+        area.union_ip(screen.blit(name_tag, name_tag_rect))
         
         # Draw quest marker
         if self.show_quest_marker:
             marker_pos = (draw_pos[0] + self.rect.width // 2 - 12, draw_pos[1] - 24)
-            try:
-                marker_img = pygame.image.load("data/sprites/icon_quest.png")
-                marker_img = pygame.transform.scale(marker_img, (24, 24))
-                screen.blit(marker_img, marker_pos)
-            except:
-                pygame.draw.circle(screen, YELLOW, marker_pos, 8)
-                font = pygame.font.Font(None, 24)
-                text = font.render("!", True, BLACK)
+            marker_img = self.sprite_loader.get_atlas_image("sprites/icon_quest")
+            if marker_img:
+                area.union_ip(screen.blit(marker_img, marker_pos))
+            else:
+                area.union_ip(pygame.draw.circle(screen, YELLOW, marker_pos, 8))
+                font = asset_cache.get_font(None, 24)
+                text = get_text_cache().render("!", font, BLACK)
                 text_rect = text.get_rect(center=marker_pos)
-                screen.blit(text, text_rect)
+                area.union_ip(screen.blit(text, text_rect))
+        return area
 
 class MentorNPC(NPC):
     def __init__(self, x, y, name, specialty):
@@ -0,0 +1,240 @@
+import os
+import json
+import time
+from collections import deque
+import pygame
+from settings import *
+
+class NullSection:
+    """Секция, когда замеры выключены: ничего не делает и ничего не создает"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+NULL_SECTION = NullSection()
+
+class PerfSection:
+    """Замер одной подсистемы: with monitor.section("update.player"): ..."""
+    __slots__ = ("name", "monitor", "started")
+    
+    def __init__(self, name, monitor):
+        self.name = name
+        self.monitor = monitor
+        self.started = 0.0
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        self.monitor.record(self.name, self.started, time.perf_counter() - self.started)
+        return False
+
+class PerfMonitor:
+    """
+    Где уходит время кадра. Подсистемы оборачивают работу в section(name),
+    вложенность задается точкой в имени ("update.player" внутри "update").
+    Пока оверлей (F3) и трассировка (F4) выключены, section() отдает общую
+    пустую секцию - замеры ничего не стоят.
+    Трассировка пишет Chrome trace JSON (chrome://tracing, Perfetto).
+    """
+    def __init__(self, history=240, smoothing=0.1, max_trace_events=200000):
+        self.overlay_visible = False
+        self.tracing = False
+        self.enabled = False
+        
+        self.sections = {}  # имя -> PerfSection (создаются один раз)
+        self.frame_totals = {}  # имя -> мс в текущем кадре
+        self.averages = {}  # имя -> сглаженные мс на кадр
+        self.smoothing = smoothing
+        
+        self.frame_times = deque(maxlen=history)  # мс между кадрами
+        self.last_frame_start = None
+        
+        self.trace_events = []
+        self.max_trace_events = max_trace_events
+        self.trace_origin = 0.0
+        
+        # Источники памяти: имя -> функция, возвращающая байты
+        self.memory_sources = {}
+        
+        # Текст оверлея перерисовывается 4 раза в секунду, график - каждый кадр
+        self.panel = None
+        self.panel_age = 0.0
+        self.panel_interval = 0.25
+        self.font = None
+    
+    def update_enabled(self):
+        self.enabled = self.overlay_visible or self.tracing
+        if not self.enabled:
+            self.frame_totals.clear()
+            self.last_frame_start = None
+    
+    def toggle_overlay(self):
+        """F3: показать/скрыть оверлей"""
+        self.overlay_visible = not self.overlay_visible
+        self.panel = None
+        self.update_enabled()
+    
+    def section(self, name):
+        """Секция замера; при выключенных замерах - общая пустая"""
+        if not self.enabled:
+            return NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = PerfSection(name, self)
+        return section
+    
+    def record(self, name, started, duration):
+        """Записать замер (секунды)"""
+        self.frame_totals[name] = self.frame_totals.get(name, 0.0) + duration * 1000
+        if self.tracing and len(self.trace_events) < self.max_trace_events:
+            self.trace_events.append({
+                "name": name.rsplit(".", 1)[-1],
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (started - self.trace_origin) * 1e6,
+                "dur": duration * 1e6,
+                "pid": 1,
+                "tid": 1
+            })
+    
+    def begin_frame(self):
+        """Начало кадра главного цикла"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_frame_start is not None:
+            frame_ms = (now - self.last_frame_start) * 1000
+            self.frame_times.append(frame_ms)
+            self.panel_age += frame_ms / 1000
+            if self.tracing and len(self.trace_events) < self.max_trace_events:
+                self.trace_events.append({
+                    "name": "frame", "cat": "frame", "ph": "X",
+                    "ts": (self.last_frame_start - self.trace_origin) * 1e6,
+                    "dur": frame_ms * 1000, "pid": 1, "tid": 2
+                })
+        self.last_frame_start = now
+    
+    def end_frame(self):
+        """Конец кадра: сгладить суммы секций за кадр"""
+        if not self.enabled:
+            return
+        for name in self.sections:
+            total = self.frame_totals.get(name, 0.0)
+            average = self.averages.get(name, total)
+            self.averages[name] = average + (total - average) * self.smoothing
+        self.frame_totals.clear()
+    
+    def add_memory_source(self, name, get_bytes):
+        """Показывать в оверлее память источника (функция без аргументов -> байты)"""
+        self.memory_sources[name] = get_bytes
+    
+    def start_trace(self):
+        self.trace_events = []
+        self.trace_origin = time.perf_counter()
+        self.tracing = True
+        self.update_enabled()
+        print("⏺️ Запись Chrome trace... (F4 - остановить)")
+    
+    def stop_trace(self, directory="data/traces"):
+        """Остановить трассировку и записать JSON. Возвращает путь к файлу"""
+        self.tracing = False
+        self.update_enabled()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, time.strftime("trace_%Y%m%d_%H%M%S.json"))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+        print(f"💾 Chrome trace сохранен: {path} ({len(self.trace_events)} событий)")
+        self.trace_events = []
+        return path
+    
+    def toggle_trace(self):
+        """F4: начать/закончить запись трассировки"""
+        if self.tracing:
+            return self.stop_trace()
+        self.start_trace()
+        return None
+    
+    def get_fps(self):
+        if not self.frame_times:
+            return 0.0
+        recent = list(self.frame_times)[-60:]
+        return 1000.0 / (sum(recent) / len(recent)) if sum(recent) else 0.0
+    
+    def build_panel(self):
+        """Текстовая часть оверлея: FPS, секции по вложенности, память"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        
+        # (отступ, подпись, значение)
+        rows = [(0, "FPS" + (" [TRACE]" if self.tracing else ""), f"{self.get_fps():.1f}"),
+                (0, "frame", f"{self.frame_times[-1] if self.frame_times else 0:.2f} ms")]
+        for name in sorted(self.averages, key=self.section_order):
+            rows.append((name.count("."), name.rsplit(".", 1)[-1], f"{self.averages[name]:.2f} ms"))
+        for name, get_bytes in self.memory_sources.items():
+            rows.append((0, name, f"{get_bytes() / (1024 * 1024):.1f} MB"))
+        
+        width = 260
+        line_height = 18
+        panel = pygame.Surface((width, len(rows) * line_height + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for index, (depth, label, value) in enumerate(rows):
+            y = 4 + index * line_height
+            panel.blit(self.font.render(label, True, (220, 255, 220)), (6 + depth * 12, y))
+            value_surface = self.font.render(value, True, WHITE)
+            panel.blit(value_surface, (width - 6 - value_surface.get_width(), y))
+        return panel
+    
+    def section_order(self, name):
+        """Ключ сортировки: порядок первого замера, дети сразу под родителем"""
+        order = list(self.sections)
+        parts = name.split(".")
+        prefixes = (".".join(parts[:depth]) for depth in range(1, len(parts) + 1))
+        return [order.index(prefix) for prefix in prefixes if prefix in self.sections]
+    
+    def draw(self, screen):
+        """Нарисовать оверлей в правом верхнем углу. Возвращает занятый прямоугольник (None - скрыт)"""
+        if not self.overlay_visible:
+            return None
+        if self.panel is None or self.panel_age >= self.panel_interval:
+            self.panel = self.build_panel()
+            self.panel_age = 0.0
+        
+        # График времени кадра: полоса на кадр, линия - бюджет 60 FPS
+        graph_height = 60
+        graph = pygame.Rect(0, 0, self.panel.get_width(), graph_height)
+        area = pygame.Rect(0, 0, self.panel.get_width(), self.panel.get_height() + graph_height)
+        area.topright = (screen.get_width() - 10, 10)
+        graph.topleft = (area.left, area.top + self.panel.get_height())
+        
+        screen.blit(self.panel, area.topleft)
+        screen.fill((20, 20, 20), graph)
+        budget = 1000.0 / 60
+        scale = graph_height / (budget * 3)
+        for index, frame_ms in enumerate(list(self.frame_times)[-graph.width // 2:]):
+            height = min(graph_height, max(1, int(frame_ms * scale)))
+            color = GREEN if frame_ms <= budget * 1.05 else (YELLOW if frame_ms <= budget * 2 else RED)
+            pygame.draw.line(screen, color, (graph.left + index * 2, graph.bottom - 1),
+                             (graph.left + index * 2, graph.bottom - height))
+        budget_y = graph.bottom - int(budget * scale)
+        pygame.draw.line(screen, WHITE, (graph.left, budget_y), (graph.right - 1, budget_y))
+        return area
+
+# Глобальный монитор производительности
+perf_monitor = None
+
+def init_perf_monitor():
+    """Создать монитор производительности"""
+    global perf_monitor
+    perf_monitor = PerfMonitor()
+    return perf_monitor
+
+def get_perf_monitor():
+    """Получить монитор производительности (создается при первом обращении)"""
+    global perf_monitor
+    if perf_monitor is None:
+        perf_monitor = PerfMonitor()
+    return perf_monitor
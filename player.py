@@ -8,10 +8,16 @@ class Player:
     def __init__(self, x, y):
         # Position and movement
         self.position = pygame.math.Vector2(x, y)
-        self.speed = PLAYER_SPEED
+        self.previous_position = self.position.copy()  # позиция до текущего шага (интерполяция)
+        self.render_position = None
+        self.speed = PLAYER_SPEED  # пикселей в секунду
         self.direction = pygame.math.Vector2()
         self.facing_direction = "down"  # Направление, куда смотрит игрок
         
+        # Collision against the level passability grid (None - free movement)
+        self.collision_grid = None
+        self.hitbox_size = PLAYER_HITBOX_SIZE
+        
         # Load player sprite from new assets
         self.sprite_loader = get_sprite_loader()
         self.image = self.sprite_loader.get_player_sprite("idle")
@@ -27,6 +33,7 @@ class Player:
         self.current_users = 0
         self.quest_log = []
         self.inventory = {}
+        self.version = 0  # Bumped when quest_log or inventory change (UI redraw)
         
         # Animation
         self.animation_speed = ANIMATION_SPEED
@@ -36,8 +43,8 @@ class Player:
         self.interacting = False
         
         # Sound effects
-        self.last_footstep_time = 0
-        self.footstep_interval = 300  # milliseconds
+        self.footstep_timer = 0.0  # seconds until the next footstep while walking
+        self.footstep_interval = 0.3
         self.was_moving = False
         
     def get_input(self):
@@ -69,27 +76,27 @@ class Player:
         """Update player position and animation"""
         self.get_input()
         
-        # Update position
-        self.position += self.direction * self.speed
+        # Update position (speed is per second, dt is one fixed simulation step)
+        self.render_position = None
+        move = self.direction * self.speed * dt
+        if self.collision_grid:
+            new_x, new_y = self.collision_grid.move_box(self.position, self.hitbox_size, move.x, move.y)
+            self.position.update(new_x, new_y)
+        else:
+            self.position += move
         self.rect.center = (int(self.position.x), int(self.position.y))
         
         # Handle footstep sounds
         is_moving = self.direction.magnitude() > 0
-        current_time = pygame.time.get_ticks()
-        
-        if is_moving and not self.was_moving:
-            # Started moving
-            self.was_moving = True
-        elif is_moving and self.was_moving:
-            # Continue moving - play footstep sound periodically
-            if current_time - self.last_footstep_time > self.footstep_interval:
+        if is_moving and self.was_moving:
+            # Continue moving - play footstep sound every footstep_interval of walking
+            self.footstep_timer -= dt
+            if self.footstep_timer <= 0:
                 sound_manager = get_sound_manager()
                 if sound_manager:
                     sound_manager.play_footstep()
-                self.last_footstep_time = current_time
-        elif not is_moving and self.was_moving:
-            # Stopped moving
-            self.was_moving = False
+                self.footstep_timer = self.footstep_interval
+        self.was_moving = is_moving
         
         # Update animation - use idle by default, walk only when moving
         if is_moving:
@@ -111,6 +118,10 @@ class Player:
             if idle_sprite:
                 self.image = idle_sprite
     
+    def touch(self):
+        """Mark quest_log/inventory as changed"""
+        self.version += 1
+    
     def add_users(self, amount):
         """Add users to player's count"""
         self.current_users += amount
@@ -123,6 +134,7 @@ class Player:
             self.inventory[item_name] += 1
         else:
             self.inventory[item_name] = 1
+        self.touch()
     
     def has_item(self, item_name):
         """Check if player has item"""
@@ -134,11 +146,20 @@ class Player:
             self.inventory[item_name] -= 1
             if self.inventory[item_name] <= 0:
                 del self.inventory[item_name]
+            self.touch()
+    
+    def interpolate(self, alpha):
+        """Position to draw between the last two simulation steps (alpha 0..1)"""
+        self.render_position = self.previous_position.lerp(self.position, min(alpha, 1.0))
     
     def draw(self, screen, camera_offset):
-        """Draw player relative to camera"""
-        draw_pos = self.rect.topleft - camera_offset
-        screen.blit(self.image, draw_pos) 
+        """Draw player relative to camera. Returns the screen area it covers"""
+        if self.render_position is not None:
+            rect = self.image.get_rect(center=(int(self.render_position.x), int(self.render_position.y)))
+        else:
+            rect = self.rect
+        draw_pos = rect.topleft - camera_offset
+        return screen.blit(self.image, draw_pos)
     
     def draw_at_position(self, screen, position):
         """Draw player at specific position (for mentor locations)"""
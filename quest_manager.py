@@ -8,6 +8,7 @@ class QuestManager:
         self.quests_data = {}
         self.active_quests = {}
         self.completed_quests = []
+        self.version = 0  # Bumped when active/completed quests change (UI redraw)
         self.load_quests()
     
     def load_quests(self):
@@ -438,6 +439,12 @@ class QuestManager:
             }
         }
     
+    def touch(self, player=None):
+        """Mark quests (and the player's quest log) as changed"""
+        self.version += 1
+        if player is not None and hasattr(player, 'touch'):
+            player.touch()
+    
     def start_quest(self, quest_id, player):
         """Start a quest"""
         if quest_id in self.quests_data and quest_id not in self.active_quests:
@@ -445,6 +452,7 @@ class QuestManager:
             self.active_quests[quest_id] = quest
             if quest_id not in player.quest_log:
                 player.quest_log.append(quest_id)
+            self.touch(player)
             
             # Play quest start sound
             sound_manager = get_sound_manager()
@@ -533,6 +541,7 @@ class QuestManager:
                 if quest_id in player.quest_log:
                     player.quest_log.remove(quest_id)
                 self.completed_quests.append(quest_id)
+                self.touch(player)
                 
                 # Play quest completion sound
                 sound_manager = get_sound_manager()
@@ -558,6 +567,7 @@ class QuestManager:
         if quest_id in player.quest_log:
             player.quest_log.remove(quest_id)
         self.completed_quests.append(quest_id)
+        self.touch(player)
         
         # Play quest completion sound
         sound_manager = get_sound_manager()
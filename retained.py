@@ -0,0 +1,38 @@
+import pygame
+
+class RetainedSurface:
+    """
+    Поверхность виджета, которая перерисовывается только при смене версии.
+    version - любое хешируемое значение (счетчик изменений, кортеж показываемых чисел),
+    render(surface, *args) рисует виджет в координатах самой поверхности.
+    Пока версия та же, отрисовка виджета стоит один blit.
+    """
+    def __init__(self, size, render, alpha=True):
+        self.size = size
+        self.render = render
+        self.alpha = alpha
+        self.surface = None
+        self.version = None
+        self.valid = False
+        self.renders = 0
+    
+    def invalidate(self):
+        """Перерисовать при следующем обращении"""
+        self.valid = False
+    
+    def get(self, version, *args):
+        """Поверхность для версии version (перерисовывается, если версия сменилась)"""
+        if not self.valid or version != self.version:
+            if self.surface is None:
+                flags = pygame.SRCALPHA if self.alpha else 0
+                self.surface = pygame.Surface(self.size, flags)
+            self.surface.fill((0, 0, 0, 0))
+            self.render(self.surface, *args)
+            self.version = version
+            self.valid = True
+            self.renders += 1
+        return self.surface
+    
+    def draw(self, screen, position, version, *args):
+        """Нарисовать виджет на экране. Возвращает занятый прямоугольник"""
+        return screen.blit(self.get(version, *args), position)
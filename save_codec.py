@@ -0,0 +1,214 @@
+import json
+import struct
+import zlib
+
+# Версия формата сохранений. Увеличивать при несовместимых изменениях
+SAVE_FORMAT_VERSION = 1
+
+# Заголовок бинарного сохранения: магия, версия формата, флаги
+BINARY_MAGIC = b"NQSV"
+BINARY_HEADER = struct.Struct("<4sHH")
+FLAG_ZLIB = 1
+
+# Запись в журнале дельт: длина и crc32 сжатых данных
+DELTA_RECORD_HEADER = struct.Struct("<II")
+DELTA_SUFFIX = ".delta"
+
+# Метки типов в компактной упаковке (похоже на msgpack, но без зависимостей)
+TAG_NONE = b"N"
+TAG_TRUE = b"T"
+TAG_FALSE = b"F"
+TAG_INT = b"i"
+TAG_FLOAT = b"d"
+TAG_STR = b"s"
+TAG_LIST = b"l"
+TAG_DICT = b"m"
+
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+UINT32 = struct.Struct("<I")
+
+def pack_value(value, out):
+    """Упаковать JSON-совместимое значение в bytearray out"""
+    if value is None:
+        out += TAG_NONE
+    elif value is True:
+        out += TAG_TRUE
+    elif value is False:
+        out += TAG_FALSE
+    elif isinstance(value, int):
+        out += TAG_INT
+        out += INT64.pack(value)
+    elif isinstance(value, float):
+        out += TAG_FLOAT
+        out += FLOAT64.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        out += TAG_STR
+        out += UINT32.pack(len(encoded))
+        out += encoded
+    elif isinstance(value, (list, tuple)):
+        out += TAG_LIST
+        out += UINT32.pack(len(value))
+        for item in value:
+            pack_value(item, out)
+    elif isinstance(value, dict):
+        out += TAG_DICT
+        out += UINT32.pack(len(value))
+        for key, item in value.items():
+            # Ключи как в JSON - всегда строки
+            pack_value(key if isinstance(key, str) else json.dumps(key), out)
+            pack_value(item, out)
+    else:
+        raise TypeError(f"Нельзя сохранить значение типа {type(value).__name__}")
+
+def unpack_value(data, offset):
+    """Распаковать значение, начиная с offset. Возвращает (значение, новый offset)"""
+    tag = data[offset:offset + 1]
+    offset += 1
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    if tag == TAG_INT:
+        return INT64.unpack_from(data, offset)[0], offset + INT64.size
+    if tag == TAG_FLOAT:
+        return FLOAT64.unpack_from(data, offset)[0], offset + FLOAT64.size
+    if tag == TAG_STR:
+        length = UINT32.unpack_from(data, offset)[0]
+        offset += UINT32.size
+        return bytes(data[offset:offset + length]).decode("utf-8"), offset + length
+    if tag == TAG_LIST:
+        count = UINT32.unpack_from(data, offset)[0]
+        offset += UINT32.size
+        items = []
+        for _ in range(count):
+            item, offset = unpack_value(data, offset)
+            items.append(item)
+        return items, offset
+    if tag == TAG_DICT:
+        count = UINT32.unpack_from(data, offset)[0]
+        offset += UINT32.size
+        result = {}
+        for _ in range(count):
+            key, offset = unpack_value(data, offset)
+            result[key], offset = unpack_value(data, offset)
+        return result, offset
+    raise ValueError(f"Неизвестная метка типа {tag!r} на позиции {offset - 1}")
+
+def pack(value):
+    """Упаковать значение в bytes"""
+    out = bytearray()
+    pack_value(value, out)
+    return bytes(out)
+
+def unpack(data):
+    """Распаковать bytes, упакованные pack()"""
+    value, offset = unpack_value(memoryview(data), 0)
+    if offset != len(data):
+        raise ValueError("Лишние данные после сохранения")
+    return value
+
+class JsonCodec:
+    """Читаемые сохранения в JSON (для отладки)"""
+    name = "json"
+    extension = ".json"
+    supports_delta = False
+    
+    def encode(self, save_data):
+        return json.dumps(save_data, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    def decode(self, data):
+        return json.loads(data.decode("utf-8"))
+
+class BinaryCodec:
+    """
+    Компактные сохранения: заголовок с версией формата,
+    дальше упакованные pack() данные, сжатые zlib.
+    """
+    name = "binary"
+    extension = ".sav"
+    supports_delta = True
+    
+    def __init__(self, level=6):
+        self.level = level
+    
+    def encode(self, save_data):
+        header = BINARY_HEADER.pack(BINARY_MAGIC, SAVE_FORMAT_VERSION, FLAG_ZLIB)
+        return header + zlib.compress(pack(save_data), self.level)
+    
+    def decode(self, data):
+        if len(data) < BINARY_HEADER.size:
+            raise ValueError("Файл сохранения обрезан")
+        magic, version, flags = BINARY_HEADER.unpack_from(data, 0)
+        if magic != BINARY_MAGIC:
+            raise ValueError("Это не файл сохранения nQuester")
+        if version > SAVE_FORMAT_VERSION:
+            raise ValueError(f"Сохранение из более новой версии игры (формат {version})")
+        
+        payload = data[BINARY_HEADER.size:]
+        if flags & FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return unpack(payload)
+
+# Кодеки по имени и по расширению файла
+CODECS = {codec.name: codec for codec in (JsonCodec(), BinaryCodec())}
+CODECS_BY_EXTENSION = {codec.extension: codec for codec in CODECS.values()}
+SAVE_EXTENSIONS = tuple(CODECS_BY_EXTENSION)
+
+def get_codec(name):
+    """Кодек по имени ("json" или "binary")"""
+    if name not in CODECS:
+        raise ValueError(f"Неизвестный формат сохранений: {name}")
+    return CODECS[name]
+
+def get_codec_for_file(filename):
+    """Кодек по расширению файла (JSON, если расширение неизвестно)"""
+    for extension, codec in CODECS_BY_EXTENSION.items():
+        if filename.endswith(extension):
+            return codec
+    return CODECS["json"]
+
+def encode_delta_record(record):
+    """Одна запись журнала дельт: заголовок + сжатые данные"""
+    payload = zlib.compress(pack(record))
+    return DELTA_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def read_delta_records(data):
+    """
+    Разобрать журнал дельт. Оборванная или испорченная запись в конце
+    (сбой посреди дозаписи) и все, что после нее, отбрасываются.
+    """
+    records = []
+    offset = 0
+    while offset + DELTA_RECORD_HEADER.size <= len(data):
+        length, crc = DELTA_RECORD_HEADER.unpack_from(data, offset)
+        start = offset + DELTA_RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        try:
+            records.append(unpack(zlib.decompress(payload)))
+        except (ValueError, zlib.error):
+            break
+        offset = start + length
+    return records
+
+def get_field(save_data, path):
+    """Значение поля по пути вида "player.position" (None, если его нет)"""
+    value = save_data
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+def set_field(save_data, path, value):
+    """Записать значение поля по пути вида "player.position" """
+    keys = path.split(".")
+    target = save_data
+    for key in keys[:-1]:
+        target = target.setdefault(key, {})
+    target[keys[-1]] = value
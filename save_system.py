@@ -1,60 +1,256 @@
 import json
 import os
+import copy
+import time
 import pickle
+import threading
 from datetime import datetime
+from settings import *
 from sound_manager import get_sound_manager
+from save_codec import (get_codec, get_codec_for_file, encode_delta_record, read_delta_records,
+                        get_field, set_field, SAVE_EXTENSIONS, DELTA_SUFFIX)
+
+# Поля, которые дельта-автосейв сравнивает с последним полным снимком
+DELTA_FIELDS = [
+    "player.position", "player.current_users", "player.inventory", "player.quest_log",
+    "game_stats", "completed_quests", "active_quests", "achievements"
+]
 
 class SaveSystem:
-    def __init__(self):
-        self.save_dir = "data/saves/"
+    """
+    Сохранения в data/saves.
+    В асинхронном режиме главный поток только снимает снимок состояния,
+    а сериализация и запись на диск идут в фоновом потоке. Запись атомарная
+    (временный файл + fsync + rename), повторные запросы того же файла,
+    пришедшие пока идет запись, схлопываются в одну запись последнего снимка.
+    Звук успеха или ошибки асинхронной записи играет poll_results() в главном
+    потоке, когда запись действительно закончилась.
+    
+    Формат задает SAVE_CODEC: "binary" (компактный, zlib) или "json" (для отладки).
+    Автосейв в бинарном формате дописывает в журнал .delta только изменившиеся
+    поля, а каждые SAVE_COMPACT_EVERY дельт снова пишется целиком.
+    """
+    def __init__(self, async_saves=SAVE_ASYNC, codec=SAVE_CODEC, save_dir=SAVES_PATH):
+        self.save_dir = save_dir
         os.makedirs(self.save_dir, exist_ok=True)
+        
+        # Заголовки слотов для экрана загрузки
+        self.index = SaveIndex(self.save_dir, self.read_save_data)
+        
+        self.codec = get_codec(codec)
+        
+        # Дельта-автосейвы (трогает только поток записи): имя файла -> поля на диске
+        self.delta_fields = {}
+        self.delta_counts = {}  # имя файла -> дельт с последнего полного снимка
+        self.delta_generations = {}  # имя файла -> поколение полного снимка
+        
+        self.async_saves = async_saves
+        self.pending = {}  # имя файла -> (снимок, можно ли дельтой), ожидающий записи
+        self.condition = threading.Condition()
+        self.writing = False
+        self.worker = None
+        self.results = []  # (имя файла, записано ли) законченных фоновых записей
+        
+        # Статистика: сколько главный поток простоял в save_game (рывок кадра)
+        self.saves_requested = 0
+        self.saves_written = 0
+        self.saves_coalesced = 0
+        self.deltas_written = 0
+        self.saves_skipped = 0
+        self.last_hitch_ms = 0.0
+        self.max_hitch_ms = 0.0
+        self.last_write_ms = 0.0
+    
+    def snapshot(self, game_state):
+        """Снимок состояния игры (глубокая копия - игра может менять его дальше)"""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "player": {
+                "position": [game_state.player.position.x, game_state.player.position.y],
+                "current_users": game_state.player.current_users,
+                "inventory": copy.deepcopy(game_state.player.inventory),
+                "quest_log": copy.deepcopy(game_state.player.quest_log)
+            },
+            "game_stats": game_state.game_stats.to_dict(),
+            "completed_quests": copy.deepcopy(game_state.quest_manager.completed_quests),
+            "active_quests": list(game_state.quest_manager.active_quests.keys()),
+            "achievements": {
+                achievement_id: achievement.unlocked 
+                for achievement_id, achievement in game_state.achievement_manager.achievements.items()
+            }
+        }
     
-    def save_game(self, game_state, filename=None):
-        """Save game state to file"""
+    def save_game(self, game_state, filename=None, delta=False):
+        """
+        Save game state to file (delta=True - only changed fields, if the codec supports it).
+        In async mode True means "queued": the outcome is reported by poll_results()
+        """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"save_{timestamp}.json"
-        
-        filepath = os.path.join(self.save_dir, filename)
+            filename = f"save_{timestamp}{self.codec.extension}"
         
+        started = time.perf_counter()
+        queued = False
         try:
             # Prepare save data
-            save_data = {
-                "timestamp": datetime.now().isoformat(),
-                "player": {
-                    "position": [game_state.player.position.x, game_state.player.position.y],
-                    "current_users": game_state.player.current_users,
-                    "inventory": game_state.player.inventory,
-                    "quest_log": game_state.player.quest_log
-                },
-                "game_stats": game_state.game_stats,
-                "completed_quests": game_state.quest_manager.completed_quests,
-                "active_quests": list(game_state.quest_manager.active_quests.keys()),
-                "achievements": {
-                    achievement_id: achievement.unlocked 
-                    for achievement_id, achievement in game_state.achievement_manager.achievements.items()
-                }
-            }
+            save_data = self.snapshot(game_state)
             
-            # Save to JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"✅ Game saved: {filepath}")
-            
-            # Play save success sound
-            sound_manager = get_sound_manager()
+            if self.async_saves:
+                self.queue_write(filename, save_data, delta)
+                result = queued = True
+            else:
+                result = self.write_save(filename, save_data, delta)
+        except Exception as e:
+            print(f"❌ Failed to save game: {e}")
+            result = False
+        
+        self.record_hitch(started)
+        
+        if not queued:
+            self.report_result(filename, result)
+        return result
+    
+    def report_result(self, filename, written):
+        """Звук по итогу записи (только из главного потока)"""
+        sound_manager = get_sound_manager()
+        if written:
             if sound_manager:
                 sound_manager.play_success()
+        else:
+            print(f"❌ Сохранение не записано: {filename}")
+            if sound_manager:
+                sound_manager.play_error()
+    
+    def poll_results(self):
+        """Главный поток: сообщить об итогах законченных фоновых записей"""
+        if not self.results:
+            return
+        with self.condition:
+            results, self.results = self.results, []
+        for filename, written in results:
+            self.report_result(filename, written)
+    
+    def record_hitch(self, started):
+        """Запомнить, сколько миллисекунд save_game занял главный поток"""
+        self.saves_requested += 1
+        self.last_hitch_ms = (time.perf_counter() - started) * 1000
+        self.max_hitch_ms = max(self.max_hitch_ms, self.last_hitch_ms)
+    
+    def write_save(self, filename, save_data, delta=False):
+        """Сериализовать и атомарно записать сохранение (вызывается из любого потока)"""
+        filepath = os.path.join(self.save_dir, filename)
+        codec = get_codec_for_file(filename)
+        started = time.perf_counter()
+        try:
+            fields = {path: get_field(save_data, path) for path in DELTA_FIELDS}
+            written = self.delta_fields.get(filename)
             
-            return True
+            if delta and codec.supports_delta and written is not None:
+                changes = {path: value for path, value in fields.items() if written.get(path) != value}
+                if not changes:
+                    # Ничего не изменилось - диск не трогаем
+                    self.saves_skipped += 1
+                    return True
+                if self.delta_counts[filename] < SAVE_COMPACT_EVERY:
+                    self.append_delta(filepath, filename, save_data["timestamp"], changes)
+                    written.update(changes)
+                    self.delta_counts[filename] += 1
+                    self.deltas_written += 1
+                    self.index.update(filename, save_data)
+                    self.last_write_ms = (time.perf_counter() - started) * 1000
+                    return True
             
+            # Полный снимок (он же сжатие журнала дельт)
+            generation = time.time_ns()
+            if codec.supports_delta:
+                save_data = dict(save_data, generation=generation)
+            write_atomic(filepath, codec.encode(save_data))
+            if os.path.exists(filepath + DELTA_SUFFIX):
+                os.remove(filepath + DELTA_SUFFIX)
         except Exception as e:
             print(f"❌ Failed to save game: {e}")
             return False
+        
+        self.delta_fields[filename] = fields
+        self.delta_counts[filename] = 0
+        self.delta_generations[filename] = generation
+        self.index.update(filename, save_data)
+        self.last_write_ms = (time.perf_counter() - started) * 1000
+        self.saves_written += 1
+        print(f"✅ Game saved: {filepath}")
+        return True
+    
+    def append_delta(self, filepath, filename, timestamp, changes):
+        """Дописать изменения в журнал дельт рядом с полным снимком"""
+        record = {
+            "generation": self.delta_generations[filename],
+            "timestamp": timestamp,
+            "changes": changes
+        }
+        with open(filepath + DELTA_SUFFIX, 'ab') as f:
+            f.write(encode_delta_record(record))
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def queue_write(self, filename, save_data, delta=False):
+        """Поставить снимок в очередь фоновой записи (более новый снимок заменяет старый)"""
+        with self.condition:
+            if filename in self.pending:
+                self.saves_coalesced += 1
+                # Если в очереди был полный снимок, новый тоже пишем целиком
+                delta = delta and self.pending[filename][1]
+            self.pending[filename] = (save_data, delta)
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.write_loop, name="save-writer", daemon=True)
+                self.worker.start()
+            self.condition.notify()
+    
+    def write_loop(self):
+        """Фоновый поток: пишет снимки из очереди по одному"""
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                filename = next(iter(self.pending))
+                save_data, delta = self.pending.pop(filename)
+                self.writing = True
+            
+            written = False
+            try:
+                written = self.write_save(filename, save_data, delta)
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.results.append((filename, written))
+                    self.condition.notify_all()
+    
+    def flush(self, timeout=None):
+        """Дождаться записи всех запрошенных сохранений"""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.writing, timeout)
+    
+    def get_stats(self):
+        """Статистика сохранений"""
+        with self.condition:
+            pending = len(self.pending) + (1 if self.writing else 0)
+        return {
+            "async": self.async_saves,
+            "codec": self.codec.name,
+            "requested": self.saves_requested,
+            "written": self.saves_written,
+            "deltas": self.deltas_written,
+            "skipped": self.saves_skipped,
+            "coalesced": self.saves_coalesced,
+            "pending": pending,
+            "last_hitch_ms": round(self.last_hitch_ms, 2),
+            "max_hitch_ms": round(self.max_hitch_ms, 2),
+            "last_write_ms": round(self.last_write_ms, 2)
+        }
     
     def load_game(self, game_state, filename):
         """Load game state from file"""
+        # Сначала дописываем то, что еще в очереди (F9 сразу после F5)
+        self.flush()
         filepath = os.path.join(self.save_dir, filename)
         
         if not os.path.exists(filepath):
@@ -62,8 +258,7 @@ class SaveSystem:
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = self.read_save_data(filepath)
             
             # Restore player data
             player_data = save_data.get("player", {})
@@ -76,10 +271,6 @@ class SaveSystem:
             if "quest_log" in player_data:
                 game_state.player.quest_log = player_data["quest_log"]
             
-            # Restore game stats
-            if "game_stats" in save_data:
-                game_state.game_stats.update(save_data["game_stats"])
-            
             # Restore quest data
             if "completed_quests" in save_data:
                 game_state.quest_manager.completed_quests = save_data["completed_quests"]
@@ -89,11 +280,19 @@ class SaveSystem:
                     if quest_data:
                         game_state.quest_manager.active_quests[quest_id] = quest_data
             
-            # Restore achievements
+            # Restore achievements (before stats, so loading doesn't re-announce them)
             if "achievements" in save_data and game_state.achievement_manager:
                 for achievement_id, unlocked in save_data["achievements"].items():
                     if achievement_id in game_state.achievement_manager.achievements:
-                        game_state.achievement_manager.achievements[achievement_id].unlocked = unlocked
+                        game_state.achievement_manager.set_unlocked(achievement_id, unlocked)
+            
+            # Restore game stats
+            if "game_stats" in save_data:
+                game_state.game_stats.update(save_data["game_stats"])
+            
+            # Journal and HUD redraw from the loaded state
+            game_state.player.touch()
+            game_state.quest_manager.touch()
             
             print(f"✅ Game loaded: {filepath}")
             
@@ -103,32 +302,38 @@ class SaveSystem:
                 sound_manager.play_success()
             
             return True
-            
+        
         except Exception as e:
             print(f"❌ Failed to load game: {e}")
             return False
     
+    def read_save_data(self, filepath):
+        """Прочитать файл сохранения целиком (с примененным журналом дельт)"""
+        with open(filepath, 'rb') as f:
+            save_data = get_codec_for_file(filepath).decode(f.read())
+        
+        delta_path = filepath + DELTA_SUFFIX
+        if os.path.exists(delta_path):
+            with open(delta_path, 'rb') as f:
+                records = read_delta_records(f.read())
+            for record in records:
+                # Журнал от предыдущего полного снимка (сбой до его удаления) пропускаем
+                if record.get("generation") != save_data.get("generation"):
+                    continue
+                save_data["timestamp"] = record.get("timestamp", save_data.get("timestamp"))
+                for path, value in record.get("changes", {}).items():
+                    set_field(save_data, path, value)
+        return save_data
+    
     def get_save_files(self):
-        """Get list of available save files"""
+        """Get list of available save files (from the slot index, without parsing saves)"""
+        self.flush()
         save_files = []
-        if os.path.exists(self.save_dir):
-            for filename in os.listdir(self.save_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.save_dir, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            save_data = json.load(f)
-                        
-                        save_info = {
-                            "filename": filename,
-                            "timestamp": save_data.get("timestamp", ""),
-                            "users": save_data.get("player", {}).get("current_users", 0),
-                            "completed_quests": len(save_data.get("completed_quests", [])),
-                            "filepath": filepath
-                        }
-                        save_files.append(save_info)
-                    except:
-                        continue
+        for filename, header in self.index.refresh().items():
+            save_info = dict(header)
+            save_info["filename"] = filename
+            save_info["filepath"] = os.path.join(self.save_dir, filename)
+            save_files.append(save_info)
         
         # Sort by timestamp (newest first)
         save_files.sort(key=lambda x: x["timestamp"], reverse=True)
@@ -136,18 +341,30 @@ class SaveSystem:
     
     def auto_save(self, game_state):
         """Auto-save game"""
-        return self.save_game(game_state, "autosave.json")
+        return self.save_game(game_state, f"autosave{self.codec.extension}", delta=SAVE_DELTA_AUTOSAVES)
     
     def load_autosave(self, game_state):
         """Load auto-save if available"""
-        return self.load_game(game_state, "autosave.json")
+        filename = f"autosave{self.codec.extension}"
+        if not os.path.exists(os.path.join(self.save_dir, filename)):
+            # Автосейв, записанный в другом формате (например, до смены SAVE_CODEC)
+            for extension in SAVE_EXTENSIONS:
+                if os.path.exists(os.path.join(self.save_dir, f"autosave{extension}")):
+                    filename = f"autosave{extension}"
+                    break
+        return self.load_game(game_state, filename)
     
     def delete_save(self, filename):
         """Delete a save file"""
+        self.flush()
         filepath = os.path.join(self.save_dir, filename)
         if os.path.exists(filepath):
             try:
                 os.remove(filepath)
+                if os.path.exists(filepath + DELTA_SUFFIX):
+                    os.remove(filepath + DELTA_SUFFIX)
+                self.delta_fields.pop(filename, None)
+                self.index.remove(filename)
                 print(f"✅ Deleted save: {filename}")
                 return True
             except Exception as e:
@@ -155,13 +372,140 @@ class SaveSystem:
                 return False
         return False
 
+class SaveIndex:
+    """
+    Индекс слотов: для каждого файла сохранения хранит заголовок
+    (время, пользователи, число квестов) вместе с mtime и размером файла.
+    Обновляется при каждой записи и удалении. Если файлы меняли в обход игры,
+    refresh() перечитывает только те, у которых изменились mtime или размер.
+    """
+    def __init__(self, save_dir, reader, filename="slots.idx"):
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, filename)
+        self.reader = reader  # функция: путь -> данные сохранения
+        self.entries = None  # имя файла -> заголовок, читается лениво
+        self.lock = threading.Lock()
+        self.parsed = 0  # сколько сохранений пришлось разобрать целиком
+    
+    def read_header(self, save_data):
+        """Заголовок слота из данных сохранения"""
+        return {
+            "timestamp": save_data.get("timestamp", ""),
+            "users": save_data.get("player", {}).get("current_users", 0),
+            "completed_quests": len(save_data.get("completed_quests", []))
+        }
+    
+    def load(self):
+        """Прочитать индекс с диска (один раз)"""
+        if self.entries is not None:
+            return
+        self.entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass  # нет индекса или он поврежден - refresh() соберет заново
+    
+    def save(self):
+        """Записать индекс на диск"""
+        try:
+            write_atomic(self.path, json.dumps(self.entries, ensure_ascii=False))
+        except OSError as e:
+            print(f"⚠️ Не удалось записать индекс сохранений: {e}")
+    
+    def stamp(self, header, filepath):
+        """Добавить к заголовку mtime и размер файла"""
+        stat = os.stat(filepath)
+        header["mtime"] = stat.st_mtime_ns
+        header["size"] = stat.st_size
+        return header
+    
+    def update(self, filename, save_data):
+        """Обновить слот после записи сохранения"""
+        with self.lock:
+            self.load()
+            header = self.stamp(self.read_header(save_data), os.path.join(self.save_dir, filename))
+            self.entries[filename] = header
+            self.save()
+    
+    def remove(self, filename):
+        """Убрать слот после удаления файла"""
+        with self.lock:
+            self.load()
+            if self.entries.pop(filename, None) is not None:
+                self.save()
+    
+    def refresh(self):
+        """Сверить индекс с папкой по mtime/размеру и вернуть копию: имя файла -> заголовок"""
+        with self.lock:
+            self.load()
+            changed = False
+            seen = set()
+            
+            for entry in os.scandir(self.save_dir):
+                if not entry.name.endswith(SAVE_EXTENSIONS) or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                cached = self.entries.get(entry.name)
+                if cached and cached.get("mtime") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                    continue
+                
+                # Новый или измененный файл - разбираем только его
+                try:
+                    header = self.read_header(self.reader(entry.path))
+                except Exception:
+                    self.entries.pop(entry.name, None)
+                    changed = True
+                    continue
+                header["mtime"] = stat.st_mtime_ns
+                header["size"] = stat.st_size
+                self.entries[entry.name] = header
+                self.parsed += 1
+                changed = True
+            
+            # Файлы, удаленные в обход игры
+            for filename in [name for name in self.entries if name not in seen]:
+                del self.entries[filename]
+                changed = True
+            
+            if changed:
+                self.save()
+            return {filename: dict(header) for filename, header in self.entries.items()}
+
+def write_atomic(filepath, data):
+    """
+    Записать файл атомарно: временный файл рядом, fsync, затем rename.
+    Если игра упадет посреди записи, старое сохранение останется целым.
+    """
+    directory = os.path.dirname(filepath) or "."
+    temp_path = f"{filepath}.tmp"
+    mode = 'wb' if isinstance(data, bytes) else 'w'
+    with open(temp_path, mode, encoding=None if mode == 'wb' else 'utf-8') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, filepath)
+    
+    # Чтобы сам rename пережил сбой питания (на Windows каталог не открыть)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
 # Global save system
 save_system = None
 
-def init_save_system():
+def init_save_system(save_dir=SAVES_PATH):
     """Initialize the global save system"""
     global save_system
-    save_system = SaveSystem()
+    save_system = SaveSystem(save_dir=save_dir)
     return save_system
 
 def get_save_system():
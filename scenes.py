@@ -0,0 +1,160 @@
+import pygame
+from settings import RENDER_FPS
+from game_clock import GameClock
+
+class Scene:
+    """
+    Экран поверх игры (мини-игра, битва, концовка), которым управляет главный цикл.
+    Вместо собственного while True сцена получает события в handle_event,
+    шаги симуляции в update(dt) и кадры в draw(screen).
+    Закончив, сцена вызывает finish(result), и стек ее снимает.
+    """
+    def __init__(self):
+        self.finished = False
+        self.result = None
+        self.timers = []
+    
+    def enter(self):
+        """Сцена стала активной"""
+        pass
+    
+    def exit(self):
+        """Сцена снята со стека"""
+        pass
+    
+    def handle_event(self, event):
+        pass
+    
+    def update(self, dt):
+        self.update_timers(dt)
+    
+    def draw(self, screen):
+        pass
+    
+    def finish(self, result=None):
+        """Закончить сцену с результатом"""
+        self.finished = True
+        self.result = result
+    
+    def after(self, seconds, callback):
+        """Вызвать callback через seconds секунд игрового времени, не останавливая цикл"""
+        self.timers.append([seconds, callback])
+    
+    def update_timers(self, dt):
+        for timer in list(self.timers):
+            timer[0] -= dt
+            if timer[0] <= 0:
+                self.timers.remove(timer)
+                timer[1]()
+
+class CoroutineScene(Scene):
+    """
+    Сцена из генератора. Мини-игры написаны циклом шагов: вместо clock.tick
+    они делают yield draw_frame (и получают dt), вместо pygame.time.wait -
+    yield from host.pause(seconds, draw_frame). Генератор - это update(): логика
+    и события (host.poll_events()). Отданную функцию вызывает draw() - один раз
+    на кадр, а не на каждый шаг симуляции; она рисует на host.screen (отдельный холст).
+    Значение, которое вернул генератор, - результат сцены.
+    """
+    def __init__(self, routine, host):
+        super().__init__()
+        self.routine = routine
+        self.host = host
+        self.view = None  # функция отрисовки текущего состояния
+    
+    def enter(self):
+        self.host.events = []
+        # До первого yield: подготовка игры. Первая функция отрисовки может читать
+        # состояние, которое игра считает только в первом шаге, - ее не вызываем
+        self.resume(None)
+        self.view = None
+    
+    def exit(self):
+        self.routine.close()
+    
+    def handle_event(self, event):
+        self.host.events.append(event)
+    
+    def update(self, dt):
+        super().update(dt)
+        if not self.finished:
+            self.resume(dt)
+    
+    def resume(self, dt):
+        try:
+            self.view = self.routine.send(dt)
+        except StopIteration as stop:
+            self.finish(stop.value)
+    
+    def draw(self, screen):
+        if self.view is not None:
+            self.view()
+        screen.blit(self.host.screen, (0, 0))
+
+class SceneStack:
+    """Стек сцен: события, обновление и отрисовка идут в верхнюю сцену"""
+    def __init__(self):
+        self.scenes = []  # пары (сцена, on_finish)
+    
+    @property
+    def active(self):
+        return bool(self.scenes)
+    
+    def top(self):
+        return self.scenes[-1][0] if self.scenes else None
+    
+    def push(self, scene, on_finish=None):
+        """Показать сцену; on_finish(result) вызывается, когда она закончится"""
+        self.scenes.append((scene, on_finish))
+        scene.enter()
+        self.pop_finished()
+    
+    def handle_event(self, event):
+        if self.scenes:
+            self.top().handle_event(event)
+    
+    def update(self, dt):
+        if self.scenes:
+            self.top().update(dt)
+            self.pop_finished()
+    
+    def draw(self, screen):
+        if self.scenes:
+            self.top().draw(screen)
+    
+    def pop_finished(self):
+        # on_finish может сразу показать следующую сцену (битва -> концовка)
+        while self.scenes and self.top().finished:
+            scene, on_finish = self.scenes.pop()
+            scene.exit()
+            if on_finish:
+                on_finish(scene.result)
+
+def run_scene(scene):
+    """
+    Показать сцену до ее окончания, пока игры еще нет (меню, вступление).
+    Тот же фиксированный шаг, что и в Game.run. Возвращает результат сцены
+    или "exit", если окно закрыли.
+    """
+    clock = pygame.time.Clock()
+    game_clock = GameClock()
+    stack = SceneStack()
+    stack.push(scene)
+    
+    while stack.active:
+        game_clock.add_frame_time(clock.tick(RENDER_FPS) / 1000.0)
+        
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return "exit"
+            stack.handle_event(event)
+        
+        while stack.active and game_clock.consume_step():
+            stack.update(game_clock.step)
+        
+        if stack.active:
+            # После F11 у дисплея новая поверхность
+            stack.draw(pygame.display.get_surface())
+            pygame.display.flip()
+    
+    return scene.result
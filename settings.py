@@ -2,6 +2,11 @@
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+# Симуляция всегда идет с фиксированным шагом, отрисовка - со своей частотой
+SIMULATION_HZ = 60
+RENDER_FPS = FPS  # 0 - без ограничения (например, вместе с VSYNC); 30 для слабых ноутбуков
+VSYNC = False
+MAX_FRAME_TIME = 0.25  # секунд; более длинный кадр симуляция не догоняет
 TILE_SIZE = 32
 
 # Colors
@@ -22,6 +27,26 @@ DIALOGUE_BG_COLOR = (20, 20, 40, 230)
 MENTORS_PATH = "Mentors/"
 MAPS_PATH = "Base and Full Map + HD Images/"
 SOUNDS_PATH = "data/sounds/"
+ATLAS_PATH = "data/atlas/"
+BAKE_PATH = "data/baked/"
+MINIGAME_GIF_PATH = "tumblr_owi25v6uAo1r4gsiio1_1280_gif (1000×300).gif"
+LOCATIONS_PATH = MAPS_PATH + "locations/"
+
+# Mentors: name -> (specialty, room background in LOCATIONS_PATH).
+# Faces are MENTORS_PATH/<name>.png; the atlas and asset_bake take the roster from here
+MENTORS = {
+    "Alikhan": ("iOS", "download.jpg"),
+    "Alibeck": ("AI/ML", "download (1).jpg"),
+    "Bahredin": ("TypeScript", "download (2).jpg"),
+    "Bahaudin": ("Backend", "download (3).jpg"),
+    "Gaziz": ("Frontend", "Fantastic Buildings_ Modern.jpg"),
+    "Shoqan": ("Frontend", "smockup_0.jpg"),
+    "Zhasulan": ("iOS", "d7c191ec41394bd18a55762e78961873.jpg"),
+    "Aimurat": ("AI/ML", "download.jpg"),  # reuse
+    "Bernar": ("BOSS", "Fantastic Buildings_ Modern.jpg"),  # reuse
+    "Diana": ("Frontend", "download.jpg"),  # reuse
+    "Tamyrlan": ("Backend", "download.jpg")  # reuse
+}
 
 # Game states
 EXPLORATION = "exploration"
@@ -31,7 +56,7 @@ QUEST = "quest"
 MENU = "menu"
 
 # Player settings
-PLAYER_SPEED = 4
+PLAYER_SPEED = 240  # пикселей в секунду (раньше 4 за кадр при 60 FPS)
 MENTOR_LOCATION_SPEED = 150  # Увеличиваю скорость в локации ментора
 ANIMATION_SPEED = 0.1
 
@@ -42,4 +67,22 @@ TARGET_USERS = 10000
 SOUND_ENABLED = True
 MUSIC_ENABLED = True
 SOUND_VOLUME = 0.7
-MUSIC_VOLUME = 0.5 
\ No newline at end of file
+MUSIC_VOLUME = 0.5 
+# Collision settings
+# Вода на текущей карте не блокирует: NPC квестов стоят над водой
+COLLISION_BLOCK_WATER = False
+PLAYER_HITBOX_SIZE = (20, 20)
+
+# Save settings
+SAVES_PATH = "data/saves/"
+# Сохранения пишутся в фоновом потоке, кадр не ждет диск
+SAVE_ASYNC = True
+# "binary" - компактный формат с zlib, "json" - читаемый, для отладки
+SAVE_CODEC = "binary"
+# Автосейв дописывает только изменившиеся поля
+SAVE_DELTA_AUTOSAVES = True
+SAVE_COMPACT_EVERY = 20  # после стольких дельт автосейв пишется целиком
+
+# Rendering
+# Перерисовывать только изменившиеся области (слабые ноутбуки, киоски)
+DIRTY_RECT_RENDERING = False
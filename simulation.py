@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+nQuester: Incubator Rush - headless simulation
+Настоящий Game.update без окна и звука: бот ходит к NPC, берет квесты
+и сам завершает мини-игры, а симуляция крутится так быстро, как может.
+В конце - тики в секунду и время по подсистемам.
+
+    python simulation.py --ticks 36000 --seed 1 --json report.json
+"""
+
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+
+# Без окна и звука (до импорта pygame)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import *
+
+class BotKeys:
+    """Зажатые ботом клавиши вместо pygame.key.get_pressed (клавиатуры в headless нет)"""
+    def __init__(self):
+        self.held = set()
+    
+    def __getitem__(self, key):
+        return key in self.held
+    
+    def get_pressed(self):
+        return self
+    
+    def hold(self, keys):
+        self.held = set(keys)
+    
+    def release(self):
+        self.held = set()
+
+class ScriptedBot:
+    """
+    Сценарий игрока: обойти всех NPC по очереди, поговорить, взять квест,
+    мини-игру (битву, концовку) завершить через scene_time секунд
+    с успехом с вероятностью win_rate. Сценарий - генератор, один yield = один тик.
+    """
+    def __init__(self, game, keys, win_rate=1.0, scene_time=2.0, walk_timeout=20.0):
+        self.game = game
+        self.keys = keys
+        self.win_rate = win_rate
+        self.scene_ticks = int(scene_time * SIMULATION_HZ)
+        self.walk_ticks = int(walk_timeout * SIMULATION_HZ)
+        self.script = self.play()
+        
+        # Статистика
+        self.stats = {
+            "npcs_visited": 0,
+            "mentor_rooms": 0,
+            "dialogue_lines": 0,
+            "scenes_resolved": 0,
+            "scenes_won": 0,
+            "teleports": 0,
+            "rounds": 0
+        }
+    
+    def tick(self):
+        """Решить, что нажать в этом тике"""
+        next(self.script)
+    
+    def press(self, key):
+        """Нажать и отпустить клавишу (через очередь событий, как настоящий ввод)"""
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+    
+    def steer(self, dx, dy, tolerance):
+        """Зажать стрелки в сторону цели"""
+        keys = []
+        if dx > tolerance:
+            keys.append(pygame.K_RIGHT)
+        elif dx < -tolerance:
+            keys.append(pygame.K_LEFT)
+        if dy > tolerance:
+            keys.append(pygame.K_DOWN)
+        elif dy < -tolerance:
+            keys.append(pygame.K_UP)
+        self.keys.hold(keys)
+    
+    def play(self):
+        while True:
+            self.stats["rounds"] += 1
+            for npc in list(self.game.level.npcs):
+                yield from self.visit(npc)
+    
+    def visit(self, npc):
+        game = self.game
+        yield from self.walk_to(npc)
+        self.stats["npcs_visited"] += 1
+        
+        self.press(pygame.K_e)
+        yield
+        
+        if game.in_mentor_location:
+            self.stats["mentor_rooms"] += 1
+            yield from self.walk_to_mentor()
+            self.press(pygame.K_e)
+            yield
+        
+        yield from self.converse()
+        
+        if game.in_mentor_location:
+            self.press(pygame.K_ESCAPE)
+            yield
+    
+    def walk_to(self, npc):
+        """Дойти до NPC по карте; если застряли у стены - переставить рядом"""
+        player = self.game.player
+        best_distance = player.position.distance_to(npc.position)
+        stuck_ticks = 0
+        
+        for _ in range(self.walk_ticks):
+            if npc.can_interact(player.position):
+                break
+            offset = npc.position - player.position
+            self.steer(offset.x, offset.y, 4)
+            yield
+            
+            distance = player.position.distance_to(npc.position)
+            if distance < best_distance - 1:
+                best_distance = distance
+                stuck_ticks = 0
+            else:
+                stuck_ticks += 1
+                if stuck_ticks > SIMULATION_HZ:
+                    break
+        
+        self.keys.release()
+        if not npc.can_interact(player.position):
+            self.teleport(npc.position + pygame.math.Vector2(0, npc.interaction_range / 2))
+            yield
+    
+    def teleport(self, position):
+        player = self.game.player
+        player.position.update(position)
+        player.previous_position.update(position)
+        player.rect.center = (round(position[0]), round(position[1]))
+        self.stats["teleports"] += 1
+    
+    def walk_to_mentor(self):
+        """Подойти к ментору внутри его комнаты"""
+        location = self.game.mentor_location_manager.get_current_location()
+        if location is None:
+            return
+        target = (location.mentor_x + 60, location.mentor_y + 60)
+        
+        for _ in range(self.walk_ticks):
+            position = location.get_player_position()
+            if location.check_mentor_interaction(position):
+                break
+            self.steer(target[0] - position[0], target[1] - position[1], 8)
+            yield
+        
+        self.keys.release()
+        if not location.check_mentor_interaction(location.get_player_position()):
+            location.player_x, location.player_y = target
+            self.stats["teleports"] += 1
+    
+    def converse(self):
+        """Пролистать диалоги и завершить все сцены, пока игра не вернется к исследованию"""
+        game = self.game
+        dialogue_ticks = SIMULATION_HZ // 4
+        
+        while True:
+            if game.scenes.active:
+                yield from self.resolve_scene()
+            elif game.state == DIALOGUE:
+                self.press(pygame.K_e)
+                self.stats["dialogue_lines"] += 1
+                for _ in range(dialogue_ticks):
+                    yield
+            else:
+                return
+    
+    def resolve_scene(self):
+        """Дать сцене поработать scene_ticks тиков, потом завершить ее за игрока"""
+        scene = self.game.scenes.top()
+        for _ in range(self.scene_ticks):
+            if scene.finished or self.game.scenes.top() is not scene:
+                return
+            yield
+        
+        won = random.random() < self.win_rate
+        self.stats["scenes_resolved"] += 1
+        if won:
+            self.stats["scenes_won"] += 1
+        scene.finish(won)
+        yield
+
+class SubsystemTimer:
+    """
+    Время по подсистемам: методы объектов игры подменяются на экземпляре
+    обертками с perf_counter. Сама игра ничего не знает о замерах.
+    """
+    def __init__(self):
+        self.totals = {}
+        self.calls = {}
+    
+    def wrap(self, name, obj, method_name):
+        if obj is None:
+            return
+        original = getattr(obj, method_name)
+        totals = self.totals
+        calls = self.calls
+        totals.setdefault(name, 0.0)
+        calls.setdefault(name, 0)
+        
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                totals[name] += time.perf_counter() - started
+                calls[name] += 1
+        
+        setattr(obj, method_name, timed)
+    
+    def attach(self, game):
+        """Обернуть то, что Game.update и Game.handle_events вызывают каждый тик"""
+        self.wrap("update", game, "update")
+        self.wrap("handle_events", game, "handle_events")
+        self.wrap("player", game.player, "update")
+        self.wrap("level", game.level, "update")
+        self.wrap("mentor_location", game.mentor_location_manager, "update_player_movement")
+        self.wrap("scenes", game.scenes, "update")
+        self.wrap("improvement_manager", game.improvement_manager, "update")
+        self.wrap("music", game.sound_manager, "update")
+        self.wrap("achievements", game.game_stats, "notify")
+        self.wrap("ui", game.ui, "update_typing_animation")
+        self.wrap("ui", game.ui, "update_journal_gif_background")
+        self.wrap("ui", game.ui, "update_quest_gif_background")
+        self.wrap("autosave", game.save_system, "auto_save")
+        self.wrap("quests", game.quest_manager, "start_quest")
+        self.wrap("quests", game.quest_manager, "complete_quest")
+
+def run_simulation(ticks=36000, seed=1, win_rate=1.0, scene_time=2.0):
+    """
+    Прогнать ticks шагов симуляции с ботом. Возвращает отчет (dict):
+    тики в секунду, время по подсистемам и статистику бота.
+    """
+    random.seed(seed)
+    
+    import main
+    from game_clock import get_game_clock
+    
+    # Автосейвы бота не должны затирать настоящие сохранения: временная папка, удаляется после прогона
+    with tempfile.TemporaryDirectory(prefix="nquester_sim_") as save_dir:
+        game = main.Game(save_dir=save_dir)
+        
+        keys = BotKeys()
+        pygame.key.get_pressed = keys.get_pressed
+        bot = ScriptedBot(game, keys, win_rate=win_rate, scene_time=scene_time)
+        timer = SubsystemTimer()
+        timer.attach(game)
+        clock = get_game_clock()
+        
+        started = time.perf_counter()
+        for _ in range(ticks):
+            bot.tick()
+            game.handle_events()
+            clock.add_frame_time(clock.step)
+            while clock.consume_step():
+                game.update(clock.step)
+            if not game.running:
+                break
+        elapsed = time.perf_counter() - started
+        game.save_system.flush()
+    
+    done = clock.steps
+    return {
+        "ticks": done,
+        "seed": seed,
+        "wall_time": elapsed,
+        "ticks_per_second": done / elapsed if elapsed else 0.0,
+        "simulated_seconds": done * clock.step,
+        "realtime_factor": done * clock.step / elapsed if elapsed else 0.0,
+        "subsystems": {
+            name: {
+                "total_ms": total * 1000,
+                "calls": timer.calls[name],
+                "us_per_tick": total * 1e6 / done if done else 0.0
+            }
+            for name, total in timer.totals.items()
+        },
+        "bot": bot.stats,
+        "audio": game.sound_manager.voices.get_stats() if game.sound_manager and game.sound_manager.voices else None,
+        "users": game.player.current_users,
+        "completed_quests": len(game.quest_manager.completed_quests),
+        "game_won": game.game_won
+    }
+
+def print_report(report):
+    print("🤖 Headless-симуляция:")
+    print(f"   тиков: {report['ticks']} ({report['simulated_seconds']:.0f} с игры) за {report['wall_time']:.2f} с")
+    print(f"   ⚡ {report['ticks_per_second']:.0f} тиков/с (x{report['realtime_factor']:.1f} к реальному времени)")
+    print("   ⏱️ Подсистемы:")
+    update_total = report["subsystems"].get("update", {}).get("total_ms", 0) or 1
+    for name, data in sorted(report["subsystems"].items(), key=lambda item: -item[1]["total_ms"]):
+        share = data["total_ms"] / update_total * 100
+        print(f"      {name:<20} {data['total_ms']:9.1f} мс  {data['us_per_tick']:8.1f} мкс/тик  "
+              f"{share:5.1f}% update  ({data['calls']} вызовов)")
+    stats = report["bot"]
+    print(f"   🧭 NPC: {stats['npcs_visited']}, комнат менторов: {stats['mentor_rooms']}, "
+          f"реплик: {stats['dialogue_lines']}, сцен: {stats['scenes_resolved']} (побед {stats['scenes_won']}), "
+          f"телепортов: {stats['teleports']}, кругов: {stats['rounds']}")
+    print(f"   👥 Пользователей: {report['users']}, квестов: {report['completed_quests']}, "
+          f"победа: {'да' if report['game_won'] else 'нет'}")
+    audio = report.get("audio")
+    if audio:
+        print(f"   🔊 Звуков: {audio['played']}, вытеснено: {audio['stolen']}, отброшено: {audio['dropped']}, "
+              f"cooldown: {audio['throttled']}, не найдено: {audio['missing']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless-симуляция nQuester со скриптовым ботом")
+    parser.add_argument("--ticks", type=int, default=36000, help="шагов симуляции (по умолчанию 10 минут игры)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--win-rate", type=float, default=1.0, help="доля мини-игр, которые бот выигрывает")
+    parser.add_argument("--scene-time", type=float, default=2.0, help="секунд игры в каждой мини-игре до автозавершения")
+    parser.add_argument("--json", help="записать отчет в JSON")
+    args = parser.parse_args()
+    
+    report = run_simulation(args.ticks, args.seed, args.win_rate, args.scene_time)
+    print_report(report)
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Отчет сохранен: {args.json}")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import hashlib
+import numpy as np
+import pygame
+from settings import *
+
+# Версия формата кэша; поменялся синтез - поднять
+SOUND_BANK_VERSION = 1
+
+# Синтезируемые эффекты.
+# wave: sine / square / triangle / saw; freq -> freq_end - линейный chirp;
+# notes - последовательность частот (арпеджио) вместо freq;
+# attack/decay/release - секунды, sustain - уровень; noise - доля шума в смеси.
+# stinger: True - короткий музыкальный фрагмент для MusicController, а не эффект
+SOUND_DEFINITIONS = {
+    "interaction": {"wave": "sine", "freq": 700, "freq_end": 950, "duration": 0.12, "attack": 0.005, "decay": 0.05, "sustain": 0.6, "release": 0.05},
+    "quest_complete": {"wave": "triangle", "notes": [784, 988, 1175, 1568], "duration": 0.5, "attack": 0.01, "decay": 0.1, "sustain": 0.7, "release": 0.15},
+    "quest_fail": {"wave": "saw", "freq": 440, "freq_end": 220, "duration": 0.45, "attack": 0.01, "decay": 0.15, "sustain": 0.5, "release": 0.15, "volume": 0.35},
+    "button_click": {"wave": "square", "freq": 600, "duration": 0.04, "attack": 0.001, "decay": 0.02, "sustain": 0.3, "release": 0.015, "volume": 0.3},
+    "success": {"wave": "sine", "notes": [880, 1320], "duration": 0.25, "attack": 0.005, "decay": 0.05, "sustain": 0.7, "release": 0.08},
+    "error": {"wave": "square", "freq": 220, "freq_end": 160, "duration": 0.25, "attack": 0.005, "decay": 0.05, "sustain": 0.6, "release": 0.08, "volume": 0.3},
+    "footstep": {"wave": "sine", "freq": 140, "freq_end": 70, "duration": 0.07, "attack": 0.002, "decay": 0.04, "sustain": 0.2, "release": 0.02, "noise": 0.6, "volume": 0.35},
+    "door_open": {"wave": "saw", "freq": 180, "freq_end": 320, "duration": 0.35, "attack": 0.02, "decay": 0.1, "sustain": 0.5, "release": 0.1, "noise": 0.25, "volume": 0.35},
+    "door_close": {"wave": "saw", "freq": 260, "freq_end": 90, "duration": 0.25, "attack": 0.005, "decay": 0.08, "sustain": 0.4, "release": 0.08, "noise": 0.35, "volume": 0.4},
+    "typing": {"wave": "square", "freq": 1500, "duration": 0.025, "attack": 0.001, "decay": 0.01, "sustain": 0.2, "release": 0.01, "noise": 0.5, "volume": 0.2},
+    "notification": {"wave": "sine", "notes": [988, 1319], "duration": 0.3, "attack": 0.005, "decay": 0.08, "sustain": 0.6, "release": 0.12},
+    "achievement": {"wave": "triangle", "notes": [1047, 1319, 1568, 2093], "duration": 0.6, "attack": 0.005, "decay": 0.1, "sustain": 0.7, "release": 0.2},
+    "level_up": {"wave": "square", "freq": 500, "freq_end": 2000, "duration": 0.5, "attack": 0.01, "decay": 0.1, "sustain": 0.6, "release": 0.15, "volume": 0.3},
+    "coin": {"wave": "square", "notes": [988, 1319], "duration": 0.18, "attack": 0.002, "decay": 0.05, "sustain": 0.5, "release": 0.06, "volume": 0.3},
+    "menu_select": {"wave": "triangle", "freq": 700, "duration": 0.06, "attack": 0.002, "decay": 0.03, "sustain": 0.5, "release": 0.02},
+    "menu_confirm": {"wave": "triangle", "notes": [660, 990], "duration": 0.15, "attack": 0.002, "decay": 0.05, "sustain": 0.6, "release": 0.05},
+    "quest_start": {"wave": "triangle", "notes": [587, 880], "duration": 0.25, "attack": 0.005, "decay": 0.06, "sustain": 0.7, "release": 0.08},
+    "event": {"wave": "sine", "freq": 600, "freq_end": 1400, "duration": 0.35, "attack": 0.01, "decay": 0.1, "sustain": 0.6, "release": 0.12, "noise": 0.1},
+    "reward": {"wave": "square", "notes": [1319, 1568, 2093], "duration": 0.3, "attack": 0.002, "decay": 0.06, "sustain": 0.6, "release": 0.1, "volume": 0.3},
+    "click": {"wave": "square", "freq": 900, "freq_end": 700, "duration": 0.03, "attack": 0.001, "decay": 0.015, "sustain": 0.3, "release": 0.01, "volume": 0.25},
+    "beat": {"wave": "sine", "freq": 160, "freq_end": 60, "duration": 0.12, "attack": 0.002, "decay": 0.05, "sustain": 0.4, "release": 0.04, "noise": 0.15, "volume": 0.6},
+    "ambient_city": {"wave": "sine", "freq": 110, "freq_end": 90, "duration": 1.5, "attack": 0.4, "decay": 0.2, "sustain": 0.8, "release": 0.5, "noise": 0.7, "volume": 0.15},
+    "ambient_office": {"wave": "sine", "freq": 60, "duration": 1.5, "attack": 0.4, "decay": 0.2, "sustain": 0.8, "release": 0.5, "noise": 0.3, "volume": 0.12},
+    "minigame_win": {"wave": "triangle", "notes": [523, 659, 784, 1047, 1047], "duration": 1.0, "attack": 0.01, "decay": 0.1, "sustain": 0.8, "release": 0.3, "stinger": True},
+    "minigame_lose": {"wave": "saw", "notes": [392, 370, 349, 262], "duration": 1.0, "attack": 0.01, "decay": 0.15, "sustain": 0.6, "release": 0.3, "volume": 0.3, "stinger": True}
+}
+
+WAVEFORMS = {
+    "sine": lambda phase, cycle: np.sin(phase),
+    "square": lambda phase, cycle: np.where(cycle < 0.5, 1.0, -1.0),
+    "triangle": lambda phase, cycle: 4 * np.abs(cycle - 0.5) - 1,
+    "saw": lambda phase, cycle: 2 * cycle - 1
+}
+
+def synthesize(definitions, sample_rate, seed=7):
+    """
+    Синтез всех эффектов одним проходом NumPy: каждая строка матрицы - один звук
+    (короткие дополнены нулями до самого длинного). Возвращает (имена, int16 [звуков, сэмплов], длины).
+    """
+    names = list(definitions)
+    sounds = [definitions[name] for name in names]
+    count = len(names)
+    
+    def column(key, default):
+        return np.array([float(sound.get(key, default)) for sound in sounds])[:, None]
+    
+    duration = column("duration", 0.1)
+    lengths = (duration[:, 0] * sample_rate).astype(int)
+    t = (np.arange(lengths.max()) / sample_rate)[None, :]
+    progress = np.minimum(t / duration, 1.0)
+    
+    # Частота по времени: ступеньки нот (арпеджио) или линейный chirp
+    note_lists = [sound.get("notes") or [sound.get("freq", 800)] for sound in sounds]
+    note_counts = np.array([len(notes) for notes in note_lists])[:, None]
+    notes = np.zeros((count, note_counts.max()))
+    for row, note_list in enumerate(note_lists):
+        notes[row, :len(note_list)] = note_list
+    note_index = np.minimum((progress * note_counts).astype(int), note_counts - 1)
+    stepped = np.take_along_axis(notes, note_index, axis=1)
+    freq = column("freq", 800)
+    freq_end = np.array([float(sound.get("freq_end", sound.get("freq", 800))) for sound in sounds])[:, None]
+    chirp = freq + (freq_end - freq) * progress
+    has_notes = np.array([bool(sound.get("notes")) for sound in sounds])[:, None]
+    frequency = np.where(has_notes, stepped, chirp)
+    
+    # Фаза - интеграл частоты, поэтому chirp и смена нот без щелчков
+    phase = 2 * np.pi * np.cumsum(frequency, axis=1) / sample_rate
+    cycle = (phase / (2 * np.pi)) % 1.0
+    tone = np.empty_like(phase)
+    wave_names = np.array([sound.get("wave", "sine") for sound in sounds])
+    for wave, generate in WAVEFORMS.items():
+        rows = wave_names == wave
+        if rows.any():
+            tone[rows] = generate(phase[rows], cycle[rows])
+    
+    noise_mix = column("noise", 0.0)
+    noise = np.random.default_rng(seed).uniform(-1.0, 1.0, tone.shape)
+    signal = tone * (1 - noise_mix) + noise * noise_mix
+    
+    # ADSR: min(подъем, спад к sustain) * затухание к концу звука
+    attack = np.maximum(column("attack", 0.005), 1e-4)
+    decay = np.maximum(column("decay", 0.05), 1e-4)
+    sustain = column("sustain", 0.7)
+    release = np.maximum(column("release", 0.05), 1e-4)
+    envelope = np.minimum(np.minimum(t / attack, 1.0),
+                          1.0 - (1.0 - sustain) * np.clip((t - attack) / decay, 0.0, 1.0))
+    envelope *= np.clip((duration - t) / release, 0.0, 1.0)
+    
+    signal *= envelope * column("volume", 0.5)
+    pcm = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+    return names, pcm, lengths
+
+class SoundBank:
+    """
+    Все синтезированные эффекты в одном массиве int16 в формате микшера.
+    Собирается один раз и кэшируется в SOUNDS_PATH (.npy + индекс .json);
+    при следующих запусках массив открывается через memory map, без синтеза.
+    Кэш привязан к версии, формату микшера и SOUND_DEFINITIONS.
+    """
+    def __init__(self, frequency, channels, cache_dir=SOUNDS_PATH):
+        self.frequency = frequency
+        self.channels = channels
+        self.cache_dir = cache_dir
+        self.data_path = os.path.join(cache_dir, f"sound_bank_v{SOUND_BANK_VERSION}.npy")
+        self.index_path = os.path.join(cache_dir, f"sound_bank_v{SOUND_BANK_VERSION}.json")
+        
+        self.samples = None  # int16, каналы чередуются
+        self.index = {}  # имя -> (смещение, число int16)
+        self.from_cache = False
+        self.load_time = 0.0
+    
+    def cache_key(self):
+        source = json.dumps([SOUND_BANK_VERSION, self.frequency, self.channels, SOUND_DEFINITIONS], sort_keys=True)
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+    
+    def load(self):
+        """Открыть кэш или собрать банк заново"""
+        started = time.perf_counter()
+        if not self.load_cache():
+            self.build()
+            self.save_cache()
+        self.load_time = time.perf_counter() - started
+        return self
+    
+    def load_cache(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                header = json.load(f)
+            if header.get("key") != self.cache_key():
+                return False
+            self.samples = np.load(self.data_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return False
+        self.index = {name: tuple(entry) for name, entry in header["sounds"].items()}
+        self.from_cache = True
+        return True
+    
+    def build(self):
+        names, pcm, lengths = synthesize(SOUND_DEFINITIONS, self.frequency)
+        parts = []
+        offset = 0
+        for row, name in enumerate(names):
+            sound = pcm[row, :lengths[row]]
+            if self.channels > 1:
+                sound = np.repeat(sound, self.channels)
+            parts.append(sound)
+            self.index[name] = (offset, len(sound))
+            offset += len(sound)
+        self.samples = np.concatenate(parts)
+        self.from_cache = False
+    
+    def save_cache(self):
+        """Записать кэш (через временные файлы: оборванная запись не оставит битый банк)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.data_path + ".tmp", "wb") as f:
+                np.save(f, self.samples)
+            with open(self.index_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"key": self.cache_key(), "version": SOUND_BANK_VERSION,
+                           "frequency": self.frequency, "channels": self.channels,
+                           "sounds": self.index}, f)
+            os.replace(self.data_path + ".tmp", self.data_path)
+            os.replace(self.index_path + ".tmp", self.index_path)
+        except OSError as e:
+            print(f"⚠️ Не удалось сохранить кэш звуков: {e}")
+    
+    def names(self):
+        return list(self.index)
+    
+    def is_stinger(self, name):
+        return SOUND_DEFINITIONS.get(name, {}).get("stinger", False)
+    
+    def get_sound(self, name):
+        """pygame Sound из банка (микшер копирует PCM к себе)"""
+        offset, length = self.index[name]
+        return pygame.mixer.Sound(buffer=self.samples[offset:offset + length])
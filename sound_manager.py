@@ -1,15 +1,16 @@
 import pygame
 import os
-import random
-import math
-import numpy as np
 from settings import *
+from music import MusicController
+from sound_bank import SoundBank
+from voice_manager import VoiceManager
 
 class SoundManager:
     def __init__(self):
         self.sounds = {}
-        self.music_tracks = {}
-        self.current_music = None
+        self.bank = None
+        self.voices = None
+        self.music = None
         self.sound_enabled = SOUND_ENABLED
         self.music_enabled = MUSIC_ENABLED
         self.background_music_file = "alexander-nakarada-superepic(chosic.com).mp3"
@@ -17,184 +18,99 @@ class SoundManager:
         # Create sounds directory
         os.makedirs(SOUNDS_PATH, exist_ok=True)
         
-        # Initialize pygame mixer
+        # Initialize pygame mixer (pygame.init() may have opened it already)
         try:
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
             self.mixer_available = True
         except:
             print("⚠️ Sound system not available")
             self.mixer_available = False
             return
         
+        # Reserved channel groups with priorities and voice limits
+        self.voices = VoiceManager()
+        
         # Load background music
         self.load_background_music()
         
-        # Generate default sounds
-        self.generate_default_sounds()
+        # Synthesized effects come from the cached sound bank
         self.load_sounds()
     
     def load_background_music(self):
-        """Load the main background music file"""
+        """Read music tracks into memory once (see music.MusicController)"""
         if not self.mixer_available:
             return
-            
-        music_path = self.background_music_file
-        if os.path.exists(music_path):
-            try:
-                # Set music volume
-                pygame.mixer.music.set_volume(MUSIC_VOLUME)
-                print(f"✅ Background music loaded: {music_path}")
-            except Exception as e:
-                print(f"⚠️ Failed to load background music: {e}")
+        
+        self.music = MusicController(MUSIC_VOLUME)
+        if self.music.tracks:
+            print(f"✅ Background music loaded: {len(self.music.tracks)} tracks")
         else:
-            print(f"⚠️ Background music file not found: {music_path}")
+            print(f"⚠️ Background music file not found: {self.background_music_file}")
     
     def play_background_music(self):
         """Play the main background music in loop"""
-        if not self.music_enabled or not self.mixer_available:
-            return
-            
-        music_path = self.background_music_file
-        if os.path.exists(music_path):
-            try:
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-                pygame.mixer.music.set_volume(MUSIC_VOLUME)
-                print("🎵 Background music started")
-            except Exception as e:
-                print(f"⚠️ Failed to play background music: {e}")
+        self.play_music("main_theme")
     
     def stop_background_music(self):
         """Stop background music"""
-        if self.mixer_available:
-            pygame.mixer.music.stop()
+        if self.music:
+            self.music.stop()
             print("🔇 Background music stopped")
     
     def pause_background_music(self):
-        """Pause background music"""
-        if self.mixer_available:
-            pygame.mixer.music.pause()
+        """Pause background music (position is kept)"""
+        if self.music:
+            self.music.pause()
     
     def unpause_background_music(self):
         """Unpause background music"""
-        if self.mixer_available:
-            pygame.mixer.music.unpause()
+        if self.music:
+            self.music.resume()
     
     def set_background_music_volume(self, volume):
         """Set background music volume (0.0 to 1.0)"""
-        if self.mixer_available:
-            pygame.mixer.music.set_volume(volume)
-
-    def generate_default_sounds(self):
-        """Generate simple sound effects using numpy and pygame.sndarray"""
-        if not self.mixer_available:
-            return
-        
-        sample_rate = 22050
-        duration = 0.1  # seconds
-        samples = int(sample_rate * duration)
-        
-        # Create a simple beep sound (sine wave)
-        frequency = 800  # Hz
-        amplitude = 0.3
-        t = np.linspace(0, duration, samples, False)
-        wave = amplitude * np.sin(2 * np.pi * frequency * t)
-        audio = np.array(wave * 32767, dtype=np.int16)
-        # Make stereo if needed
-        mixer_init = pygame.mixer.get_init()
-        if mixer_init and mixer_init[2] == 2:
-            audio = np.column_stack((audio, audio))
-        sound_surface = pygame.sndarray.make_sound(audio)
-        # Note: pygame.mixer.Sound doesn't have a save method
-        # We'll use the sound directly without saving to file
+        self.set_music_volume(volume)
     
     def load_sounds(self):
-        """Load all sound effects"""
+        """Load all sound effects: WAV files from SOUNDS_PATH override the synthesized bank"""
         if not self.mixer_available:
             return
-        sound_files = {
-            "interaction": "interaction.wav",
-            "quest_complete": "quest_complete.wav", 
-            "quest_fail": "quest_fail.wav",
-            "button_click": "button_click.wav",
-            "success": "success.wav",
-            "error": "error.wav",
-            "footstep": "footstep.wav",
-            "door_open": "door_open.wav",
-            "door_close": "door_close.wav",
-            "typing": "typing.wav",
-            "notification": "notification.wav",
-            "achievement": "achievement.wav",
-            "level_up": "level_up.wav",
-            "coin": "coin.wav",
-            "menu_select": "menu_select.wav",
-            "menu_confirm": "menu_confirm.wav",
-            "ambient_city": "ambient_city.wav",
-            "ambient_office": "ambient_office.wav"
-        }
-        for sound_name, filename in sound_files.items():
-            filepath = os.path.join(SOUNDS_PATH, filename)
+        frequency, size, channels = pygame.mixer.get_init()
+        self.bank = SoundBank(frequency, channels).load()
+        source = "cache" if self.bank.from_cache else "synthesized"
+        print(f"🔊 Sound bank: {len(self.bank.index)} sounds ({source}, {self.bank.load_time * 1000:.0f} ms)")
+        
+        for sound_name in self.bank.names():
+            filepath = os.path.join(SOUNDS_PATH, f"{sound_name}.wav")
+            sound = None
             if os.path.exists(filepath):
                 try:
-                    self.sounds[sound_name] = pygame.mixer.Sound(filepath)
-                    self.sounds[sound_name].set_volume(SOUND_VOLUME)
+                    sound = pygame.mixer.Sound(filepath)
                 except:
-                    print(f"⚠️ Failed to load sound: {filename}")
+                    print(f"⚠️ Failed to load sound: {filepath}")
+            if sound is None:
+                sound = self.bank.get_sound(sound_name)
+            
+            if self.bank.is_stinger(sound_name):
+                if self.music:
+                    self.music.add_stinger_sound(sound_name, sound)
             else:
-                self.create_simple_sound(sound_name, filename)
-    
-    def create_simple_sound(self, sound_name, filename):
-        """Create a simple sound effect using numpy"""
-        if not self.mixer_available:
-            return
-        sample_rate = 22050
-        duration = 0.1
-        samples = int(sample_rate * duration)
-        frequencies = {
-            "interaction": 800,
-            "quest_complete": 1200,
-            "quest_fail": 400,
-            "button_click": 600,
-            "success": 1000,
-            "error": 300,
-            "footstep": 200,
-            "door_open": 500,
-            "door_close": 400,
-            "typing": 1500,
-            "notification": 900,
-            "achievement": 1500,
-            "level_up": 2000,
-            "coin": 1200,
-            "menu_select": 700,
-            "menu_confirm": 800,
-            "ambient_city": 300,
-            "ambient_office": 400
-        }
-        frequency = frequencies.get(sound_name, 800)
-        amplitude = 0.3
-        t = np.linspace(0, duration, samples, False)
-        wave = amplitude * np.sin(2 * np.pi * frequency * t)
-        audio = np.array(wave * 32767, dtype=np.int16)
-        mixer_init = pygame.mixer.get_init()
-        if mixer_init and mixer_init[2] == 2:
-            audio = np.column_stack((audio, audio))
-        sound_surface = pygame.sndarray.make_sound(audio)
-        self.sounds[sound_name] = sound_surface
-        self.sounds[sound_name].set_volume(SOUND_VOLUME)
-        # Optionally save the sound
-        # pygame.mixer.Sound.save(sound_surface, os.path.join(SOUNDS_PATH, filename))
+                sound.set_volume(SOUND_VOLUME)
+                self.sounds[sound_name] = sound
     
     def play_sound(self, sound_name):
+        """Play an effect through the voice manager (channel groups, limits, cooldowns)"""
         if not self.sound_enabled or not self.mixer_available:
             return
-        if sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except:
-                pass
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            self.voices.report_missing(sound_name)
+            return
+        self.voices.play(sound_name, sound)
     
     def play_footstep(self):
-        """Play footstep sound when player moves"""
+        """Play footstep sound when player moves (Player.update keeps the step rate)"""
         self.play_sound("footstep")
     
     def play_door_open(self):
@@ -270,17 +186,30 @@ class SoundManager:
         self.play_sound("interaction")
     
     def play_music(self, track_name=None):
-        """Play background music - now uses the MP3 file"""
-        if not self.music_enabled or not self.mixer_available:
+        """Switch to a named music track; the same track keeps playing without a restart"""
+        if not self.music_enabled or not self.music:
             return
-        
-        # Use the main background music for all scenarios
-        self.play_background_music()
+        self.music.play(track_name or "main_theme")
+    
+    def play_stinger(self, name):
+        """Play a short music stinger over the background music (stinger channel)"""
+        if not self.music_enabled or not self.music:
+            return
+        sound = self.music.get_stinger(name)
+        if sound is None:
+            self.voices.report_missing(name)
+            return
+        self.voices.play(name, sound)
+    
+    def update(self, dt):
+        """Advance music crossfades"""
+        if self.music:
+            self.music.update(dt)
     
     def stop_music(self):
         """Stop all music"""
-        if self.mixer_available:
-            pygame.mixer.music.stop()
+        if self.music:
+            self.music.stop()
     
     def set_sound_volume(self, volume):
         """Set sound effects volume"""
@@ -289,8 +218,8 @@ class SoundManager:
     
     def set_music_volume(self, volume):
         """Set music volume"""
-        if self.mixer_available:
-            pygame.mixer.music.set_volume(volume)
+        if self.music:
+            self.music.set_volume(volume)
     
     def toggle_sound(self):
         """Toggle sound effects on/off"""
@@ -307,8 +236,10 @@ class SoundManager:
 sound_manager = None
 
 def init_sound_manager():
+    """Create the sound manager once per process (menu and game share it)"""
     global sound_manager
-    sound_manager = SoundManager()
+    if sound_manager is None:
+        sound_manager = SoundManager()
     return sound_manager
 
 def get_sound_manager():
@@ -0,0 +1,115 @@
+import pygame
+
+class SpatialHash:
+    """
+    Равномерная сетка для быстрых запросов "кто рядом".
+    Объекты раскладываются по ячейкам cell_size x cell_size пикселей,
+    запрос проверяет только ячейки, которые пересекает область поиска.
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}  # (cx, cy) -> set объектов
+        self.positions = {}  # объект -> (x, y)
+        self.object_cells = {}  # объект -> (cx, cy)
+    
+    def cell_of(self, x, y):
+        """Ячейка для точки"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+    
+    def insert(self, obj, pos):
+        """Добавить объект в позицию pos"""
+        if obj in self.positions:
+            self.move(obj, pos)
+            return
+        
+        x, y = pos[0], pos[1]
+        cell = self.cell_of(x, y)
+        self.cells.setdefault(cell, set()).add(obj)
+        self.positions[obj] = (x, y)
+        self.object_cells[obj] = cell
+    
+    def remove(self, obj):
+        """Удалить объект из индекса"""
+        cell = self.object_cells.pop(obj, None)
+        if cell is None:
+            return
+        self.positions.pop(obj, None)
+        bucket = self.cells.get(cell)
+        if bucket:
+            bucket.discard(obj)
+            if not bucket:
+                del self.cells[cell]
+    
+    def move(self, obj, pos):
+        """Обновить позицию объекта (перекладывает его только при смене ячейки)"""
+        if obj not in self.positions:
+            self.insert(obj, pos)
+            return
+        
+        x, y = pos[0], pos[1]
+        self.positions[obj] = (x, y)
+        new_cell = self.cell_of(x, y)
+        old_cell = self.object_cells[obj]
+        if new_cell != old_cell:
+            bucket = self.cells[old_cell]
+            bucket.discard(obj)
+            if not bucket:
+                del self.cells[old_cell]
+            self.cells.setdefault(new_cell, set()).add(obj)
+            self.object_cells[obj] = new_cell
+    
+    def clear(self):
+        """Очистить индекс"""
+        self.cells.clear()
+        self.positions.clear()
+        self.object_cells.clear()
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def collect_cells(self, left, top, right, bottom):
+        """Все объекты из ячеек, которые пересекает прямоугольник"""
+        first_cx, first_cy = self.cell_of(left, top)
+        last_cx, last_cy = self.cell_of(right, bottom)
+        
+        found = []
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+    
+    def query_radius(self, pos, radius):
+        """Объекты в радиусе radius от pos, отсортированные по расстоянию"""
+        px, py = pos[0], pos[1]
+        radius_sq = radius * radius
+        
+        result = []
+        for obj in self.collect_cells(px - radius, py - radius, px + radius, py + radius):
+            x, y = self.positions[obj]
+            dist_sq = (x - px) ** 2 + (y - py) ** 2
+            if dist_sq <= radius_sq:
+                result.append((dist_sq, obj))
+        
+        result.sort(key=lambda item: item[0])
+        return [obj for _, obj in result]
+    
+    def query_rect(self, rect):
+        """Объекты внутри rect, отсортированные по расстоянию до его центра"""
+        rect = pygame.Rect(rect)
+        cx, cy = rect.center
+        
+        result = []
+        for obj in self.collect_cells(rect.left, rect.top, rect.right, rect.bottom):
+            x, y = self.positions[obj]
+            if rect.left <= x <= rect.right and rect.top <= y <= rect.bottom:
+                result.append(((x - cx) ** 2 + (y - cy) ** 2, obj))
+        
+        result.sort(key=lambda item: item[0])
+        return [obj for _, obj in result]
+    
+    def nearest(self, pos, max_radius):
+        """Ближайший объект в пределах max_radius или None"""
+        found = self.query_radius(pos, max_radius)
+        return found[0] if found else None
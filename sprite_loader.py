@@ -1,7 +1,126 @@
 import pygame
 import os
+from collections import OrderedDict
 from settings import *
 
+# Флаги для шрифтов в AssetCache.get_font
+FONT_BOLD = 1
+FONT_ITALIC = 2
+
+def surface_bytes(value):
+    """Память пикселей поверхностей в value (поверхность, словарь, список или кортеж)"""
+    if isinstance(value, pygame.Surface):
+        return value.get_pitch() * value.get_height()
+    if isinstance(value, dict):
+        return sum(surface_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(surface_bytes(item) for item in value)
+    return 0
+
+class AssetCache:
+    """
+    Общий кэш ассетов: декодированные картинки, их масштабированные варианты и шрифты.
+    Ключ - (тип, путь, размер, флаги). Старые записи вытесняются по LRU.
+    Отсутствующие файлы тоже кэшируются (как None), чтобы не ходить на диск каждый кадр.
+    """
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        
+        # Статистика
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        # Фоновый декодер (startup.AssetPreloader), если запущен
+        self.preloader = None
+    
+    def lookup(self, key, factory):
+        """Вернуть значение по ключу, при промахе создать его через factory()"""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        
+        self.misses += 1
+        value = factory()
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+    
+    def load_image(self, path, alpha=True):
+        """Загрузить картинку с диска и перевести в формат дисплея (без кэша)"""
+        if self.preloader is not None:
+            image = self.preloader.take(path, alpha)
+            if image is not None:
+                return image
+        
+        if not os.path.exists(path):
+            return None
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, OSError) as e:
+            print(f"❌ Ошибка загрузки изображения {path}: {e}")
+            return None
+        
+        # convert() работает только после set_mode
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+        return image
+    
+    def get_image(self, path, size=None, alpha=True):
+        """Получить картинку, при необходимости масштабированную до size"""
+        if size is None:
+            return self.lookup(("image", path, None, alpha), lambda: self.load_image(path, alpha))
+        
+        def scale_from_source():
+            # Исходник в полном размере не держим в кэше, если его нет там уже
+            source = self.entries.get(("image", path, None, alpha))
+            if source is None:
+                source = self.load_image(path, alpha)
+            if source is None:
+                return None
+            return pygame.transform.scale(source, size)
+        
+        return self.lookup(("image", path, tuple(size), alpha), scale_from_source)
+    
+    def get_scaled(self, name, surface, size):
+        """Масштабированный вариант уже загруженной поверхности, name - стабильный ключ"""
+        if surface is None:
+            return None
+        return self.lookup(("scaled", name, tuple(size), 0), lambda: pygame.transform.scale(surface, size))
+    
+    def get_font(self, path=None, size=24, flags=0):
+        """Получить шрифт (path=None - стандартный шрифт pygame)"""
+        def create_font():
+            font = pygame.font.Font(path, size)
+            if flags & FONT_BOLD:
+                font.set_bold(True)
+            if flags & FONT_ITALIC:
+                font.set_italic(True)
+            return font
+        
+        return self.lookup(("font", path, size, flags), create_font)
+    
+    def clear(self):
+        """Очистить кэш (например, после смены видеорежима)"""
+        self.entries.clear()
+    
+    def get_memory_bytes(self):
+        """Память картинок в кэше"""
+        return surface_bytes(list(self.entries.values()))
+    
+    def get_stats(self):
+        """Статистика попаданий в кэш"""
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
 class SpriteSheet:
     def __init__(self, filename):
         """Конструктор. Загружает спрайт-лист."""
@@ -28,145 +147,70 @@ class SpriteLoader:
         self.mentors_path = "Mentors/"
         self.maps_path = "Base and Full Map + HD Images/"
         self.mc_path = "mc/"  # Путь к анимациям главного героя
+        self.asset_cache = get_asset_cache()
         
         # Загруженные спрайты
         self.player_sprites = {}
         self.player_walk_animations = {}  # Анимации ходьбы для главного героя
         self.npc_sprites = {}
         self.mentor_faces = {}
-        self.interior_tiles = {}
         self.room_maps = {}  # Отдельные локации для менторов
+        self.atlas = None  # Текстурный атлас (atlas.Atlas)
         
         # Загружаем все спрайты
         self.load_all_sprites()
         self.create_mentor_rooms()
     
     def load_all_sprites(self):
-        """Загружает все спрайты"""
+        """Загружает все спрайты (из текстурного атласа, см. atlas.py)"""
         print("Загрузка спрайтов...")
         
         try:
+            from atlas import load_atlas
+            self.atlas = load_atlas()
             self.load_character_sprites()
             self.load_mc_walk_animations()  # Загружаем анимации главного героя
             self.load_mentor_faces()
-            self.load_interior_tiles()
             print("✅ Все спрайты загружены!")
         except Exception as e:
             print(f"❌ Ошибка загрузки спрайтов: {e}")
     
     def load_mc_walk_animations(self):
-        """Загружает анимации ходьбы главного героя из папки mc"""
-        directions = ["up", "down", "left", "right"]
-        
-        for direction in directions:
-            direction_path = os.path.join(self.mc_path, direction)
-            print(f"Проверяем папку: {direction_path}")
-            if os.path.exists(direction_path):
-                frames = []
-                
-                # Получаем все файлы в папке направления
-                files = [f for f in os.listdir(direction_path) if f.endswith('.png')]
-                files.sort()  # Сортируем для правильного порядка кадров
-                print(f"Найдено файлов в {direction}: {len(files)}")
-                
-                for file in files:
-                    try:
-                        frame_path = os.path.join(direction_path, file)
-                        print(f"Загружаем: {frame_path}")
-                        frame = pygame.image.load(frame_path).convert_alpha()
-                        # Масштабируем пропорционально: 16x16 -> 32x32 (2x увеличение)
-                        frame = pygame.transform.scale(frame, (32, 32))
-                        frames.append(frame)
-                        print(f"✅ Успешно загружен кадр: {file}")
-                    except (pygame.error, OSError) as e:
-                        print(f"❌ Ошибка загрузки кадра {file} для направления {direction}: {e}")
-                
-                if frames:
-                    self.player_walk_animations[direction] = frames
-                    print(f"✅ Загружено {len(frames)} кадров для направления {direction}")
-                else:
-                    print(f"⚠️ Не удалось загрузить кадры для направления {direction}")
+        """Анимации ходьбы главного героя из папки mc (уже 32x32 в атласе)"""
+        for direction in ["up", "down", "left", "right"]:
+            frames = self.atlas.frames(f"mc/{direction}")
+            if frames:
+                self.player_walk_animations[direction] = frames
+                print(f"✅ Загружено {len(frames)} кадров для направления {direction}")
             else:
-                print(f"⚠️ Папка {direction_path} не найдена")
+                print(f"⚠️ Не удалось загрузить кадры для направления {direction}")
     
     def load_character_sprites(self):
-        """Загружает спрайты персонажей"""
+        """Спрайты персонажей: idle и 4 кадра ходьбы"""
         characters = ["Adam", "Alex", "Amelia", "Bob"]
         
         for char in characters:
-            # Idle спрайт
-            idle_path = os.path.join(self.characters_path, f"{char}_idle_16x16.png")
-            if os.path.exists(idle_path):
-                try:
-                    sprite = pygame.image.load(idle_path)
-                    # Масштабируем пропорционально: 16x16 -> 32x32 (2x увеличение)
-                    sprite = pygame.transform.scale(sprite, (32, 32))
-                    self.npc_sprites[f"{char.lower()}_idle"] = sprite
-                    
-                    if char == "Adam":
-                        self.player_sprites["idle"] = sprite
-                except (pygame.error, OSError) as e:
-                    print(f"Ошибка загрузки idle для {char}: {e}")
+            idle_sprite = self.atlas.get(f"characters/{char.lower()}_idle")
+            if idle_sprite:
+                self.npc_sprites[f"{char.lower()}_idle"] = idle_sprite
+                if char == "Adam":
+                    self.player_sprites["idle"] = idle_sprite
             
             # Анимация ходьбы - используем idle как fallback
-            run_path = os.path.join(self.characters_path, f"{char}_run_16x16.png")
-            if os.path.exists(run_path):
-                try:
-                    # Используем SpriteSheet для правильной работы
-                    spritesheet = SpriteSheet(run_path)
-                    
-                    # Размеры кадров на спрайт-листе
-                    SPRITE_WIDTH = 16
-                    SPRITE_HEIGHT = 16
-                    
-                    walk_frames = []
-                    for i in range(4):  # 4 кадра анимации
-                        frame = spritesheet.get_image(i * SPRITE_WIDTH, 0, SPRITE_WIDTH, SPRITE_HEIGHT)
-                        # Масштабируем пропорционально: 16x16 -> 32x32 (2x увеличение)
-                        frame = pygame.transform.scale(frame, (32, 32))
-                        walk_frames.append(frame)
-                    
-                    self.npc_sprites[f"{char.lower()}_walk"] = walk_frames
-                    
-                    if char == "Adam":
-                        self.player_sprites["walk"] = walk_frames
-                        
-                except (pygame.error, OSError) as e:
-                    print(f"Ошибка загрузки анимации для {char}: {e}")
-                    # Fallback к idle спрайту
-                    idle_sprite = self.npc_sprites.get(f"{char.lower()}_idle")
-                    if idle_sprite:
-                        if char == "Adam":
-                            self.player_sprites["walk"] = [idle_sprite]
-                        self.npc_sprites[f"{char.lower()}_walk"] = [idle_sprite]
+            walk_frames = self.atlas.frames(f"characters/{char.lower()}_walk")
+            if not walk_frames and idle_sprite:
+                walk_frames = [idle_sprite]
+            if walk_frames:
+                self.npc_sprites[f"{char.lower()}_walk"] = walk_frames
+                if char == "Adam":
+                    self.player_sprites["walk"] = walk_frames
     
     def load_mentor_faces(self):
-        """Загружает лица менторов для диалогов"""
-        mentor_files = [
-            "Alikhan.png", "Alibeck.png", "Bahredin.png", "Bahaudin.png",
-            "Gaziz.png", "Shoqan.png", "Zhasulan.png", "Aimurat.png", "Bernar.png",
-            "Diana.png", "Tamyrlan.png"  # Added Diana and Tamyrlan
-        ]
-        
-        for mentor_file in mentor_files:
-            path = os.path.join(self.mentors_path, mentor_file)
-            if os.path.exists(path):
-                face = pygame.image.load(path)
-                # Масштабируем для диалогов
-                face = pygame.transform.scale(face, (80, 80))
-                name = mentor_file.replace(".png", "")
-                self.mentor_faces[name] = face
-    
-    def load_interior_tiles(self):
-        """Загружает тайлы интерьеров"""
-        interiors_path = os.path.join(self.interiors_path, "Interiors_free_32x32.png")
-        room_builder_path = os.path.join(self.interiors_path, "Room_Builder_free_32x32.png")
-        
-        if os.path.exists(interiors_path):
-            self.interior_tiles["interiors"] = pygame.image.load(interiors_path)
-            
-        if os.path.exists(room_builder_path):
-            self.interior_tiles["room_builder"] = pygame.image.load(room_builder_path)
+        """Загружает лица менторов для диалогов (80x80)"""
+        for name in self.atlas.names("mentors/"):
+            mentor, size = name.split("/")[1:]
+            if size == "80":
+                self.mentor_faces[mentor] = self.atlas.get(name)
     
     def create_mentor_rooms(self):
         """Создает отдельные локации для каждого ментора"""
@@ -257,6 +301,11 @@ class SpriteLoader:
         if door_tile:
             room_surface.blit(door_tile, (12 * TILE_SIZE, 18 * TILE_SIZE))
     
+    def get_memory_bytes(self):
+        """Память страниц атласа и комнат (спрайты - это subsurface атласа, отдельно не считаются)"""
+        atlas_bytes = self.atlas.get_memory_bytes() if self.atlas else 0
+        return atlas_bytes + surface_bytes(self.room_maps)
+    
     def get_player_sprite(self, state="idle", frame=0, direction="down"):
         """Получить спрайт игрока с анимацией"""
         # Сначала проверяем анимации главного героя из папки mc
@@ -289,27 +338,26 @@ class SpriteLoader:
     
     def get_background(self, background_name):
         """Получает фоновое изображение"""
-        try:
-            if background_name == "galletcity":
-                galletcity_path = os.path.join(self.maps_path, "galletcity.png")
-                if os.path.exists(galletcity_path):
-                    return pygame.image.load(galletcity_path)
-        except:
-            pass
+        if background_name == "galletcity":
+            galletcity_path = os.path.join(self.maps_path, "galletcity.png")
+            return self.asset_cache.get_image(galletcity_path, alpha=False)
         return None
     
     def get_mentor_room(self, mentor_name):
         """Получить локацию ментора"""
         return self.room_maps.get(mentor_name)
     
-    def get_tile_from_sheet(self, sheet_name, tile_x, tile_y, tile_size=32):
-        """Получить тайл из спрайт-листа"""
-        if sheet_name in self.interior_tiles:
-            sheet = self.interior_tiles[sheet_name]
-            tile_rect = pygame.Rect(tile_x * tile_size, tile_y * tile_size, tile_size, tile_size)
-            tile = sheet.subsurface(tile_rect)
-            return tile
-        return None
+    def get_tile_from_sheet(self, sheet_name, tile_x, tile_y):
+        """Получить тайл из спрайт-листа (нужные тайлы перечислены в atlas.ATLAS_TILES)"""
+        if self.atlas is None:
+            return None
+        return self.atlas.get(f"tiles/{sheet_name}/{tile_x}_{tile_y}")
+    
+    def get_atlas_image(self, name):
+        """Спрайт из атласа по имени (например, "sprites/icon_quest") или None"""
+        if self.atlas is None:
+            return None
+        return self.atlas.get(name)
 
 # Глобальный экземпляр загрузчика
 sprite_loader = None
@@ -326,4 +374,14 @@ def get_sprite_loader():
     global sprite_loader
     if sprite_loader is None:
         sprite_loader = SpriteLoader()
-    return sprite_loader 
\ No newline at end of file
+    return sprite_loader
+
+# Глобальный кэш ассетов
+asset_cache = None
+
+def get_asset_cache():
+    """Получить общий кэш ассетов"""
+    global asset_cache
+    if asset_cache is None:
+        asset_cache = AssetCache()
+    return asset_cache
@@ -0,0 +1,198 @@
+import pygame
+import os
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from settings import *
+from sprite_loader import get_asset_cache
+from asset_bake import get_asset_baker, STARTUP_RECIPES
+from tilemap import chunks_ready
+from gif_background import get_gif_stream
+
+class StartupProfiler:
+    """
+    Замер времени этапов запуска.
+    Этапы пишутся всегда (это дешево), отчет печатается только с --profile-startup.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.start_time = time.perf_counter()
+        self.phases = []  # (название, начало от старта, длительность)
+        self.marks = {}  # название -> время от старта
+        self.depth = 0
+        self.reported = 0
+    
+    def enable(self):
+        self.enabled = True
+    
+    @contextmanager
+    def phase(self, name):
+        """Замерить этап: with profiler.phase("sprites"): ..."""
+        started = time.perf_counter()
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            finished = time.perf_counter()
+            self.phases.append(("  " * self.depth + name, started - self.start_time, finished - started))
+    
+    def mark(self, name):
+        """Отметить момент от старта (только первый раз)"""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start_time
+    
+    def report(self):
+        """Напечатать новые этапы с прошлого отчета"""
+        if not self.enabled:
+            return
+        
+        print("⏱️ Профиль запуска:")
+        for name, started, duration in sorted(self.phases[self.reported:], key=lambda phase: phase[1]):
+            print(f"   {name:<32} {duration * 1000:8.1f} мс  (с {started * 1000:.0f} мс)")
+        self.reported = len(self.phases)
+        for name, moment in self.marks.items():
+            print(f"   ▶ {name:<30} {moment * 1000:8.1f} мс от старта")
+
+# Глобальный профайлер запуска
+startup_profiler = StartupProfiler()
+
+def get_startup_profiler():
+    """Получить профайлер запуска"""
+    return startup_profiler
+
+# Картинки для старта в порядке, в котором они понадобятся: (путь, alpha).
+# Между ними встают запеченные варианты asset_bake.STARTUP_RECIPES (спрайты менторов и босса,
+# фоны комнат). Пул берет задачи по очереди, поэтому большая карта идет последней;
+# она нужна, только пока TileMap еще не нарезал ее на чанки.
+STARTUP_IMAGES = [
+    ("Mentors/main.jpg", False),
+]
+STARTUP_MAP_IMAGES = [
+    (os.path.join(MAPS_PATH, "Fortuna (Base Map).png"), False),
+]
+
+# GIF, первые кадры которых нужны для меню и мини-игр
+STARTUP_GIFS = ["the world is ours.gif", MINIGAME_GIF_PATH]
+
+class AssetPreloader:
+    """
+    Параллельная предзагрузка картинок.
+    Чтение файла и декодирование PIL идут в пуле потоков, а в главном потоке
+    остается только создание Surface и convert()/convert_alpha().
+    Забрать готовую картинку - take(path, alpha), ее вызывает AssetCache.load_image.
+    """
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = get_preload_workers() or 1
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preload")
+        self.pending = {}  # (путь, alpha) -> Future
+        self.lock = threading.Lock()
+        self.taken = 0
+    
+    def decode(self, path, alpha):
+        """Рабочий поток: прочитать и декодировать файл в сырые байты"""
+        with Image.open(path) as image:
+            # RGB/RGBA отдаем как есть: лишняя конвертация стоит дороже, чем convert() в pygame
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if alpha else "RGB")
+            return image.tobytes(), image.size, image.mode
+    
+    def preload(self, path, alpha=True):
+        """Поставить картинку в очередь на декодирование"""
+        key = (path, alpha)
+        with self.lock:
+            if key in self.pending or not os.path.exists(path):
+                return
+            self.pending[key] = self.executor.submit(self.decode, path, alpha)
+    
+    def take(self, path, alpha=True):
+        """Забрать предзагруженную картинку (ждет декодер, если он еще работает). None - не предзагружали"""
+        with self.lock:
+            future = self.pending.pop((path, alpha), None)
+        if future is None:
+            return None
+        
+        try:
+            data, size, mode = future.result()
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            print(f"❌ Ошибка предзагрузки {path}: {e}")
+            return None
+        
+        image = pygame.image.frombuffer(data, size, mode)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+        else:
+            image = image.copy()  # frombuffer ссылается на data
+        self.taken += 1
+        return image
+    
+    def shutdown(self):
+        """Остановить пул (невостребованные картинки выбрасываются)"""
+        with self.lock:
+            for future in self.pending.values():
+                future.cancel()
+            self.pending.clear()
+        self.executor.shutdown(wait=False)
+
+def get_preload_workers():
+    """Сколько потоков декодирования: одно ядро оставляем главному потоку"""
+    return min(4, (os.cpu_count() or 1) - 1)
+
+# Глобальный предзагрузчик
+asset_preloader = None
+preload_started = False
+
+def start_asset_preload():
+    """
+    Запустить предзагрузку стартовых ассетов (повторный вызов ничего не делает).
+    На одноядерной машине все грузится как раньше, в главном потоке:
+    фоновые потоки там только добавили бы переключения GIL.
+    """
+    global asset_preloader, preload_started
+    if preload_started:
+        return asset_preloader
+    preload_started = True
+    if get_preload_workers() <= 0:
+        return None
+    
+    # Первые кадры GIF декодирует собственный фоновый поток GifStream
+    for path in STARTUP_GIFS:
+        stream = get_gif_stream(path)
+        if stream:
+            stream.request_prefetch(0)
+    
+    asset_preloader = AssetPreloader()
+    get_asset_cache().preloader = asset_preloader
+    map_images = [(path, alpha) for path, alpha in STARTUP_MAP_IMAGES
+                  if os.path.exists(path) and not chunks_ready(path)]
+    for path, alpha in STARTUP_IMAGES + baked_startup_images() + map_images:
+        asset_preloader.preload(path, alpha)
+    return asset_preloader
+
+def baked_startup_images():
+    """Готовые запеченные файлы для старта; еще не запеченные - исходником (его масштабирует AssetBaker)"""
+    baker = get_asset_baker()
+    images = []
+    for path, operation, size, alpha in STARTUP_RECIPES:
+        if os.path.exists(path):
+            images.append((baker.resolve(path, operation, size, alpha) or path, alpha))
+    return images
+
+def finish_asset_preload():
+    """Старт закончен: остановить пул и выбросить невостребованные картинки"""
+    global asset_preloader
+    if asset_preloader is None:
+        return
+    unused = len(asset_preloader.pending)
+    asset_preloader.shutdown()
+    get_asset_cache().preloader = None
+    asset_preloader = None
+    if unused:
+        print(f"🧹 Предзагрузка: не понадобилось картинок: {unused}")
+
+def get_asset_preloader():
+    """Получить предзагрузчик (None, если предзагрузка не запускалась)"""
+    return asset_preloader
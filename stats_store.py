@@ -0,0 +1,49 @@
+class StatsStore:
+    """
+    Статистика игры (для достижений) с подпиской на изменения.
+    Читается и пишется как словарь; подписчики получают множество
+    изменившихся ключей - только когда значение действительно поменялось.
+    """
+    def __init__(self, values=None):
+        self.values = dict(values or {})
+        self.listeners = []
+    
+    def subscribe(self, listener):
+        """listener(changed_keys) вызывается после каждого изменения"""
+        self.listeners.append(listener)
+    
+    def __getitem__(self, key):
+        return self.values[key]
+    
+    def __setitem__(self, key, value):
+        if key in self.values and self.values[key] == value:
+            return
+        self.values[key] = value
+        self.notify({key})
+    
+    def __contains__(self, key):
+        return key in self.values
+    
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+    
+    def items(self):
+        return self.values.items()
+    
+    def update(self, values):
+        """Записать несколько значений, подписчики получают одно уведомление"""
+        changed = set()
+        for key, value in values.items():
+            if key not in self.values or self.values[key] != value:
+                self.values[key] = value
+                changed.add(key)
+        if changed:
+            self.notify(changed)
+    
+    def notify(self, changed_keys):
+        for listener in self.listeners:
+            listener(changed_keys)
+    
+    def to_dict(self):
+        """Копия значений (для сохранения)"""
+        return dict(self.values)
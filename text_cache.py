@@ -0,0 +1,64 @@
+import pygame
+from sprite_loader import AssetCache
+
+class TextCache(AssetCache):
+    """
+    Кэш готовых текстовых надписей.
+    Ключ - (текст, шрифт, цвет, тень, фон, отступы), значение - поверхность,
+    в которую уже сложены тень, полупрозрачная подложка и сам текст.
+    Статический текст растеризуется один раз, а не 60 раз в секунду.
+    """
+    def __init__(self, max_entries=1024):
+        super().__init__(max_entries)
+
+    def render(self, text, font, color, shadow=None, background=None, padding=(0, 0), shadow_offset=(2, 2)):
+        """
+        Получить готовую надпись.
+        shadow - цвет тени или None, background - цвет подложки (RGB или RGBA) или None,
+        padding - отступы подложки от текста по x и y.
+        """
+        key = ("label", text, font, tuple(color), shadow and tuple(shadow),
+               background and tuple(background), tuple(padding), tuple(shadow_offset))
+        return self.lookup(key, lambda: self.compose(text, font, color, shadow, background, padding, shadow_offset))
+
+    def compose(self, text, font, color, shadow, background, padding, shadow_offset):
+        """Собрать надпись в одну поверхность (без кэша)"""
+        text_surface = font.render(text, True, color)
+        if shadow is None and background is None:
+            return text_surface
+
+        pad_x, pad_y = padding
+        offset_x, offset_y = shadow_offset if shadow is not None else (0, 0)
+        width = text_surface.get_width() + pad_x * 2 + offset_x
+        height = text_surface.get_height() + pad_y * 2 + offset_y
+
+        label = pygame.Surface((width, height), pygame.SRCALPHA)
+        if background is not None:
+            alpha = background[3] if len(background) > 3 else 255
+            label.fill((background[0], background[1], background[2], alpha))
+
+        if shadow is not None:
+            shadow_surface = font.render(text, True, shadow)
+            label.blit(shadow_surface, (pad_x + offset_x, pad_y + offset_y))
+        label.blit(text_surface, (pad_x, pad_y))
+        return label
+
+    def get_label_rect(self, label, shadow_offset=(0, 0), **position):
+        """
+        Rect надписи, выровненный так же, как был бы выровнен сам текст без тени.
+        Например: get_label_rect(label, (2, 2), center=(x, y))
+        """
+        rect = pygame.Rect(0, 0, label.get_width() - shadow_offset[0], label.get_height() - shadow_offset[1])
+        for attr, value in position.items():
+            setattr(rect, attr, value)
+        return pygame.Rect(rect.topleft, label.get_size())
+
+# Глобальный кэш надписей
+text_cache = None
+
+def get_text_cache():
+    """Получить общий кэш надписей"""
+    global text_cache
+    if text_cache is None:
+        text_cache = TextCache()
+    return text_cache
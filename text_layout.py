@@ -0,0 +1,100 @@
+import pygame
+from sprite_loader import AssetCache
+
+class TextLine:
+    """Одна строка раскладки: текст, индекс первого символа в исходном тексте и готовая поверхность"""
+    def __init__(self, text, start, surface, font):
+        self.text = text
+        self.start = start
+        self.surface = surface
+        # Ширина видимой части для каждого числа показанных символов (с учетом кернинга)
+        self.prefix_widths = [font.size(text[:count])[0] for count in range(len(text) + 1)]
+
+class TextLayout:
+    """
+    Текст, разбитый по словам на строки шириной не больше max_width.
+    Раскладка считается один раз через Font.size и закэшированные ширины слов,
+    каждая строка растеризуется один раз. Печатная машинка показывает
+    первые visible_chars символов, обрезая область blit.
+    """
+    def __init__(self, text, font, color, max_width, line_height, word_width):
+        self.text = text
+        self.line_height = line_height
+        self.lines = []
+        
+        space_width = word_width(font, " ")
+        line_words = []
+        line_width = 0
+        line_start = 0
+        position = 0  # индекс начала текущего слова в text
+        
+        for word in text.split(' '):
+            width = word_width(font, word)
+            # Как и раньше, ширина строки считается вместе с пробелом после слова
+            if line_words and line_width + width + space_width > max_width:
+                self.add_line(line_words, line_start, font, color)
+                line_words = []
+                line_width = 0
+            if not line_words:
+                line_start = position
+            line_words.append(word)
+            line_width += width + space_width
+            position += len(word) + 1
+        
+        if line_words:
+            self.add_line(line_words, line_start, font, color)
+    
+    def add_line(self, words, start, font, color):
+        text = " ".join(words).rstrip()
+        self.lines.append(TextLine(text, start, font.render(text, True, color), font))
+    
+    def get_height(self):
+        return len(self.lines) * self.line_height
+    
+    def draw(self, screen, position, visible_chars=None):
+        """
+        Нарисовать текст, показав только первые visible_chars символов (None - весь).
+        Возвращает прямоугольник, который занимает весь текст
+        """
+        x, y = position
+        for line in self.lines:
+            if visible_chars is None or visible_chars >= line.start + len(line.text):
+                screen.blit(line.surface, (x, y))
+            else:
+                shown = visible_chars - line.start
+                if shown <= 0:
+                    break
+                area = pygame.Rect(0, 0, line.prefix_widths[shown], line.surface.get_height())
+                screen.blit(line.surface, (x, y), area)
+            y += self.line_height
+        return self.get_rect(position)
+    
+    def get_rect(self, position):
+        """Прямоугольник всего текста при отрисовке в position"""
+        width = max((line.surface.get_width() for line in self.lines), default=0)
+        height = (len(self.lines) - 1) * self.line_height + self.lines[-1].surface.get_height() if self.lines else 0
+        return pygame.Rect(position, (width, height))
+
+class TextLayoutCache(AssetCache):
+    """Кэш раскладок текста и ширин отдельных слов"""
+    def __init__(self, max_entries=4096):
+        super().__init__(max_entries)
+    
+    def word_width(self, font, word):
+        """Ширина слова в пикселях (Font.size, без растеризации)"""
+        return self.lookup(("word", font, word), lambda: font.size(word)[0])
+    
+    def get_layout(self, text, font, color, max_width, line_height=30):
+        """Раскладка текста (строится один раз на текст, шрифт, цвет и ширину)"""
+        key = ("layout", text, font, tuple(color), max_width, line_height)
+        return self.lookup(key, lambda: TextLayout(text, font, color, max_width, line_height, self.word_width))
+
+# Глобальный кэш раскладок
+layout_cache = None
+
+def get_layout_cache():
+    """Получить общий кэш раскладок текста"""
+    global layout_cache
+    if layout_cache is None:
+        layout_cache = TextLayoutCache()
+    return layout_cache
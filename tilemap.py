@@ -0,0 +1,154 @@
+import os
+import json
+import pygame
+import numpy as np
+from collections import OrderedDict
+from settings import *
+from sprite_loader import get_asset_cache
+from asset_bake import get_asset_baker
+
+class TileMap:
+    """
+    Чанковый рендерер карты RPG Maker MV.
+    Данные карты (width x height x слои) хранятся в NumPy массиве,
+    картинка карты режется на чанки по chunk_tiles x chunk_tiles тайлов.
+    Нарезка делается один раз в data/baked/ (большая картинка декодируется
+    только на это время), в игре чанки читаются с диска лениво и вытесняются по LRU.
+    """
+    def __init__(self, map_data, image_path, tile_size=TILE_SIZE, chunk_tiles=16, max_chunks=32):
+        self.width = map_data["width"]
+        self.height = map_data["height"]
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.max_chunks = max_chunks
+        
+        # data в RPG Maker MV: слои подряд, внутри слоя - строки карты
+        data = np.asarray(map_data["data"], dtype=np.int16)
+        layer_count = len(data) // (self.width * self.height)
+        self.tiles = data[:layer_count * self.width * self.height].reshape(layer_count, self.height, self.width)
+        
+        # Пустые тайлы (0 на всех слоях) не рисуем
+        self.occupied = (self.tiles != 0).any(axis=0)
+        
+        # Готовая картинка карты из RPG Maker, нарезанная на чанки в папке кэша
+        self.image_path = image_path
+        self.chunk_dir = chunk_directory(image_path, tile_size, chunk_tiles)
+        
+        # Размер карты в пикселях мира
+        self.pixel_width = self.width * tile_size
+        self.pixel_height = self.height * tile_size
+        self.chunk_size = chunk_tiles * tile_size
+        self.chunks_x = (self.width + chunk_tiles - 1) // chunk_tiles
+        self.chunks_y = (self.height + chunk_tiles - 1) // chunk_tiles
+        
+        # LRU загруженных чанков: (cx, cy) -> Surface или None для пустых
+        self.chunks = OrderedDict()
+        self.chunks_baked = 0
+        
+        if not os.path.exists(os.path.join(self.chunk_dir, "chunks.json")):
+            self.cut_chunks()
+        
+        print(f"✅ Карта {self.width}x{self.height} тайлов, {layer_count} слоев, "
+              f"{self.chunks_x * self.chunks_y} чанков")
+    
+    def get_size(self):
+        """Размер карты в пикселях"""
+        return (self.pixel_width, self.pixel_height)
+    
+    def get_tile(self, layer, x, y):
+        """ID тайла в слое (0 - пусто)"""
+        if 0 <= x < self.width and 0 <= y < self.height and 0 <= layer < len(self.tiles):
+            return int(self.tiles[layer, y, x])
+        return 0
+    
+    def chunk_tiles_rect(self, cx, cy):
+        """Тайлы чанка: (tx, ty, ширина, высота)"""
+        tx, ty = cx * self.chunk_tiles, cy * self.chunk_tiles
+        return tx, ty, min(self.chunk_tiles, self.width - tx), min(self.chunk_tiles, self.height - ty)
+    
+    def is_empty_chunk(self, cx, cy):
+        tx, ty, tiles_w, tiles_h = self.chunk_tiles_rect(cx, cy)
+        return not self.occupied[ty:ty + tiles_h, tx:tx + tiles_w].any()
+    
+    def chunk_path(self, cx, cy):
+        return os.path.join(self.chunk_dir, f"{cx}_{cy}.bmp")
+    
+    def cut_chunks(self):
+        """
+        Нарезать картинку карты на чанки в размере мира и сохранить на диск.
+        Исходник (6144x3072, ~75 МБ) живет только внутри этого метода
+        """
+        source = get_asset_cache().load_image(self.image_path, alpha=False)
+        if source is None:
+            raise FileNotFoundError(self.image_path)
+        src = source.get_width() // self.width
+        
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        for cy in range(self.chunks_y):
+            for cx in range(self.chunks_x):
+                if self.is_empty_chunk(cx, cy):
+                    continue
+                tx, ty, tiles_w, tiles_h = self.chunk_tiles_rect(cx, cy)
+                source_rect = pygame.Rect(tx * src, ty * src, tiles_w * src, tiles_h * src)
+                region = source.subsurface(source_rect.clip(source.get_rect()))
+                
+                size = (tiles_w * self.tile_size, tiles_h * self.tile_size)
+                chunk = region if region.get_size() == size else pygame.transform.smoothscale(region, size)
+                pygame.image.save(chunk, self.chunk_path(cx, cy))
+        
+        # Индекс последним: без него нарезка не считается готовой
+        with open(os.path.join(self.chunk_dir, "chunks.json"), "w", encoding="utf-8") as f:
+            json.dump({"width": self.width, "height": self.height, "chunks": [self.chunks_x, self.chunks_y]}, f)
+        print(f"🗺️ Карта нарезана на чанки: {self.chunk_dir}")
+    
+    def bake_chunk(self, cx, cy):
+        """Загрузить один чанк с диска (если файла нет - нарезать карту заново)"""
+        if self.is_empty_chunk(cx, cy):
+            return None
+        
+        path = self.chunk_path(cx, cy)
+        if not os.path.exists(path):
+            self.cut_chunks()
+        chunk = get_asset_cache().load_image(path, alpha=False)
+        self.chunks_baked += 1
+        return chunk
+    
+    def get_chunk(self, cx, cy):
+        """Получить чанк из LRU, при промахе - запечь"""
+        key = (cx, cy)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+        
+        chunk = self.bake_chunk(cx, cy)
+        self.chunks[key] = chunk
+        if len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+        return chunk
+    
+    def draw(self, screen, camera_offset):
+        """Нарисовать только чанки, которые пересекают экран"""
+        view_w, view_h = screen.get_size()
+        cam_x, cam_y = int(camera_offset[0]), int(camera_offset[1])
+        
+        first_cx = max(0, cam_x // self.chunk_size)
+        first_cy = max(0, cam_y // self.chunk_size)
+        last_cx = min(self.chunks_x - 1, (cam_x + view_w - 1) // self.chunk_size)
+        last_cy = min(self.chunks_y - 1, (cam_y + view_h - 1) // self.chunk_size)
+        
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                chunk = self.get_chunk(cx, cy)
+                if chunk:
+                    screen.blit(chunk, (cx * self.chunk_size - cam_x, cy * self.chunk_size - cam_y))
+
+def chunk_directory(image_path, tile_size=TILE_SIZE, chunk_tiles=16):
+    """Папка нарезки: ключ - хэш содержимого картинки и размеры чанка"""
+    baker = get_asset_baker()
+    digest = baker.source_hash(image_path)[:16]
+    baker.save_manifest()
+    return os.path.join(BAKE_PATH, f"tilemap_{digest}_{chunk_tiles}x{tile_size}")
+
+def chunks_ready(image_path, tile_size=TILE_SIZE, chunk_tiles=16):
+    """Карта уже нарезана (исходник при старте не нужен)"""
+    return os.path.exists(os.path.join(chunk_directory(image_path, tile_size, chunk_tiles), "chunks.json"))
@@ -1,9 +1,12 @@
 import pygame
 from settings import *
-from sprite_loader import get_sprite_loader
-from PIL import Image
+from sprite_loader import get_sprite_loader, get_asset_cache
 import os
 from sound_manager import get_sound_manager
+from text_cache import get_text_cache
+from text_layout import get_layout_cache
+from gif_background import AnimatedBackground
+from retained import RetainedSurface
 
 class UI:
     def __init__(self):
@@ -25,9 +28,14 @@ class UI:
         self.typing_time = 0
         self.typing_index = 0
         self.typing_active = False
+        self.dialogue_surface = None  # Semi-transparent dialogue box, created once
         
         # Quest journal
         self.journal_open = False
+        self.journal_widget = None
+        
+        # HUD user counter and progress bar (retained)
+        self.hud_widget = RetainedSurface((250, 60), self.render_hud_progress)
         
         # Remove GIF background - use simple dark background instead
         # self.journal_gif_frames = []
@@ -36,12 +44,8 @@ class UI:
         # self.journal_last_frame_time = 0
         # self.load_journal_gif_background()
         
-        # GIF background for quest dialogues
-        self.quest_gif_frames = []
-        self.quest_current_frame = 0
-        self.quest_frame_delay = 0.1
-        self.quest_last_frame_time = 0
-        self.load_quest_gif_background()
+        # GIF background for quest dialogues (decoded lazily, shared with minigames)
+        self.quest_gif_background = AnimatedBackground(MINIGAME_GIF_PATH, (SCREEN_WIDTH - 100, 150), overlay_alpha=100)
         
     def load_journal_gif_background(self):
         """Load GIF background for quest journal"""
@@ -53,77 +57,24 @@ class UI:
         # Removed - no longer using GIF background
         pass
     
-    def load_quest_gif_background(self):
-        """Load GIF background for quest dialogues"""
-        try:
-            gif_path = "tumblr_owi25v6uAo1r4gsiio1_1280_gif (1000×300).gif"
-            print(f"🔍 Ищем GIF файл для квестов: {gif_path}")
-            if os.path.exists(gif_path):
-                print(f"✅ Файл найден для квестов: {gif_path}")
-                # Open GIF with PIL
-                gif = Image.open(gif_path)
-                
-                # Extract frames
-                frame_count = getattr(gif, 'n_frames', 1)
-                print(f"📊 Количество кадров в GIF для квестов: {frame_count}")
-                for frame in range(frame_count):
-                    gif.seek(frame)
-                    # Convert PIL image to pygame surface
-                    frame_surface = pygame.image.fromstring(gif.convert('RGBA').tobytes(), gif.size, 'RGBA')
-                    
-                    # Scale to fit dialogue box size
-                    frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH - 100, 150))
-                    
-                    # Add dark overlay for better text visibility
-                    overlay = pygame.Surface((SCREEN_WIDTH - 100, 150))
-                    overlay.set_alpha(100)
-                    overlay.fill((0, 0, 0))
-                    frame_surface.blit(overlay, (0, 0))
-                    
-                    self.quest_gif_frames.append(frame_surface)
-                
-                print(f"✅ Загружено {len(self.quest_gif_frames)} кадров GIF-фона для квестов")
-            else:
-                print(f"⚠️ GIF файл не найден для квестов: {gif_path}")
-        except Exception as e:
-            print(f"❌ Ошибка загрузки GIF для квестов: {e}")
-    
     def update_quest_gif_background(self, dt):
         """Update quest GIF animation"""
-        if self.quest_gif_frames:
-            self.quest_last_frame_time += dt
-            if self.quest_last_frame_time >= self.quest_frame_delay:
-                self.quest_current_frame = (self.quest_current_frame + 1) % len(self.quest_gif_frames)
-                self.quest_last_frame_time = 0
+        self.quest_gif_background.update(dt)
     
     def display_hud(self, screen, player):
-        """Display HUD with user count and current quest"""
-        # User counter (top-left)
-        user_text = f"Пользователи: {player.current_users}/{TARGET_USERS}"
-        user_surface = self.font_medium.render(user_text, True, WHITE)
-        screen.blit(user_surface, (10, 10))
-        
-        # Progress bar
-        progress_width = 200
-        progress_height = 20
-        progress_rect = pygame.Rect(10, 40, progress_width, progress_height)
-        pygame.draw.rect(screen, GRAY, progress_rect)
-        
-        # Fill progress bar
-        progress = player.current_users / TARGET_USERS
-        fill_width = int(progress_width * progress)
-        fill_rect = pygame.Rect(10, 40, fill_width, progress_height)
-        pygame.draw.rect(screen, GREEN, fill_rect)
+        """Display HUD with user count and current quest. Returns the screen areas it covers"""
+        # User counter and progress bar (top-left), redrawn only when users change
+        areas = [self.hud_widget.draw(screen, (10, 10), player.current_users, player)]
         
         # Current quest (top-right)
         if player.quest_log:
             current_quest = player.quest_log[0] if player.quest_log else None
             if current_quest:
                 quest_text = f"Текущий квест: {current_quest}"
-                quest_surface = self.font_small.render(quest_text, True, WHITE)
+                quest_surface = get_text_cache().render(quest_text, self.font_small, WHITE)
                 quest_rect = quest_surface.get_rect()
                 quest_rect.topright = (SCREEN_WIDTH - 10, 10)
-                screen.blit(quest_surface, quest_rect)
+                areas.append(screen.blit(quest_surface, quest_rect))
         
         # Controls hint
         # controls_text = "WASD - движение, E - взаимодействие, Q - журнал"
@@ -131,6 +82,26 @@ class UI:
         # controls_rect = controls_surface.get_rect()
         # controls_rect.bottomleft = (10, SCREEN_HEIGHT - 10)
         # screen.blit(controls_surface, controls_rect)
+        return areas
+    
+    def render_hud_progress(self, screen, player):
+        """Render user counter and progress bar (HUD widget coordinates)"""
+        # User counter
+        user_text = f"Пользователи: {player.current_users}/{TARGET_USERS}"
+        user_surface = get_text_cache().render(user_text, self.font_medium, WHITE)
+        screen.blit(user_surface, (0, 0))
+        
+        # Progress bar
+        progress_width = 200
+        progress_height = 20
+        progress_rect = pygame.Rect(0, 30, progress_width, progress_height)
+        pygame.draw.rect(screen, GRAY, progress_rect)
+        
+        # Fill progress bar
+        progress = player.current_users / TARGET_USERS
+        fill_width = int(progress_width * progress)
+        fill_rect = pygame.Rect(0, 30, fill_width, progress_height)
+        pygame.draw.rect(screen, GREEN, fill_rect)
     
     def start_dialogue(self, dialogue_lines, npc_name):
         """Start dialogue sequence"""
@@ -181,9 +152,10 @@ class UI:
         """Update typing animation"""
         if self.typing_active and self.dialogue_active:
             self.typing_time += dt
-            if self.typing_time >= self.typing_speed:
+            # Остаток времени переносится, поэтому скорость печати не зависит от шага
+            while self.typing_active and self.typing_time >= self.typing_speed:
                 self.typing_index += 1
-                self.typing_time = 0
+                self.typing_time -= self.typing_speed
                 
                 current_text = self.current_dialogue[self.dialogue_index]
                 if self.typing_index >= len(current_text):
@@ -191,9 +163,9 @@ class UI:
                     print(f"✅ Анимация текста завершена для: {current_text[:30]}...")
     
     def display_dialogue(self, screen):
-        """Display dialogue box"""
+        """Display dialogue box. Returns the screen areas it covers"""
         if not self.dialogue_active or not self.current_dialogue:
-            return
+            return []
             
         # Dialogue box
         box_height = 150
@@ -201,16 +173,18 @@ class UI:
                               SCREEN_WIDTH - 100, box_height)
         
         # Draw dialogue background - use only regular background for all dialogues
-        dialogue_surface = pygame.Surface((box_rect.width, box_rect.height))
-        dialogue_surface.set_alpha(230)
-        dialogue_surface.fill(DIALOGUE_BG_COLOR[:3])
-        screen.blit(dialogue_surface, box_rect.topleft)
+        if self.dialogue_surface is None:
+            self.dialogue_surface = pygame.Surface((box_rect.width, box_rect.height))
+            self.dialogue_surface.set_alpha(230)
+            self.dialogue_surface.fill(DIALOGUE_BG_COLOR[:3])
+        screen.blit(self.dialogue_surface, box_rect.topleft)
         
         # Draw border
         pygame.draw.rect(screen, UI_BORDER_COLOR, box_rect, 3)
+        areas = [box_rect]
         
         # NPC name and face
-        name_surface = self.font_medium.render(self.npc_name, True, YELLOW)
+        name_surface = get_text_cache().render(self.npc_name, self.font_medium, YELLOW)
         
         # Show mentor face if available
         mentor_face = self.sprite_loader.get_mentor_face(self.npc_name)
@@ -230,10 +204,9 @@ class UI:
             dialogue_text = self.current_dialogue[self.dialogue_index]
             
             # Apply typing animation - start with empty text
+            visible_chars = None
             if self.typing_active and self.typing_index < len(dialogue_text):
-                display_text = dialogue_text[:self.typing_index]
-            else:
-                display_text = dialogue_text
+                visible_chars = self.typing_index
             
             # Calculate text start position
             if mentor_face:
@@ -243,43 +216,21 @@ class UI:
                 text_start_x = box_rect.x + 20
                 text_start_y = box_rect.y + 50  # Below the name
             
-            # Word wrap dialogue text
-            words = display_text.split(' ')
-            lines = []
-            current_line = ""
-            
             # Calculate max width for text
             max_text_width = box_rect.width - (text_start_x - box_rect.x) - 40
             
-            for word in words:
-                test_line = current_line + word + " "
-                test_surface = self.font_medium.render(test_line, True, WHITE)  # Use medium font instead of small
-                if test_surface.get_width() > max_text_width:
-                    if current_line:
-                        lines.append(current_line.strip())
-                        current_line = word + " "
-                    else:
-                        lines.append(word)
-                        current_line = ""
-                else:
-                    current_line = test_line
-            
-            if current_line:
-                lines.append(current_line.strip())
-            
-            # Display lines
-            y_offset = text_start_y
-            for line in lines:
-                line_surface = self.font_medium.render(line, True, WHITE)  # Use medium font instead of small
-                screen.blit(line_surface, (text_start_x, y_offset))
-                y_offset += 30  # Increased line spacing
+            # Word wrap once per line, typing only clips the pre-rendered lines
+            layout = get_layout_cache().get_layout(dialogue_text, self.font_medium, WHITE, max_text_width, 30)
+            # Long monologues may run below the box
+            areas.append(layout.draw(screen, (text_start_x, text_start_y), visible_chars))
         
         # Continue indicator
         continue_text = "Нажмите E для продолжения..."
-        continue_surface = self.font_small.render(continue_text, True, GRAY)
+        continue_surface = get_text_cache().render(continue_text, self.font_small, GRAY)
         continue_rect = continue_surface.get_rect()
         continue_rect.bottomright = (box_rect.right - 20, box_rect.bottom - 10)
         screen.blit(continue_surface, continue_rect)
+        return areas
     
     def toggle_journal(self):
         """Toggle quest journal"""
@@ -291,9 +242,9 @@ class UI:
             sound_manager.play_button_click()
     
     def display_journal(self, screen, player, quest_manager):
-        """Display quest journal with beautiful design"""
+        """Display quest journal with beautiful design. Returns the screen area it covers"""
         if not self.journal_open:
-            return
+            return None
             
         # Journal background with simple dark background
         journal_width = 500
@@ -304,11 +255,19 @@ class UI:
             journal_width, journal_height
         )
         
+        # Retained: redrawn only when quests, inventory or users change
+        if self.journal_widget is None:
+            self.journal_widget = RetainedSurface(journal_rect.size, self.render_journal)
+        version = (player.version, quest_manager.version, player.current_users)
+        return self.journal_widget.draw(screen, journal_rect.topleft, version, player, quest_manager)
+    
+    def render_journal(self, screen, player, quest_manager):
+        """Render the journal into its own surface (journal coordinates)"""
+        journal_rect = screen.get_rect()
+        journal_width = journal_rect.width
+        
         # Simple dark background instead of GIF
-        journal_surface = pygame.Surface((journal_width, journal_height))
-        journal_surface.set_alpha(250)
-        journal_surface.fill((20, 30, 50))  # Dark blue background
-        screen.blit(journal_surface, journal_rect.topleft)
+        screen.fill((20, 30, 50, 250))  # Dark blue background
         
         # Beautiful border with glow effect
         border_color = (100, 150, 255)
@@ -366,7 +325,7 @@ class UI:
                     mentor_face = self.sprite_loader.get_mentor_face(mentor_name)
                     if mentor_face:
                         # Scale mentor face to fit in quest item
-                        scaled_face = pygame.transform.scale(mentor_face, (40, 40))
+                        scaled_face = get_asset_cache().get_scaled(("journal_face", mentor_name), mentor_face, (40, 40))
                         face_x = journal_rect.x + 25
                         face_y = quest_y
                         screen.blit(scaled_face, (face_x, face_y))
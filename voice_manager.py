@@ -0,0 +1,136 @@
+import pygame
+from game_clock import get_ticks
+
+# Группы каналов микшера: имя -> число каналов. Все каналы зарезервированы,
+# Sound.play() мимо менеджера их не займет
+CHANNEL_GROUPS = {
+    "ui": 2,
+    "footsteps": 1,
+    "sfx": 8,
+    "stingers": 1
+}
+
+DEFAULT_VOICE = {"group": "sfx", "priority": 1, "max_voices": 2, "cooldown": 0}
+
+# Правила для звуков: группа, приоритет (выше - важнее), сколько копий звучит
+# одновременно и минимальный интервал между запусками (мс игрового времени)
+SOUND_VOICES = {
+    "footstep": {"group": "footsteps", "priority": 0, "max_voices": 1},  # темп шагов задает Player
+    "typing": {"group": "ui", "priority": 0, "max_voices": 1, "cooldown": 40},
+    "button_click": {"group": "ui", "priority": 1, "max_voices": 1, "cooldown": 30},
+    "menu_select": {"group": "ui", "priority": 1, "max_voices": 1, "cooldown": 30},
+    "menu_confirm": {"group": "ui", "priority": 2, "max_voices": 1},
+    "interaction": {"group": "ui", "priority": 1, "max_voices": 1, "cooldown": 100},
+    "click": {"group": "sfx", "priority": 0, "max_voices": 2, "cooldown": 30},
+    "beat": {"group": "sfx", "priority": 1, "max_voices": 2},
+    "coin": {"group": "sfx", "priority": 2, "max_voices": 3, "cooldown": 50},
+    "reward": {"group": "sfx", "priority": 2, "max_voices": 2, "cooldown": 100},
+    "event": {"group": "sfx", "priority": 2, "max_voices": 1, "cooldown": 500},
+    "notification": {"group": "sfx", "priority": 2, "max_voices": 1, "cooldown": 200},
+    "success": {"group": "sfx", "priority": 2, "max_voices": 2, "cooldown": 50},
+    "error": {"group": "sfx", "priority": 2, "max_voices": 1, "cooldown": 100},
+    "quest_start": {"group": "sfx", "priority": 3, "max_voices": 1},
+    "quest_complete": {"group": "sfx", "priority": 3, "max_voices": 1},
+    "quest_fail": {"group": "sfx", "priority": 3, "max_voices": 1},
+    "achievement": {"group": "sfx", "priority": 3, "max_voices": 1, "cooldown": 200},
+    "level_up": {"group": "sfx", "priority": 3, "max_voices": 1},
+    "ambient_city": {"group": "sfx", "priority": 0, "max_voices": 1},
+    "ambient_office": {"group": "sfx", "priority": 0, "max_voices": 1},
+    "minigame_win": {"group": "stingers", "priority": 4, "max_voices": 1},
+    "minigame_lose": {"group": "stingers", "priority": 4, "max_voices": 1}
+}
+
+class Voice:
+    """Что сейчас играет на канале"""
+    __slots__ = ("channel", "name", "priority", "started")
+    
+    def __init__(self, channel):
+        self.channel = channel
+        self.name = None
+        self.priority = 0
+        self.started = 0
+    
+    def is_playing(self):
+        return self.name is not None and self.channel.get_busy()
+
+class VoiceManager:
+    """
+    Пул каналов микшера по группам (UI, шаги, эффекты, стингеры).
+    Звук запускается на свободном канале своей группы; если свободных нет,
+    вытесняется самый неважный (потом самый старый) голос с приоритетом не выше нового,
+    иначе звук отбрасывается. Лимит копий и cooldown - на каждый звук отдельно.
+    Так всплеск наград или достижений не забирает каналы у всего остального.
+    """
+    def __init__(self, groups=CHANNEL_GROUPS, voices=SOUND_VOICES):
+        self.rules = voices
+        total = sum(groups.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)
+        
+        self.groups = {}
+        index = 0
+        for group, count in groups.items():
+            self.groups[group] = [Voice(pygame.mixer.Channel(index + offset)) for offset in range(count)]
+            index += count
+        
+        self.last_played = {}  # имя -> время последнего запуска
+        self.stats = {"played": 0, "stolen": 0, "dropped": 0, "throttled": 0, "missing": 0}
+        self.missing = set()
+    
+    def get_rule(self, name):
+        return self.rules.get(name, DEFAULT_VOICE)
+    
+    def play(self, name, sound):
+        """Запустить звук по правилам; возвращает канал или None, если звук отброшен"""
+        rule = self.get_rule(name)
+        now = get_ticks()
+        
+        last = self.last_played.get(name)
+        if last is not None and 0 <= now - last < rule.get("cooldown", 0):
+            self.stats["throttled"] += 1
+            return None
+        
+        voices = self.groups.get(rule.get("group"), self.groups["sfx"])
+        priority = rule.get("priority", DEFAULT_VOICE["priority"])
+        
+        voice = None
+        same = [v for v in voices if v.name == name and v.is_playing()]
+        if len(same) >= rule.get("max_voices", DEFAULT_VOICE["max_voices"]):
+            # Лимит копий: перезапускаем самую старую
+            voice = min(same, key=lambda v: v.started)
+        else:
+            voice = next((v for v in voices if not v.is_playing()), None)
+            if voice is None:
+                candidates = [v for v in voices if v.priority <= priority]
+                if not candidates:
+                    self.stats["dropped"] += 1
+                    return None
+                voice = min(candidates, key=lambda v: (v.priority, v.started))
+                self.stats["stolen"] += 1
+        
+        voice.channel.play(sound)
+        voice.name = name
+        voice.priority = priority
+        voice.started = now
+        self.last_played[name] = now
+        self.stats["played"] += 1
+        return voice.channel
+    
+    def report_missing(self, name):
+        """Звука нет в банке: посчитать и сообщить один раз"""
+        self.stats["missing"] += 1
+        if name not in self.missing:
+            self.missing.add(name)
+            print(f"⚠️ Звук не найден: {name}")
+    
+    def stop_all(self):
+        for voices in self.groups.values():
+            for voice in voices:
+                voice.channel.stop()
+                voice.name = None
+    
+    def get_stats(self):
+        """Счетчики + сколько голосов звучит в каждой группе"""
+        stats = dict(self.stats)
+        stats["active"] = {group: sum(v.is_playing() for v in voices) for group, voices in self.groups.items()}
+        return stats